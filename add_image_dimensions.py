@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""
+Add width/height to every <img> in the site's HTML pages
+Images without explicit dimensions shift the layout when they load. This
+pass finds each <img> under public/, resolves its src to a file, reads
+just enough of the file's header to get its pixel size (PNG, JPEG, GIF,
+WebP and SVG, sniffed by content rather than extension) and injects
+width/height. Tags that the page's CSS (inline style, <style> blocks or
+linked local stylesheets) sizes in one dimension only are left unsized,
+since a fixed attribute for the other dimension would distort them.
+Images after the first --eager ones on a page are treated as below the
+fold and also get loading="lazy" and decoding="async". Existing
+attributes are never changed, so the pass is safe to rerun.
+Dimensions are cached per image path and mtime in
+.build-cache/image-dimensions.json.
+"""
+
+import argparse
+import functools
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from atomic_write import atomic_write
+from rewrite_rules import unified_diff
+
+SITE_ROOT = Path("public")
+CACHE_PATH = Path(".build-cache/image-dimensions.json")
+# Images per page assumed to be above the fold (the header logo, then the first content image)
+EAGER_IMAGES = 2
+SVG_HEADER_BYTES = 4096
+# Largest JPEG segment read while looking for the EXIF orientation
+EXIF_MAX_BYTES = 64 * 1024
+
+IMG_TAG = re.compile(rb"<img\b[^>]*>", re.IGNORECASE)
+ATTRIBUTE = re.compile(rb"""([^\s"'<>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+TAG_NAME = re.compile(rb"<[^\s/>]+")
+SVG_TAG = re.compile(rb"<svg\b[^>]*>", re.IGNORECASE)
+SVG_LENGTH = re.compile(rb"^\s*([0-9.]+)\s*(?:px)?\s*$")
+
+STYLE_BLOCK = re.compile(rb"<style\b[^>]*>(.*?)</style\s*>", re.IGNORECASE | re.DOTALL)
+LINK_TAG = re.compile(rb"<link\b[^>]*>", re.IGNORECASE)
+CSS_COMMENT = re.compile(rb"/\*.*?\*/", re.DOTALL)
+# Innermost "selectors { declarations }" blocks, so rules inside @media are found too
+CSS_RULE = re.compile(rb"([^{}]+)\{([^{}]*)\}")
+CSS_DECLARATION = re.compile(rb"([\w-]+)\s*:\s*([^;]+)")
+CSS_COMBINATOR = re.compile(rb"[\s>+~]+")
+CSS_COMPOUND = re.compile(rb"^([\w*-]*)((?:[.#][\w-]+|\[[^\]]*\])*)$")
+CSS_SIMPLE = re.compile(rb"""\.([\w-]+)|#([\w-]+)|\[\s*([\w-]+)\s*(?:=\s*["']?([^"'\]]*)["']?\s*)?\]""")
+# Properties that decide whether width/height attributes are safe on an image
+SIZE_PROPERTIES = (b"width", b"height", b"max-width")
+UNSET_VALUES = (b"auto", b"none", b"initial", b"unset", b"inherit")
+
+def png_size(f, head):
+    """Size from the PNG IHDR chunk"""
+
+    if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+        return struct.unpack(">II", head[16:24])
+    return None
+
+def gif_size(f, head):
+    """Size from the GIF logical screen descriptor"""
+
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", head[6:10])
+    return None
+
+def webp_size(f, head):
+    """Size from a lossy, lossless or extended WebP header"""
+
+    if head[:4] != b"RIFF" or head[8:12] != b"WEBP":
+        return None
+
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+    return None
+
+def exif_orientation(segment):
+    """The orientation tag (1-8) from an APP1 segment's payload, or 1"""
+
+    if segment[:6] != b"Exif\0\0":
+        return 1
+
+    tiff = segment[6:]
+    order = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+    if order is None or len(tiff) < 8:
+        return 1
+
+    offset = struct.unpack(order + "I", tiff[4:8])[0]
+    if offset + 2 > len(tiff):
+        return 1
+    count = struct.unpack(order + "H", tiff[offset:offset + 2])[0]
+    for entry in range(offset + 2, min(offset + 2 + count * 12, len(tiff) - 11), 12):
+        if struct.unpack(order + "H", tiff[entry:entry + 2])[0] == 0x0112:
+            return struct.unpack(order + "H", tiff[entry + 8:entry + 10])[0]
+    return 1
+
+def jpeg_size(f, head):
+    """Walk the JPEG's marker segments up to the frame header, seeking past everything else"""
+
+    if head[:2] != b"\xff\xd8":
+        return None
+
+    orientation = 1
+    f.seek(2)
+    while True:
+        if f.read(1) != b"\xff":
+            return None
+        code = f.read(1)
+        # Any number of 0xFF fill bytes may precede a marker code
+        while code == b"\xff":
+            code = f.read(1)
+        if not code:
+            return None
+
+        code = code[0]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+
+        # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            # Browsers lay out EXIF-rotated photos with their sides swapped
+            return (height, width) if orientation in (5, 6, 7, 8) else (width, height)
+
+        if code == 0xE1 and length - 2 <= EXIF_MAX_BYTES:
+            orientation = exif_orientation(f.read(length - 2))
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+
+def svg_size(f, head):
+    """Width/height attributes in px or unitless, else the viewBox size"""
+
+    if not head.lstrip().startswith(b"<"):
+        return None
+
+    f.seek(0)
+    match = SVG_TAG.search(f.read(SVG_HEADER_BYTES))
+    if match is None:
+        return None
+
+    attributes = tag_attributes(match.group(0))
+    width, height = (SVG_LENGTH.match(attributes.get(name, b"")) for name in (b"width", b"height"))
+    if width and height:
+        return round(float(width.group(1))), round(float(height.group(1)))
+
+    view_box = attributes.get(b"viewbox", b"").replace(b",", b" ").split()
+    if len(view_box) == 4:
+        try:
+            return round(float(view_box[2])), round(float(view_box[3]))
+        except ValueError:
+            return None
+    return None
+
+# Tried in order against the file's first bytes, so extensions that lie (JPEGs named .png) still work
+PROBES = (png_size, jpeg_size, gif_size, webp_size, svg_size)
+
+def image_size(path):
+    """(width, height) read from an image file's header, or None if unrecognised"""
+
+    with open(path, 'rb') as f:
+        head = f.read(32)
+        for probe in PROBES:
+            size = probe(f, head)
+            if size is not None:
+                return tuple(size) if all(size) else None
+    return None
+
+class DimensionCache:
+    """Image path -> size, valid while the file's mtime and size are unchanged"""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.entries = {}
+        self.dirty = False
+        self.probed = 0
+        self.hits = 0
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring unreadable dimension cache {self.path}: {e}")
+
+    def size(self, image_path):
+        """Cached or freshly read (width, height) for an existing image file, or None"""
+
+        stat = os.stat(image_path)
+        key = str(image_path)
+        entry = self.entries.get(key)
+        if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["bytes"] == stat.st_size:
+            with self._lock:
+                self.hits += 1
+            return tuple(entry["size"]) if entry["size"] else None
+
+        try:
+            size = image_size(image_path)
+        except (OSError, struct.error):
+            size = None
+        with self._lock:
+            self.entries[key] = {"mtime_ns": stat.st_mtime_ns, "bytes": stat.st_size,
+                                 "size": list(size) if size else None}
+            self.dirty = True
+            self.probed += 1
+        return size
+
+    def save(self):
+        """Write the cache back to disk if anything was probed"""
+
+        if not self.dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path, json.dumps(self.entries, indent=2, sort_keys=True))
+        self.dirty = False
+
+def tag_attributes(tag):
+    """Lower-cased attribute name -> raw value bytes (b"" for bare attributes) of one tag"""
+
+    attributes = {}
+    body = tag[TAG_NAME.match(tag).end():-1]
+    for match in ATTRIBUTE.finditer(body):
+        name = match.group(1).lower()
+        value = next((group for group in match.groups()[1:] if group is not None), b"")
+        attributes.setdefault(name, value)
+    return attributes
+
+def css_declarations(block):
+    """Lower-cased size property -> value from a CSS declaration block or style attribute"""
+
+    declarations = {}
+    for name, value in CSS_DECLARATION.findall(block):
+        name = name.lower()
+        if name in SIZE_PROPERTIES:
+            declarations[name] = value.split(b"!")[0].strip().lower()
+    return declarations
+
+def css_rules(css):
+    """(selector, size declarations, conditional) for every rule in a stylesheet that sizes something
+
+    conditional rules sit inside an at-rule such as @media, so they may not apply.
+    """
+
+    css = CSS_COMMENT.sub(b"", css)
+    rules = []
+    depth = position = 0
+    for match in CSS_RULE.finditer(css):
+        # Braces between the previous rule and this one open or close at-rule blocks
+        between = css[position:match.start()]
+        depth = max(0, depth + between.count(b"{") - between.count(b"}"))
+        position = match.end()
+
+        declarations = css_declarations(match.group(2))
+        if not declarations:
+            continue
+        # Drop statements such as @import that precede the first rule
+        for selector in match.group(1).rsplit(b";", 1)[-1].split(b","):
+            if selector.strip():
+                rules.append((selector.strip(), declarations, depth > 0))
+    return rules
+
+@functools.lru_cache(maxsize=256)
+def stylesheet_rules(path, mtime_ns):
+    """Parsed rules of a local stylesheet, cached per path and mtime"""
+
+    return css_rules(Path(path).read_bytes())
+
+def page_css_rules(content, html_file, root):
+    """Size-setting rules from a page's <style> blocks and linked local stylesheets"""
+
+    rules = []
+    for css in STYLE_BLOCK.findall(content):
+        rules += css_rules(css)
+    for link in LINK_TAG.findall(content):
+        attributes = tag_attributes(link)
+        if b"stylesheet" not in attributes.get(b"rel", b"").lower().split():
+            continue
+        path = resolve_src(attributes.get(b"href", b""), html_file, root)
+        if path is not None and path.is_file():
+            rules += stylesheet_rules(str(path), path.stat().st_mtime_ns)
+    return rules
+
+def selector_matches(selector, attributes):
+    """Whether a selector's last compound matches an <img> with these attributes
+
+    Ancestor parts are ignored, so this errs towards matching; selectors
+    with pseudo-classes never match.
+    """
+
+    compound = CSS_COMBINATOR.split(selector)[-1]
+    match = CSS_COMPOUND.match(compound)
+    if match is None or match.group(1).lower() not in (b"", b"img", b"*"):
+        return False
+
+    classes = attributes.get(b"class", b"").split()
+    for class_name, element_id, name, value in CSS_SIMPLE.findall(match.group(2)):
+        if class_name and class_name not in classes:
+            return False
+        if element_id and attributes.get(b"id") != element_id:
+            return False
+        if name and (name.lower() not in attributes or (value and attributes[name.lower()] != value)):
+            return False
+    return True
+
+def one_sided(declarations):
+    """The dimension a declaration block leaves to the attributes while fixing the other, or None"""
+
+    def fixed(name):
+        return name in declarations and declarations[name] not in UNSET_VALUES
+
+    if fixed(b"height") and b"width" not in declarations:
+        return b"width"
+    if (fixed(b"width") or fixed(b"max-width")) and b"height" not in declarations:
+        return b"height"
+    return None
+
+def sized_one_way(attributes, rules):
+    """True when CSS may fix an image's size in one dimension only
+
+    A width/height attribute pair would then fix the other dimension at
+    the image's intrinsic size and distort it (height: 60px with no width
+    renders the full intrinsic width). Any rule that might apply can fix a
+    dimension, but only the style attribute and unconditional rules whose
+    selector is the image itself (img.logo, .logo-img) count as surely
+    setting the other one.
+    """
+
+    inline = css_declarations(attributes.get(b"style", b""))
+    possible = [inline]
+    certain = set(inline)
+    for selector, declarations, conditional in rules:
+        if selector_matches(selector, attributes):
+            possible.append(declarations)
+            if not conditional and CSS_COMBINATOR.search(selector) is None:
+                certain.update(declarations)
+
+    return any(missing is not None and missing not in certain
+               for missing in map(one_sided, possible))
+
+def resolve_src(src, html_file, root):
+    """Local file an <img src> points at, or None for remote, inline and templated sources"""
+
+    src = src.decode("utf-8", "replace").strip()
+    parts = urlsplit(src)
+    if not src or parts.scheme or parts.netloc or "{" in src or "$" in src:
+        return None
+
+    path = unquote(parts.path)
+    if path.startswith("/"):
+        # Root-relative: pages link both /public/images/... and /images/...
+        relative = Path(path.lstrip("/"))
+        candidates = [relative, Path(root) / relative]
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+        # Neither exists: report the candidate the link was written against, not public/public/...
+        return candidates[0] if relative.is_relative_to(root) else candidates[1]
+
+    return Path(os.path.normpath(Path(html_file).parent / path))
+
+def add_attributes(tag, additions):
+    """Insert attributes just before a tag's closing > (or />)"""
+
+    end = len(tag) - 1
+    if tag[end - 1:end] == b"/":
+        end -= 1
+    head = tag[:end].rstrip()
+    return head + b"".join(b' %s="%s"' % (name, value) for name, value in additions) + tag[len(head):]
+
+def add_dimensions(content, html_file, root, cache, eager=EAGER_IMAGES):
+    """Return (new content, counts, missing image paths) for one page's bytes"""
+
+    counts = {"images": 0, "sized": 0, "lazy": 0, "already_sized": 0, "one_way": 0, "unresolved": 0}
+    missing = []
+    rules = page_css_rules(content, html_file, root)
+
+    def rewrite(match):
+        tag = match.group(0)
+        counts["images"] += 1
+        attributes = tag_attributes(tag)
+        additions = []
+
+        if b"width" in attributes or b"height" in attributes:
+            counts["already_sized"] += 1
+        elif sized_one_way(attributes, rules):
+            counts["one_way"] += 1
+        else:
+            image_path = resolve_src(attributes.get(b"src", b""), html_file, root)
+            size = None
+            if image_path is not None and image_path.is_file():
+                size = cache.size(image_path)
+            elif image_path is not None:
+                missing.append(str(image_path))
+            if size is None:
+                counts["unresolved"] += 1
+            else:
+                additions += [(b"width", str(size[0]).encode()), (b"height", str(size[1]).encode())]
+                counts["sized"] += 1
+
+        if counts["images"] > eager:
+            if b"loading" not in attributes:
+                additions.append((b"loading", b"lazy"))
+                counts["lazy"] += 1
+            if b"decoding" not in attributes:
+                additions.append((b"decoding", b"async"))
+
+        return add_attributes(tag, additions) if additions else tag
+
+    return IMG_TAG.sub(rewrite, content), counts, missing
+
+def html_files(root=SITE_ROOT):
+    """Every HTML page under the site root, skipping node_modules"""
+
+    return sorted(path for path in Path(root).rglob("*.html")
+                  if path.is_file() and "node_modules" not in path.parts)
+
+def process_file(html_file, root, cache, eager=EAGER_IMAGES, dry_run=False, diff=False):
+    """Add dimensions to one page with a single read and at most one write"""
+
+    result = {"path": str(html_file), "changed": False, "counts": {}, "missing": [], "error": None,
+              "bytes_delta": 0}
+
+    with open(html_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return result
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Pages without images are rejected without being copied out of the map
+            if data.find(b"<img") == -1 and data.find(b"<IMG") == -1:
+                return result
+            original = data[:]
+
+    content, result["counts"], result["missing"] = add_dimensions(original, html_file, root, cache, eager)
+    if content != original:
+        result["changed"] = True
+        result["bytes_delta"] = len(content) - len(original)
+        if diff:
+            result["diff"] = unified_diff(html_file, original.decode("utf-8", "replace"),
+                                          content.decode("utf-8", "replace"))
+        if not dry_run:
+            atomic_write(html_file, content)
+
+    return result
+
+def run_dimensions(root=SITE_ROOT, cache=None, eager=EAGER_IMAGES, dry_run=False, diff=False, jobs=1):
+    """Process every page under root across a thread pool, returning per-file results in order"""
+
+    cache = cache or DimensionCache()
+
+    def process(html_file):
+        try:
+            return process_file(html_file, root, cache, eager, dry_run, diff)
+        except Exception as e:
+            return {"path": str(html_file), "changed": False, "counts": {}, "missing": [],
+                    "error": f"{type(e).__name__}: {e}"}
+
+    files = html_files(root)
+    if jobs <= 1 or len(files) <= 1:
+        results = [process(html_file) for html_file in files]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(process, files))
+
+    cache.save()
+    return results
+
+def print_dimension_report(results, cache, dry_run=False):
+    """Print per-file changes and totals; returns True if no file failed"""
+
+    for result in results:
+        if result["error"]:
+            print(f"❌ Error processing {result['path']}: {result['error']}")
+        elif result["changed"]:
+            counts = result["counts"]
+            verb = "Would update" if dry_run else "Updated"
+            print(f"✅ {verb} {result['path']} ({counts['sized']} sized, {counts['lazy']} lazy; "
+                  f"{result['bytes_delta']:+,} bytes)")
+            if result.get("diff"):
+                print(result["diff"], end="" if result["diff"].endswith("\n") else "\n")
+
+    totals = {}
+    for result in results:
+        for name, count in result["counts"].items():
+            totals[name] = totals.get(name, 0) + count
+    missing = sorted({path for result in results for path in result["missing"]})
+
+    print("=" * 60)
+    print(f"🖼️  {totals.get('images', 0)} <img> tag(s): {totals.get('sized', 0)} given width/height, "
+          f"{totals.get('already_sized', 0)} already sized, {totals.get('unresolved', 0)} unresolved")
+    print(f"↔️  {totals.get('one_way', 0)} left unsized because CSS sets only one of their dimensions")
+    print(f"💤 {totals.get('lazy', 0)} below-the-fold image(s) given loading=\"lazy\"")
+    print(f"📐 {cache.probed} image header(s) read, {cache.hits} from cache")
+    for path in missing[:20]:
+        print(f"⚠️  Missing image: {path}")
+    if len(missing) > 20:
+        print(f"   … and {len(missing) - 20} more")
+
+    changed = sum(1 for result in results if result["changed"])
+    errors = sum(1 for result in results if result["error"])
+    action = "would update" if dry_run else "updated"
+    print(f"📄 Files scanned: {len(results)}, {action}: {changed}, errors: {errors}"
+          + (" (dry run, nothing written)" if dry_run else ""))
+    return not errors
+
+def main():
+    """Add image dimensions across the site"""
+
+    parser = argparse.ArgumentParser(description="Add width/height (and lazy loading below the fold) to <img> tags")
+    parser.add_argument("--root", type=Path, default=SITE_ROOT, help=f"site root to scan (default: {SITE_ROOT})")
+    parser.add_argument("--eager", type=int, default=EAGER_IMAGES,
+                        help=f"images per page treated as above the fold (default: {EAGER_IMAGES})")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report which files would change without writing anything")
+    parser.add_argument("--diff", action="store_true", help="print a unified diff of every change")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="threads to scan files with (default: all cores)")
+    args = parser.parse_args()
+
+    if not args.root.exists():
+        print(f"❌ Directory not found: {args.root}")
+        return
+
+    print(f"📐 Adding image dimensions in {args.root}")
+    print("=" * 60)
+
+    cache = DimensionCache()
+    results = run_dimensions(args.root, cache, args.eager, args.dry_run, args.diff, args.jobs)
+    if not print_dimension_report(results, cache, args.dry_run):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
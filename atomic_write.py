@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Atomic, skip-if-identical file writes shared by every generator and fixer
+Content is compared against the existing file (size first, then a hash)
+and identical writes are skipped, so unchanged outputs keep their mtime.
+Real writes go to a temporary file in the same directory and are moved
+into place with os.replace, so a crash never leaves a truncated file.
+"""
+
+import hashlib
+import os
+import secrets
+from pathlib import Path
+
+READ_CHUNK = 1024 * 1024
+
+def file_digest(path):
+    """sha256 of a file's bytes, read in chunks"""
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+def has_content(path, size, digest):
+    """True when path already holds exactly size bytes hashing to digest"""
+
+    try:
+        if os.stat(path).st_size != size:
+            return False
+        return file_digest(path) == digest
+    except FileNotFoundError:
+        return False
+
+def _replace(tmp_path, path):
+    """Move a finished temp file over path, keeping the target's permissions"""
+
+    try:
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+    except FileNotFoundError:
+        # A new file keeps the mode it was created with: 0o666 less the umask
+        pass
+    os.replace(tmp_path, path)
+
+def _temp_file(path):
+    """A new temp file next to path, created like any other file so the umask applies"""
+
+    path = Path(path)
+    while True:
+        tmp_path = path.parent / f".{path.name}.{secrets.token_hex(6)}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+        except FileExistsError:
+            continue
+        return os.fdopen(fd, 'wb'), str(tmp_path)
+
+def atomic_write(path, content, encoding="utf-8"):
+    """Write str or bytes to path unless it already holds them; True if the file was written"""
+
+    data = content.encode(encoding) if isinstance(content, str) else bytes(content)
+    if has_content(path, len(data), hashlib.sha256(data).digest()):
+        return False
+
+    f, tmp_path = _temp_file(path)
+    try:
+        with f:
+            f.write(data)
+        _replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    return True
+
+class AtomicFile:
+    """Text file written in pieces, installed atomically on close unless identical
+
+    with AtomicFile(path) as f:
+        f.write(...)
+    f.written then tells whether the target changed.
+    """
+
+    def __init__(self, path, encoding="utf-8"):
+        self.path = Path(path)
+        self.encoding = encoding
+        self.written = False
+        self._file = None
+        self._tmp_path = None
+        self._digest = hashlib.sha256()
+        self._size = 0
+
+    def __enter__(self):
+        self._file, self._tmp_path = _temp_file(self.path)
+        return self
+
+    def write(self, text):
+        data = text.encode(self.encoding)
+        self._digest.update(data)
+        self._size += len(data)
+        self._file.write(data)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+
+        if exc_type is None and not has_content(self.path, self._size, self._digest.digest()):
+            try:
+                _replace(self._tmp_path, self.path)
+            except BaseException:
+                os.unlink(self._tmp_path)
+                raise
+            self.written = True
+        else:
+            os.unlink(self._tmp_path)
+
+        return False
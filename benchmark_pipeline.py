@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for the checklist generation pipeline
+Synthesizes catalogs in the get_checklist_data() shape, then times the
+load, render, write and rewrite phases separately and records each
+phase's peak traced memory. Results are written to JSON so runs on
+different commits can be compared with --compare.
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import checklist_loader
+import qr_code
+from checklist_build import write_document
+from checklist_loader import load_checklists
+from checklist_template import PDF_LAYOUT, render_checklist
+from generate_pdfs import get_checklist_data
+from rewrite_rules import load_rules, run_rewrites
+
+PHASES = ("load", "render", "write", "rewrite")
+OUTPUT_DIR = Path("public/checklists/assets/pdfs")
+
+def make_catalog(item_count, templates):
+    """Clone the real checklists into a catalog holding item_count items in total"""
+
+    catalog = []
+    remaining = item_count
+
+    while remaining > 0:
+        template = templates[len(catalog) % len(templates)]
+        sections = []
+        for section in template["sections"]:
+            items = section["items"][:remaining]
+            remaining -= len(items)
+            if items:
+                sections.append({"title": section["title"], "items": items})
+            if remaining == 0:
+                break
+
+        catalog.append({**template, "filename": f"{template['filename']}-{len(catalog) + 1}",
+                        "sections": sections})
+
+    return catalog
+
+def run_pipeline(catalog, workdir):
+    """Run each phase once over a fresh work directory, yielding (phase, seconds, detail)"""
+
+    data_file = workdir / "catalog.json"
+    with open(data_file, 'w', encoding='utf-8') as f:
+        json.dump({"checklists": catalog}, f, ensure_ascii=False)
+
+    checklist_loader._cache.clear()
+    # Each run encodes its QR codes from scratch, into its own work directory
+    # rather than the repo's .build-cache, so render timings stay comparable
+    qr_code._svgs.clear()
+    cache_dir = qr_code.CACHE_DIR
+    qr_code.CACHE_DIR = workdir / cache_dir
+    try:
+        started = time.perf_counter()
+        checklists = load_checklists(data_file, collection="core")
+        yield "load", time.perf_counter() - started, {"checklists": len(checklists)}
+
+        started = time.perf_counter()
+        documents = [render_checklist(checklist, PDF_LAYOUT) for checklist in checklists]
+        yield "render", time.perf_counter() - started, {"bytes": sum(len(d.encode("utf-8")) for d in documents)}
+
+        output_dir = workdir / OUTPUT_DIR
+        output_dir.mkdir(parents=True)
+        started = time.perf_counter()
+        for checklist, document in zip(checklists, documents):
+            write_document(output_dir / f"{checklist['filename']}.html", document)
+        yield "write", time.perf_counter() - started, {"files": len(documents)}
+
+        del documents
+        started = time.perf_counter()
+        results = run_rewrites(load_rules(), root=workdir)
+        yield "rewrite", time.perf_counter() - started, {"files": len(results),
+                                                         "changed": sum(r["changed"] for r in results)}
+    finally:
+        qr_code.CACHE_DIR = cache_dir
+
+def benchmark(item_count, templates):
+    """Time every phase, then repeat the pipeline under tracemalloc for per-phase peaks"""
+
+    catalog = make_catalog(item_count, templates)
+    phases = {}
+
+    # Timings come from an untraced run; tracemalloc would inflate them
+    with tempfile.TemporaryDirectory(prefix="checklist-bench-") as workdir:
+        for phase, seconds, detail in run_pipeline(catalog, Path(workdir)):
+            phases[phase] = {"seconds": round(seconds, 6), **detail}
+
+    with tempfile.TemporaryDirectory(prefix="checklist-bench-") as workdir:
+        tracemalloc.start()
+        try:
+            for phase, _, _ in run_pipeline(catalog, Path(workdir)):
+                phases[phase]["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.reset_peak()
+        finally:
+            tracemalloc.stop()
+
+    return {"items": item_count, "checklists": len(catalog), "phases": phases}
+
+def current_commit():
+    """Short hash of HEAD, or None outside a git checkout"""
+
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=Path(__file__).resolve().parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_comparison(results, baseline_path):
+    """Print per-phase time ratios against an earlier results file"""
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    before = {entry["items"]: entry["phases"] for entry in baseline["results"]}
+
+    print(f"\n📈 Compared with {baseline_path} ({baseline.get('commit') or 'unknown commit'})")
+    print(f"{'items':>10} " + " ".join(f"{phase:>10}" for phase in PHASES))
+    for entry in results:
+        old = before.get(entry["items"])
+        if old is None:
+            continue
+        ratios = []
+        for phase in PHASES:
+            old_seconds = old.get(phase, {}).get("seconds")
+            new_seconds = entry["phases"][phase]["seconds"]
+            ratios.append(f"{new_seconds / old_seconds:>9.2f}x" if old_seconds else f"{'-':>10}")
+        print(f"{entry['items']:>10} " + " ".join(ratios))
+
+def main():
+    """Run the pipeline benchmark and write the results file"""
+
+    parser = argparse.ArgumentParser(description="Benchmark checklist load/render/write/rewrite phases")
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 1000, 100000],
+                        help="total checklist items per synthetic catalog (default: 10 1000 100000)")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"),
+                        help="where to write the JSON results")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    templates = get_checklist_data()
+    results = []
+
+    print("⏱️  Checklist pipeline benchmark (seconds, peak traced MB)")
+    print("=" * 60)
+    print(f"{'items':>10} {'lists':>7} " + " ".join(f"{phase:>10}" for phase in PHASES) + f" {'peak MB':>8}")
+
+    for item_count in args.items:
+        entry = benchmark(item_count, templates)
+        results.append(entry)
+        phases = entry["phases"]
+        peak = max(phase["peak_bytes"] for phase in phases.values()) / (1024 * 1024)
+        print(f"{item_count:>10} {entry['checklists']:>7} "
+              + " ".join(f"{phases[phase]['seconds']:>10.3f}" for phase in PHASES) + f" {peak:>8.1f}")
+
+    print("=" * 60)
+
+    report = {
+        "commit": current_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "results": results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Results written to {args.output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+if __name__ == "__main__":
+    main()
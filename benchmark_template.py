@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for checklist template rendering
+Compares the old per-item string concatenation against the shared
+pre-compiled template engine, reported as render time per 1k items
+"""
+
+import argparse
+import tempfile
+import timeit
+from pathlib import Path
+
+import qr_code
+
+from checklist_template import COMPACT_LAYOUT, render_checklist, variant_context
+
+def make_checklist(item_count, items_per_section=10):
+    """Build a synthetic checklist with the given number of items"""
+
+    sections = []
+    for start in range(0, item_count, items_per_section):
+        count = min(items_per_section, item_count - start)
+        sections.append({
+            "title": f"SECTION {len(sections) + 1}",
+            "items": [
+                {
+                    "title": f"📋 Item {start + i + 1}",
+                    "description": "Document damage and contact your insurance company before moving anything.",
+                    "priority": "priority-medium"
+                }
+                for i in range(count)
+            ]
+        })
+
+    return {
+        "filename": f"benchmark-{item_count}",
+        "title": "Benchmark Checklist",
+        "subtitle": "Synthetic checklist for render timing",
+        "icon": "⏱️",
+        "color": "#d32f2f",
+        "color_dark": "#b71c1c",
+        "sections": sections
+    }
+
+def legacy_render(data):
+    """Render the way create_checklist_html did before the shared engine"""
+
+    # Header and footer fields (region, lead line, QR code) as the engine supplies them
+    context = variant_context(data)
+
+    template = COMPACT_LAYOUT.head.render(data)
+    template += COMPACT_LAYOUT.header.render(context)
+    template += COMPACT_LAYOUT.intro.render(data)
+
+    for section in data["sections"]:
+        template += f'''
+        <div class="checklist-section">
+            <div class="section-title">{section["title"]}</div>'''
+
+        for item in section["items"]:
+            template += f'''
+            <div class="checklist-item {item["priority"]}">
+                <div class="checkbox"></div>
+                <div class="item-content">
+                    <div class="item-title">{item["title"]}</div>
+                    <div class="item-description">{item["description"]}</div>
+                </div>
+            </div>'''
+
+        template += '''
+        </div>'''
+
+    template += COMPACT_LAYOUT.footer.render(context)
+
+    return template
+
+def time_per_thousand(func, data, item_count, repeat):
+    """Best-of-N render time in milliseconds per 1k items"""
+
+    best = min(timeit.repeat(lambda: func(data), number=1, repeat=repeat))
+    return best * 1000 * 1000 / item_count
+
+def run_benchmark(item_counts, repeat):
+    """Print the concat vs compiled timings for each checklist size"""
+
+    print("⏱️  Checklist template render benchmark (ms per 1k items)")
+    print("=" * 60)
+    print(f"{'items':>10} {'concat':>12} {'compiled':>12} {'speedup':>10}")
+
+    for item_count in item_counts:
+        data = make_checklist(item_count)
+
+        if legacy_render(data) != render_checklist(data):
+            raise SystemExit("❌ Compiled template output differs from legacy output")
+
+        before = time_per_thousand(legacy_render, data, item_count, repeat)
+        after = time_per_thousand(render_checklist, data, item_count, repeat)
+        print(f"{item_count:>10} {before:>12.3f} {after:>12.3f} {before / after:>9.2f}x")
+
+    print("=" * 60)
+
+def main():
+    """Run the template render benchmark"""
+
+    parser = argparse.ArgumentParser(description="Benchmark checklist template rendering")
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="checklist sizes to render (default: 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions per size")
+    args = parser.parse_args()
+
+    # The synthetic checklists' QR codes are cached in a throwaway directory, not the repo's .build-cache
+    cache_dir = qr_code.CACHE_DIR
+    with tempfile.TemporaryDirectory(prefix="template-bench-") as bench_cache_dir:
+        qr_code.CACHE_DIR = Path(bench_cache_dir)
+        try:
+            run_benchmark(args.items, args.repeat)
+        finally:
+            qr_code.CACHE_DIR = cache_dir
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Build manifest for incremental checklist generation
+Stores a content hash of each checklist's input data and template version
+so unchanged outputs are neither re-rendered nor rewritten
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from atomic_write import atomic_write
+
+MANIFEST_PATH = Path(".build-cache/checklist-manifest.json")
+MANIFEST_FORMAT = 1
+
+def checklist_hash(checklist, template_version, region=None):
+    """Hash a checklist's input dict (and region, if any) together with the template version"""
+
+    payload = json.dumps([checklist, region], sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256()
+    digest.update(template_version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+class BuildManifest:
+    """Output path -> input hash records persisted between builds"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = Path(path)
+        self.entries = {}
+        self.dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("format") == MANIFEST_FORMAT:
+                    self.entries = data.get("entries", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring unreadable build manifest {self.path}: {e}")
+
+    def is_current(self, output_path, digest):
+        """True when output_path exists and was built from the same inputs"""
+
+        entry = self.entries.get(str(output_path))
+        return entry is not None and entry["hash"] == digest and Path(output_path).exists()
+
+    def record(self, output_path, digest, size):
+        """Remember the inputs an output was built from"""
+
+        self.entries[str(output_path)] = {"hash": digest, "bytes": size}
+        self.dirty = True
+
+    def save(self):
+        """Write the manifest back to disk if anything changed"""
+
+        if not self.dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path, json.dumps({"format": MANIFEST_FORMAT, "entries": self.entries},
+                                           indent=2, sort_keys=True))
+        self.dirty = False
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the checklist generators
+Collects wall time per build phase and per output file (render, write,
+PDF, pre-compression), optionally runs cProfile over the parent process
+and writes a machine-readable JSON summary.
+"""
+
+import cProfile
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from atomic_write import atomic_write
+
+PROFILE_PATH = Path(".build-cache/build-profile.json")
+
+# Per-file timings reported by each stage, as (result key, profile phase)
+FILE_PHASES = {
+    "build": (("render_seconds", "render"), ("write_seconds", "write")),
+    "pdf": (("seconds", "pdf"),),
+    "precompress": (("seconds", "precompress"),),
+}
+
+def add_profile_arguments(parser):
+    """Add the --profile options to a generator's argument parser"""
+
+    parser.add_argument("--profile", nargs="?", type=Path, const=PROFILE_PATH, metavar="JSON",
+                        help=f"record per-phase and per-file timings (summary written to {PROFILE_PATH})")
+    parser.add_argument("--profile-stats", type=Path, metavar="PSTATS",
+                        help="also dump cProfile stats of the main process (use -j 1 to include rendering)")
+
+def selected_profiler(args):
+    """A BuildProfiler if --profile or --profile-stats was given, else None"""
+
+    if args.profile is None and args.profile_stats is None:
+        return None
+
+    return BuildProfiler(args.profile or PROFILE_PATH, args.profile_stats)
+
+class BuildProfiler:
+    """Phase and per-file timing collector"""
+
+    def __init__(self, path=PROFILE_PATH, stats_path=None):
+        self.path = Path(path)
+        self.stats_path = stats_path
+        self.phases = {}
+        self.files = {}
+        self._profile = cProfile.Profile() if stats_path else None
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a wall-clock phase, profiling it with cProfile if enabled"""
+
+        started = time.perf_counter()
+        if self._profile is not None:
+            self._profile.enable()
+        try:
+            yield
+        finally:
+            if self._profile is not None:
+                self._profile.disable()
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def record(self, stage, results):
+        """Fold one stage's result records into the per-file table"""
+
+        for result in results:
+            path = result["path"]
+            entry = self.files.setdefault(path, {"file": Path(path).name, "bytes": result["bytes"]})
+            if stage == "precompress":
+                entry["compressed_bytes"] = dict(result["compressed"])
+            elif "skipped" in result:
+                entry["skipped"] = result["skipped"]
+
+            for key, phase in FILE_PHASES[stage]:
+                if key in result:
+                    entry[f"{phase}_seconds"] = round(result[key], 6)
+
+    def summary(self):
+        """The machine-readable profile"""
+
+        totals = {}
+        for entry in self.files.values():
+            for key, value in entry.items():
+                if key.endswith("_seconds"):
+                    totals[key] = round(totals.get(key, 0.0) + value, 6)
+
+        return {
+            "total_seconds": round(time.perf_counter() - self._started, 6),
+            "phases": {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            "file_totals": totals,
+            "files": sorted(self.files.values(), key=file_seconds, reverse=True),
+        }
+
+    def finish(self, top=10):
+        """Print the slowest files, write the JSON summary and any pstats dump"""
+
+        summary = self.summary()
+
+        print("\n⏱️  Build profile")
+        print("=" * 60)
+        for name, seconds in summary["phases"].items():
+            print(f"{name:<20} {seconds * 1000:>10.1f} ms (wall)")
+        for key, seconds in summary["file_totals"].items():
+            print(f"{key[:-len('_seconds')] + ' (sum)':<20} {seconds * 1000:>10.1f} ms")
+
+        slowest = [entry for entry in summary["files"] if file_seconds(entry)][:top]
+        if slowest:
+            print(f"\n{'slowest files':<44} {'ms':>8} {'bytes':>10}")
+            for entry in slowest:
+                print(f"{entry['file'][:44]:<44} {file_seconds(entry) * 1000:>8.1f} {entry['bytes']:>10,}")
+        print("=" * 60)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path, json.dumps(summary, indent=2))
+        print(f"💾 Profile summary: {self.path}")
+
+        if self._profile is not None:
+            self._profile.dump_stats(self.stats_path)
+            print(f"💾 cProfile stats: {self.stats_path} (python -m pstats {self.stats_path})")
+
+        return summary
+
+def file_seconds(entry):
+    """Total recorded seconds for one file across all phases"""
+
+    return sum(value for key, value in entry.items() if key.endswith("_seconds"))
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Shared build pipeline for the checklist generators
+Renders and writes checklist HTML either serially or fanned out across
+a process pool, always reporting results in input order. Checklists whose
+inputs match the build manifest are skipped. With --regions each checklist
+is rendered once per region, sharing the body and changing only the
+header/footer contact details and QR code. With --precompress every file is handed to
+a background gzip/brotli pool as soon as it is written, and with --minify
+each document is minified as it is streamed to disk. generator_main is
+the command line entry point generate_pdfs.py and create_*_checklists.py
+share.
+"""
+
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+
+from atomic_write import AtomicFile, atomic_write
+from build_manifest import BuildManifest, checklist_hash
+from build_profile import add_profile_arguments, selected_profiler
+from checklist_loader import DATA_PATH, ChecklistDataError, load_regions
+from checklist_pdf import print_pdf_report, render_pdfs
+from checklist_template import variant_stem
+from html_minify import HtmlMinifier, minify_css
+from precompress import Precompressor, print_precompress_report
+
+OUTPUT_DIR = Path("public/checklists/assets/pdfs")
+
+def add_build_arguments(parser):
+    """Add the shared build options to a generator's argument parser"""
+
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="worker processes to render with (0 = all cores, default: 1)")
+    parser.add_argument("--data", type=Path, default=DATA_PATH,
+                        help="checklist catalog file or directory of .json/.jsonl catalogs")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every checklist even if its inputs are unchanged")
+    parser.add_argument("--pdf", action="store_true",
+                        help="also render each checklist to PDF with a pooled headless browser")
+    parser.add_argument("--css", choices=("inline", "external"), default="inline",
+                        help="inline the CSS in every checklist, or link one shared cacheable stylesheet")
+    parser.add_argument("--regions", nargs="*", metavar="SLUG",
+                        help="write one variant per region from checklist_regions.json "
+                             "(all regions if no slugs are given)")
+    parser.add_argument("--minify", action="store_true",
+                        help="strip comments and indentation and compact the CSS of every generated file")
+    parser.add_argument("--precompress", action="store_true",
+                        help="write max-level .gz and .br siblings next to every generated file")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild only the checklists whose data changes")
+    parser.add_argument("--poll", action="store_true",
+                        help="with --watch, poll file stamps instead of using filesystem events")
+    add_profile_arguments(parser)
+
+def check_build_arguments(parser, args):
+    """Report a bad --jobs value or unknown --regions slug as a usage error rather than a traceback"""
+
+    if args.jobs < 0:
+        parser.error(f"--jobs must be 0 or a positive integer, got {args.jobs}")
+
+    if args.regions:
+        try:
+            regions = load_regions(slugs=args.regions)
+        except (ChecklistDataError, OSError, ValueError) as e:
+            parser.error(str(e))
+        # Watch mode reloads the region table with these on every rebuild
+        args.regions = [region["slug"] for region in regions]
+
+def selected_layout(layout, args):
+    """The layout to build with for the requested --css mode"""
+
+    if args.css == "external":
+        return layout.with_external_stylesheet()
+
+    return layout
+
+def selected_regions(args):
+    """Regions requested on the command line, or None for the single default variant"""
+
+    if args.regions is None:
+        return None
+
+    return load_regions(slugs=args.regions)
+
+def selected_precompressor(args):
+    """A background compression pool if --precompress was given, else None"""
+
+    if not args.precompress:
+        return None
+
+    return Precompressor(force=args.force)
+
+def resolve_jobs(jobs):
+    """Turn a --jobs value into a worker count"""
+
+    if jobs is None or jobs < 0:
+        raise ValueError(f"--jobs must be 0 or a positive integer, got {jobs}")
+
+    return jobs or os.cpu_count() or 1
+
+def output_name(checklist, region=None):
+    """HTML file name for a checklist, suffixed with the region slug for variants"""
+
+    return f"{variant_stem(checklist, region)}.html"
+
+WRITE_CHUNK = 64 * 1024
+
+def write_document(html_file, html_content, minify=False):
+    """Write one document, minifying it chunk by chunk on the way out; True if the file changed"""
+
+    if not minify:
+        return atomic_write(html_file, html_content)
+
+    with AtomicFile(html_file) as f:
+        minifier = HtmlMinifier()
+        for start in range(0, len(html_content), WRITE_CHUNK):
+            f.write(minifier.feed(html_content[start:start + WRITE_CHUNK]))
+        f.write(minifier.close())
+
+    return f.written
+
+def render_and_write(job):
+    """Render one checklist's variants and write them, returning one result per file"""
+
+    layout, checklist, regions, output_dir, minify = job
+    results = []
+
+    started = time.perf_counter()
+    try:
+        documents = layout.render_variants(checklist, regions)
+        error = None
+    except Exception as e:
+        documents = [None] * len(regions)
+        error = f"{type(e).__name__}: {e}"
+    # Variants share one render, so each is charged an equal share
+    render_seconds = (time.perf_counter() - started) / len(regions)
+
+    for region, html_content in zip(regions, documents):
+        html_file = Path(output_dir) / output_name(checklist, region)
+        result = {"filename": html_file.name, "path": str(html_file), "ok": False, "skipped": False,
+                  "bytes": 0, "error": error, "render_seconds": render_seconds}
+
+        if html_content is not None:
+            try:
+                result["source_bytes"] = len(html_content.encode("utf-8"))
+                started = time.perf_counter()
+                result["written"] = write_document(html_file, html_content, minify)
+                result["write_seconds"] = time.perf_counter() - started
+
+                result["ok"] = True
+                result["bytes"] = html_file.stat().st_size
+
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+
+        results.append(result)
+
+    return results
+
+def write_stylesheet(output_dir, name, css, force=False, minify=False, manifest=None):
+    """Write the shared stylesheet once; its name carries a content hash"""
+
+    css_file = Path(output_dir) / name
+    if minify:
+        css = minify_css(css)
+
+    # The manifest notices a --minify toggle; without one, an existing file is kept
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()
+    if not force and (manifest.is_current(css_file, digest) if manifest is not None else css_file.exists()):
+        return css_file
+
+    written = atomic_write(css_file, css)
+
+    if manifest is not None:
+        manifest.record(css_file, digest, css_file.stat().st_size)
+
+    if written:
+        print(f"🎨 Shared stylesheet: {name}")
+    return css_file
+
+def build_checklists(checklists, output_dir, layout, jobs=1, force=False, regions=None, manifest=None,
+                     precompressor=None, minify=False, profiler=None, show_unchanged=True):
+    """Render and write every changed checklist (and region variant), returning results in input order"""
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if manifest is None:
+        manifest = BuildManifest()
+
+    variants = [None] if regions is None else list(regions)
+    # Minified and pretty outputs of the same inputs must not satisfy each other
+    version = layout.version + ("+minify" if minify else "")
+
+    if layout.stylesheet is not None:
+        css_file = write_stylesheet(output_dir, *layout.stylesheet, force=force, minify=minify,
+                                    manifest=manifest)
+        if precompressor is not None:
+            precompressor.submit(css_file)
+
+    results = {}
+    digests = {}
+    work = []
+
+    for checklist in checklists:
+        stale = []
+
+        for region in variants:
+            html_file = output_dir / output_name(checklist, region)
+            digest = checklist_hash(checklist, version, region)
+
+            if not force and manifest.is_current(html_file, digest):
+                results[str(html_file)] = {"filename": html_file.name, "path": str(html_file), "ok": True,
+                                           "skipped": True, "bytes": html_file.stat().st_size, "error": None}
+                if precompressor is not None:
+                    # Cheap when its siblings are already current
+                    precompressor.submit(html_file)
+            else:
+                digests[str(html_file)] = digest
+                stale.append(region)
+
+        if stale:
+            work.append((layout, checklist, stale, str(output_dir), minify))
+
+    def collect(job_results):
+        for result in job_results:
+            results[result["path"]] = result
+            if result["ok"]:
+                manifest.record(result["path"], digests[result["path"]], result["bytes"])
+                if precompressor is not None:
+                    precompressor.submit(result["path"])
+
+    workers = min(resolve_jobs(jobs), len(work)) or 1
+    timer = profiler.phase("build") if profiler is not None else nullcontext()
+
+    with timer:
+        build_all(work, workers, collect)
+
+    manifest.save()
+
+    ordered = [results[str(output_dir / output_name(checklist, region))]
+               for checklist in checklists for region in variants]
+
+    if profiler is not None:
+        profiler.record("build", ordered)
+
+    for result in ordered:
+        if result["skipped"]:
+            if show_unchanged:
+                print(f"⏭️  Unchanged: {result['filename']}")
+        elif result["ok"]:
+            print(f"✅ Generated: {result['filename']}")
+        else:
+            print(f"❌ Failed: {result['filename']} ({result['error']})")
+
+    return ordered
+
+def build_all(work, workers, collect):
+    """Run render_and_write over every job, passing each job's results to collect as they finish"""
+
+    if workers == 1:
+        for job in work:
+            collect(render_and_write(job))
+    else:
+        # map() yields in submission order, so output stays deterministic;
+        # consuming it lazily lets compression start while rendering continues
+        chunksize = max(1, len(work) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for job_results in executor.map(render_and_write, work, chunksize=chunksize):
+                collect(job_results)
+
+def print_build_summary(results):
+    """Print the aggregated success/failure counts for a build"""
+
+    failed = [result for result in results if not result["ok"]]
+    skipped = sum(1 for result in results if result["skipped"])
+    rebuilt = len(results) - len(failed) - skipped
+    identical = sum(1 for result in results if result["ok"] and not result["skipped"] and not result["written"])
+
+    print(f"\n📊 Build results: {rebuilt} rebuilt, {skipped} skipped (unchanged), {len(failed)} failed")
+    if identical:
+        print(f"💾 {identical} of {rebuilt} rebuilt file(s) were already identical on disk; writes avoided")
+    for result in failed:
+        print(f"   ❌ {result['filename']}: {result['error']}")
+
+    return not failed
+
+def run_pdf_stage(results, jobs=1, force=False, precompressor=None, profiler=None):
+    """Render a PDF next to every successfully built checklist"""
+
+    html_files = [result["path"] for result in results if result["ok"]]
+    on_rendered = precompressor.submit if precompressor is not None else None
+    timer = profiler.phase("pdf") if profiler is not None else nullcontext()
+
+    try:
+        with timer:
+            pdf_results = render_pdfs(html_files, pool_size=resolve_jobs(jobs), force=force,
+                                      on_rendered=on_rendered)
+    except Exception as e:
+        print(f"\n❌ PDF stage failed: {e}")
+        return False
+
+    if profiler is not None:
+        profiler.record("pdf", pdf_results)
+
+    return print_pdf_report(pdf_results)
+
+def print_minify_report(results):
+    """Print a per-file before/after size table for the minified documents"""
+
+    written = [result for result in results if result["ok"] and not result["skipped"]]
+    unchanged = sum(1 for result in results if result["skipped"])
+
+    print("\n🧹 Minified output")
+    print("=" * 60)
+    print(f"{'file':<40} {'before':>8} {'after':>8} {'saved':>6}")
+
+    before_total = 0
+    after_total = 0
+    for result in written:
+        before = result["source_bytes"]
+        after = result["bytes"]
+        before_total += before
+        after_total += after
+        saved = 1 - after / before if before else 0
+        print(f"{result['filename'][:40]:<40} {before:>8,} {after:>8,} {saved:>6.0%}")
+
+    print("=" * 60)
+    if before_total:
+        print(f"{'total':<40} {before_total:>8,} {after_total:>8,} {1 - after_total / before_total:>6.0%}")
+    if unchanged:
+        print(f"⏭️  {unchanged} unchanged file(s) not rewritten")
+
+def finish_precompress(precompressor, profiler=None):
+    """Wait for background compression to drain and report it; True if nothing failed"""
+
+    if precompressor is None:
+        return True
+
+    # Only the wait for the backlog shows up here; the rest overlapped earlier phases
+    timer = profiler.phase("precompress-drain") if profiler is not None else nullcontext()
+    with timer:
+        results = precompressor.close()
+
+    if profiler is not None:
+        profiler.record("precompress", results)
+
+    return print_precompress_report(results)
+
+def print_css_report(checklists, layout, regions=None):
+    """Compare total bytes of inline CSS against one shared stylesheet"""
+
+    inline_layout = layout
+    external_layout = layout.with_external_stylesheet()
+    variants = [None] if regions is None else list(regions)
+
+    inline_bytes = 0
+    external_bytes = 0
+    pages = 0
+    for checklist in checklists:
+        for document in inline_layout.render_variants(checklist, variants):
+            inline_bytes += len(document.encode("utf-8"))
+        for document in external_layout.render_variants(checklist, variants):
+            external_bytes += len(document.encode("utf-8"))
+        pages += len(variants)
+
+    stylesheet_bytes = len(external_layout.stylesheet[1].encode("utf-8"))
+    external_total = external_bytes + stylesheet_bytes
+    saved = inline_bytes - external_total
+
+    print("\n📦 CSS mode size report")
+    print("=" * 60)
+    print(f"{'mode':<10} {'pages':>8} {'page bytes':>12} {'stylesheet':>12} {'total':>12}")
+    print(f"{'inline':<10} {pages:>8} {inline_bytes:>12,} {0:>12,} {inline_bytes:>12,}")
+    print(f"{'external':<10} {pages:>8} {external_bytes:>12,} {stylesheet_bytes:>12,} {external_total:>12,}")
+    print("=" * 60)
+    if pages and inline_bytes:
+        print(f"💾 External mode saves {saved:,} bytes ({saved / inline_bytes:.0%}); "
+              f"each extra checklist a visitor opens costs {external_bytes // pages:,} bytes "
+              f"instead of {inline_bytes // pages:,}")
+
+def run_generator(args, load, layout, label, output_dir=OUTPUT_DIR):
+    """Build one generator's checklists with the shared options and report every stage; True if nothing failed"""
+
+    checklists = load(args.data)
+
+    print(f"Generating {len(checklists)} {label} checklists...")
+
+    regions = selected_regions(args)
+    precompressor = selected_precompressor(args)
+    profiler = selected_profiler(args)
+    results = build_checklists(checklists, output_dir, selected_layout(layout, args), jobs=args.jobs,
+                               force=args.force, regions=regions, precompressor=precompressor,
+                               minify=args.minify, profiler=profiler)
+    ok = print_build_summary(results)
+
+    if args.css == "external":
+        print_css_report(checklists, layout, regions)
+
+    print(f"\n🎯 HTML templates created in: {output_dir}")
+
+    if args.pdf:
+        ok = run_pdf_stage(results, jobs=args.jobs, force=args.force, precompressor=precompressor,
+                           profiler=profiler) and ok
+    else:
+        print("📄 Use --pdf (or browser 'Print to PDF') to generate actual PDF files")
+
+    ok = finish_precompress(precompressor, profiler) and ok
+
+    if args.minify:
+        print_minify_report(results)
+
+    if profiler is not None:
+        profiler.finish()
+
+    return ok
+
+def generator_main(parser, load, layout, label, output_dir=OUTPUT_DIR):
+    """Command line entry point shared by the generators: build, then watch or exit non-zero on failure"""
+
+    # checklist_watch builds through this module, so it cannot be imported at the top
+    from checklist_watch import watch_checklists
+
+    add_build_arguments(parser)
+    args = parser.parse_args()
+    check_build_arguments(parser, args)
+
+    ok = run_generator(args, load, layout, label, output_dir)
+
+    if args.watch:
+        watch_checklists(load, args.data, output_dir, selected_layout(layout, args), args.regions,
+                         args.minify, args.poll, precompress=args.precompress, pdf=args.pdf, jobs=args.jobs)
+    elif not ok:
+        sys.exit(1)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Checklist data loader for Prism Specialties DMV
+Reads checklist definitions from checklist_data.json (or a directory of
+.json/.jsonl catalogs), validates every entry once and caches the parsed
+result keyed by file mtime. Large catalogs can be streamed entry by entry.
+Regional header variants are read from checklist_regions.json.
+"""
+
+import json
+from pathlib import Path
+
+DATA_PATH = Path(__file__).resolve().with_name("checklist_data.json")
+REGIONS_PATH = Path(__file__).resolve().with_name("checklist_regions.json")
+
+REQUIRED_FIELDS = ("filename", "title", "subtitle", "icon", "color", "color_dark", "sections")
+REGION_FIELDS = ("slug", "name", "phone", "service_area")
+PRIORITIES = ("priority-high", "priority-medium", "priority-low")
+
+CHUNK_SIZE = 64 * 1024
+
+_cache = {}
+
+class ChecklistDataError(ValueError):
+    """Raised when a checklist catalog is malformed"""
+
+def validate_checklist(entry, source="checklist"):
+    """Check one checklist dict against the schema the templates expect"""
+
+    if not isinstance(entry, dict):
+        raise ChecklistDataError(f"{source}: expected an object, got {type(entry).__name__}")
+
+    name = entry.get("filename", "?")
+    for field in REQUIRED_FIELDS:
+        if field not in entry:
+            raise ChecklistDataError(f"{source} ({name}): missing field '{field}'")
+
+    for field in REQUIRED_FIELDS[:-1]:
+        if not isinstance(entry[field], str) or not entry[field]:
+            raise ChecklistDataError(f"{source} ({name}): '{field}' must be a non-empty string")
+
+    if "/" in name or "\\" in name or name.startswith("."):
+        raise ChecklistDataError(f"{source} ({name}): filename must be a plain file stem")
+
+    if not isinstance(entry["sections"], list) or not entry["sections"]:
+        raise ChecklistDataError(f"{source} ({name}): 'sections' must be a non-empty list")
+
+    for s, section in enumerate(entry["sections"]):
+        where = f"{source} ({name}) section {s + 1}"
+        if not isinstance(section, dict) or not isinstance(section.get("title"), str):
+            raise ChecklistDataError(f"{where}: needs a string 'title'")
+        if not isinstance(section.get("items"), list):
+            raise ChecklistDataError(f"{where}: 'items' must be a list")
+
+        for i, item in enumerate(section["items"]):
+            if not isinstance(item, dict):
+                raise ChecklistDataError(f"{where} item {i + 1}: expected an object")
+            for field in ("title", "description"):
+                if not isinstance(item.get(field), str):
+                    raise ChecklistDataError(f"{where} item {i + 1}: '{field}' must be a string")
+            if item.get("priority") not in PRIORITIES:
+                raise ChecklistDataError(
+                    f"{where} item {i + 1}: 'priority' must be one of {', '.join(PRIORITIES)}"
+                )
+
+    return entry
+
+class _JsonArrayStream:
+    """Incrementally decode the entries of a JSON array from a file"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ChecklistDataError(f"expected '{char}' at offset {self.pos} of JSON stream")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A value ending exactly at the buffer edge may be a truncated number
+                if end < len(self.buf) or self.eof or not self._fill():
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if not self._fill():
+                    raise ChecklistDataError(f"invalid JSON: {e}") from e
+
+    def items(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ChecklistDataError(f"expected ',' or ']' in checklist array, got {char!r}")
+
+def _iter_json_file(path):
+    """Stream checklist entries from a .json catalog"""
+
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _JsonArrayStream(f)
+
+        if stream.peek() == "[":
+            yield from stream.items()
+            return
+
+        # {"checklists": [...], ...} - skip any other top-level keys
+        stream.expect("{")
+        while stream.peek() != "}":
+            key = stream.value()
+            stream.expect(":")
+            if key == "checklists":
+                yield from stream.items()
+                return
+            stream.value()
+            if stream.peek() == ",":
+                stream.pos += 1
+
+        raise ChecklistDataError(f"{path}: no 'checklists' array found")
+
+def _iter_jsonl_file(path):
+    """Stream checklist entries from a .jsonl catalog, one object per line"""
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ChecklistDataError(f"{path}:{line_number}: invalid JSON: {e}") from e
+
+def _catalog_files(path):
+    """List the catalog files behind a data file or directory"""
+
+    path = Path(path)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix in (".json", ".jsonl"))
+    if not path.exists():
+        raise ChecklistDataError(f"Checklist data not found: {path}")
+    return [path]
+
+def iter_checklists(path=DATA_PATH, collection=None):
+    """Yield validated checklists one at a time without loading the whole catalog"""
+
+    for catalog in _catalog_files(path):
+        entries = _iter_jsonl_file(catalog) if catalog.suffix == ".jsonl" else _iter_json_file(catalog)
+        for index, entry in enumerate(entries, 1):
+            validate_checklist(entry, f"{catalog.name} entry {index}")
+            if collection is None or entry.get("collection") == collection:
+                yield entry
+
+def load_checklists(path=DATA_PATH, collection=None):
+    """Load, validate and cache a checklist catalog, optionally filtered by collection"""
+
+    files = _catalog_files(path)
+    stamp = tuple((str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in files)
+    key = str(Path(path).resolve())
+
+    cached = _cache.get(key)
+    if cached is None or cached[0] != stamp:
+        checklists = list(iter_checklists(path))
+
+        seen = set()
+        for checklist in checklists:
+            if checklist["filename"] in seen:
+                raise ChecklistDataError(f"{path}: duplicate checklist filename '{checklist['filename']}'")
+            seen.add(checklist["filename"])
+
+        cached = (stamp, checklists)
+        _cache[key] = cached
+
+    return [c for c in cached[1] if collection is None or c.get("collection") == collection]
+
+def load_regions(path=REGIONS_PATH, slugs=None):
+    """Load and validate the region table, optionally keeping only the given slugs"""
+
+    path = Path(path)
+    stamp = (path.stat().st_mtime_ns, path.stat().st_size)
+    key = ("regions", str(path.resolve()))
+
+    cached = _cache.get(key)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'r', encoding='utf-8') as f:
+            regions = json.load(f)["regions"]
+
+        for index, region in enumerate(regions, 1):
+            for field in REGION_FIELDS:
+                if not isinstance(region.get(field), str) or not region[field]:
+                    raise ChecklistDataError(f"{path.name} region {index}: '{field}' must be a non-empty string")
+            if not region["slug"].replace("-", "").isalnum():
+                raise ChecklistDataError(f"{path.name} region {index}: slug must be letters, digits and dashes")
+
+        cached = (stamp, regions)
+        _cache[key] = cached
+
+    regions = cached[1]
+    if slugs:
+        known = {region["slug"] for region in regions}
+        unknown = [slug for slug in slugs if slug not in known]
+        if unknown:
+            raise ChecklistDataError(f"Unknown region(s): {', '.join(unknown)} (known: {', '.join(sorted(known))})")
+        regions = [region for region in regions if region["slug"] in slugs]
+
+    return regions
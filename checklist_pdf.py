@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+HTML to PDF rendering stage for the checklist generators
+Starts one headless Chromium (via Playwright) and reuses a small pool of
+pages across every document instead of launching a browser per file.
+
+Requires: pip install playwright && python -m playwright install chromium
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from atomic_write import atomic_write
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": True,
+    "prefer_css_page_size": True,
+}
+
+class PdfRenderer:
+    """Headless Chromium with a pool of reusable pages"""
+
+    def __init__(self, pool_size=2):
+        if async_playwright is None:
+            raise RuntimeError(
+                "Playwright is not installed. Run: pip install playwright && "
+                "python -m playwright install chromium"
+            )
+
+        self.pool_size = max(1, pool_size)
+        self._playwright = None
+        self._browser = None
+        self._pages = None
+
+    async def __aenter__(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+
+        self._pages = asyncio.Queue()
+        for _ in range(self.pool_size):
+            await self._pages.put(await self._browser.new_page())
+
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    async def render(self, html_file, pdf_file):
+        """Print one HTML file to PDF on the next free page, returning seconds spent"""
+
+        page = await self._pages.get()
+        try:
+            started = time.perf_counter()
+            await page.goto(Path(html_file).resolve().as_uri(), wait_until="load")
+            # Chrome stamps a creation date, so identical PDFs are rare; the write is still atomic
+            atomic_write(pdf_file, await page.pdf(**PDF_OPTIONS))
+            return time.perf_counter() - started
+        finally:
+            await self._pages.put(page)
+
+    async def render_document(self, html, base_url=None):
+        """Print an HTML string to PDF bytes on the next free page
+
+        base_url, if given, is where relative links (logos, stylesheets) resolve from.
+        """
+
+        page = await self._pages.get()
+        try:
+            if base_url is not None:
+                html = html.replace("<head>", f'<head>\n    <base href="{base_url}">', 1)
+            await page.set_content(html, wait_until="load")
+            return await page.pdf(**PDF_OPTIONS)
+        finally:
+            await self._pages.put(page)
+
+def pdf_path_for(html_file):
+    """PDF output path that sits next to its HTML source"""
+
+    return Path(html_file).with_suffix(".pdf")
+
+def is_pdf_current(html_file, pdf_file):
+    """True when the PDF exists and is newer than its HTML source"""
+
+    pdf_file = Path(pdf_file)
+    return pdf_file.exists() and pdf_file.stat().st_mtime >= Path(html_file).stat().st_mtime
+
+async def _render_all(jobs, pool_size, on_rendered=None):
+    async with PdfRenderer(pool_size) as renderer:
+
+        async def render_one(html_file, pdf_file):
+            result = {"filename": Path(pdf_file).name, "path": str(pdf_file), "ok": False,
+                      "seconds": 0.0, "bytes": 0, "error": None}
+            try:
+                result["seconds"] = await renderer.render(html_file, pdf_file)
+                result["ok"] = True
+                result["bytes"] = Path(pdf_file).stat().st_size
+                if on_rendered is not None:
+                    on_rendered(pdf_file)
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+            return result
+
+        return list(await asyncio.gather(*(render_one(html, pdf) for html, pdf in jobs)))
+
+def render_pdfs(html_files, pool_size=2, force=False, on_rendered=None, pdf_files=None):
+    """Render HTML files to PDFs, returning one result per file in order
+
+    PDFs go next to their HTML source unless pdf_files, parallel to
+    html_files, names each output. on_rendered, if given, is called with
+    each PDF path as soon as it is written.
+    """
+
+    if pdf_files is None:
+        pdf_files = [pdf_path_for(html_file) for html_file in html_files]
+
+    jobs = []
+    indexes = []
+    results = [None] * len(html_files)
+
+    for index, (html_file, pdf_file) in enumerate(zip(html_files, pdf_files)):
+        pdf_file = Path(pdf_file)
+        if not force and is_pdf_current(html_file, pdf_file):
+            results[index] = {"filename": pdf_file.name, "path": str(pdf_file), "ok": True,
+                              "skipped": True, "seconds": 0.0,
+                              "bytes": pdf_file.stat().st_size, "error": None}
+            if on_rendered is not None:
+                on_rendered(pdf_file)
+        else:
+            jobs.append((html_file, pdf_file))
+            indexes.append(index)
+
+    if jobs:
+        rendered = asyncio.run(_render_all(jobs, pool_size, on_rendered))
+        for index, result in zip(indexes, rendered):
+            result["skipped"] = False
+            results[index] = result
+
+    return results
+
+def print_pdf_report(results):
+    """Print per-document PDF timings and return True if all succeeded"""
+
+    print("\n🖨️  PDF rendering")
+    print("=" * 60)
+
+    for result in results:
+        if result["skipped"]:
+            print(f"⏭️  Unchanged: {result['filename']}")
+        elif result["ok"]:
+            print(f"✅ {result['filename']}: {result['seconds'] * 1000:.0f} ms, {result['bytes'] / 1024:.1f} KB")
+        else:
+            print(f"❌ {result['filename']}: {result['error']}")
+
+    rendered = [result for result in results if result["ok"] and not result["skipped"]]
+    failed = [result for result in results if not result["ok"]]
+    total = sum(result["seconds"] for result in rendered)
+
+    print("=" * 60)
+    print(f"🎯 {len(rendered)} rendered, {len(results) - len(rendered) - len(failed)} unchanged, "
+          f"{len(failed)} failed ({total:.2f}s of page time)")
+
+    return not failed
+
+def main():
+    """Render existing checklist HTML files to PDF"""
+
+    parser = argparse.ArgumentParser(description="Render checklist HTML files to PDF")
+    parser.add_argument("html_files", nargs="*", type=Path,
+                        help="HTML files to render (default: public/checklists/assets/pdfs/*.html)")
+    parser.add_argument("--pool", type=int, default=2, help="browser pages to render with in parallel")
+    parser.add_argument("--force", action="store_true", help="re-render PDFs that are already current")
+    args = parser.parse_args()
+
+    html_files = args.html_files or sorted(Path("public/checklists/assets/pdfs").glob("*.html"))
+    if not html_files:
+        print("❌ No HTML files to render")
+        return
+
+    try:
+        results = render_pdfs(html_files, args.pool, args.force)
+    except Exception as e:
+        print(f"❌ PDF rendering failed: {e}")
+        raise SystemExit(1)
+
+    if not print_pdf_report(results):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Build rewrite rules for checklists rendered outside the generators
+The render service and the personalised batch renderer apply the same
+rewrite rules to their documents that the build applies to the files it
+writes, matched against the path each checklist would have in the tree.
+"""
+
+from checklist_template import CHECKLIST_PATH, variant_stem
+from optimize_logos import cached_logo_rule
+from rewrite_rules import apply_rules, load_rules, rules_for
+
+# Where a rendered checklist would live in the tree, for matching rewrite rule globs
+OUTPUT_PREFIX = "public" + CHECKLIST_PATH
+
+def load_build_rules():
+    """The rewrite rules plus, once optimize_logos.py has derived its variants, the logo srcset rule"""
+
+    rules = load_rules()
+    logo_rule = cached_logo_rule()
+    return rules if logo_rule is None else [*rules, logo_rule]
+
+def apply_build_rewrites(html, checklist, region, rules):
+    """Encode a rendered document and apply the rewrite rules its build output would get"""
+
+    applicable = rules_for(rules, f"{OUTPUT_PREFIX}{variant_stem(checklist, region)}.html")
+    return bytes(apply_rules(html.encode("utf-8"), applicable, {}, {}))
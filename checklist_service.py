@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+On-demand checklist render service
+A small asyncio HTTP server that renders checklists, region variants and
+personalised copies (lead name and city) on request with the shared
+template engine and the same rewrite rules the build applies. Rendered
+HTML and PDF bytes are kept in an LRU cache keyed by checklist, region
+and template version; /stats reports cache hits and misses and latency
+percentiles.
+
+    GET /checklists                              index of checklists and regions
+    GET /checklists/<name>.html?region=&name=&city=
+    GET /checklists/<name>.pdf?region=&name=&city=
+    GET /stats
+
+PDF responses require: pip install playwright && python -m playwright install chromium
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from build_manifest import checklist_hash
+from checklist_loader import DATA_PATH, ChecklistDataError, load_checklists, load_regions
+from checklist_pdf import PdfRenderer
+from checklist_rewrites import apply_build_rewrites, load_build_rules
+from checklist_template import CHECKLIST_PATH, COMPACT_LAYOUT, PDF_LAYOUT, SITE_URL
+
+# Layout each collection is built with (see generate_pdfs.py and create_*_checklists.py)
+COLLECTION_LAYOUTS = {"core": PDF_LAYOUT}
+
+CACHE_BYTES = 64 * 1024 * 1024
+LATENCY_SAMPLES = 10000
+IDLE_TIMEOUT = 15
+MAX_HEADERS = 100
+LEAD_FIELD_LENGTH = 100
+
+CONTENT_TYPES = {
+    "html": "text/html; charset=utf-8",
+    "pdf": "application/pdf",
+    "json": "application/json",
+    "text": "text/plain; charset=utf-8",
+}
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+
+class HttpError(Exception):
+    """An error response with a status code"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class RenderCache:
+    """LRU cache of rendered documents, bounded by total bytes"""
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Cached bytes for key (marking them recently used), or None"""
+
+        body = self.entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, key, body):
+        """Store bytes, evicting the least recently used entries to stay within max_bytes"""
+
+        if len(body) > self.max_bytes:
+            return
+
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= len(previous)
+
+        self.entries[key] = body
+        self.bytes += len(body)
+        while self.bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+class LatencyStats:
+    """Recent request latencies per route"""
+
+    def __init__(self, samples=LATENCY_SAMPLES):
+        self.samples = samples
+        self.routes = {}
+        self.counts = {}
+
+    def record(self, route, seconds):
+        self.routes.setdefault(route, deque(maxlen=self.samples)).append(seconds)
+        self.counts[route] = self.counts.get(route, 0) + 1
+
+    def stats(self):
+        summary = {}
+        for route, latencies in sorted(self.routes.items()):
+            ordered = sorted(latencies)
+            summary[route] = {
+                "count": self.counts[route],
+                **{f"p{int(fraction * 100)}_ms": round(percentile(ordered, fraction) * 1000, 3)
+                   for fraction in (0.5, 0.9, 0.99)},
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return summary
+
+def lead_from_query(query):
+    """The lead fields of a request's query string, or None for a generic copy"""
+
+    lead = {}
+    for field in ("name", "city"):
+        value = query.get(field, [""])[0].strip()
+        if len(value) > LEAD_FIELD_LENGTH:
+            raise HttpError(400, f"'{field}' is longer than {LEAD_FIELD_LENGTH} characters")
+        if value:
+            lead[field] = value
+
+    if "city" in lead and "name" not in lead:
+        raise HttpError(400, "'city' needs a 'name'")
+
+    return lead or None
+
+async def read_headers(reader):
+    """Header name -> value up to the blank line ending a request's head, or None if the client went away
+
+    Raises HttpError when the head cannot be framed (a line longer than the
+    stream limit, or more than MAX_HEADERS lines); the connection must then
+    be closed, since the rest of the request would read as the next one.
+    """
+
+    headers = {}
+    for _ in range(MAX_HEADERS):
+        try:
+            line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+        except (asyncio.TimeoutError, ConnectionError):
+            return None
+        except (asyncio.LimitOverrunError, ValueError):
+            raise HttpError(400, "Header line too long") from None
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise HttpError(400, "Too many headers")
+
+class ChecklistService:
+    """Request routing, rendering and caching for the render service"""
+
+    def __init__(self, data_path=DATA_PATH, cache_bytes=CACHE_BYTES, pdf_pool=2):
+        self.data_path = data_path
+        self.cache = RenderCache(cache_bytes)
+        self.latency = LatencyStats()
+        self.rules = load_build_rules()
+        self.pdf_pool = pdf_pool
+        self.started = time.perf_counter()
+        self._renderer = None
+        self._renderer_lock = asyncio.Lock()
+        # Renders in progress, so concurrent misses for one key share a single render
+        self._pending = {}
+
+    def catalog(self):
+        """Checklists by file name; reloaded only when the catalog changes on disk"""
+
+        return {checklist["filename"]: checklist for checklist in load_checklists(self.data_path)}
+
+    def index(self):
+        regions = [region["slug"] for region in load_regions()]
+        checklists = [
+            {"filename": name, "title": checklist["title"], "collection": checklist.get("collection"),
+             "html": f"/checklists/{name}.html", "pdf": f"/checklists/{name}.pdf"}
+            for name, checklist in self.catalog().items()
+        ]
+        return {"regions": regions, "checklists": checklists}
+
+    def stats(self):
+        return {
+            "uptime_seconds": round(time.perf_counter() - self.started, 3),
+            "cache": self.cache.stats(),
+            "latency": self.latency.stats(),
+        }
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it closes or goes idle"""
+
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except (asyncio.TimeoutError, ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    return
+                if not request_line.strip():
+                    return
+
+                header_error = None
+                try:
+                    headers = await read_headers(reader)
+                except HttpError as e:
+                    headers, header_error = {}, e
+                if headers is None:
+                    return
+
+                started = time.perf_counter()
+                parts = request_line.decode("latin-1").split()
+                version = parts[2] if len(parts) == 3 else "HTTP/1.0"
+                route = "error"
+                try:
+                    if header_error is not None:
+                        raise header_error
+                    if len(parts) != 3:
+                        raise HttpError(400, "Malformed request line")
+                    method, target = parts[0], parts[1]
+                    if method not in ("GET", "HEAD"):
+                        raise HttpError(405, f"{method} is not supported")
+                    route, status, kind, body, cache_state = await self.respond(target)
+                except HttpError as e:
+                    status, kind, body, cache_state = e.status, "text", f"{e}\n".encode("utf-8"), None
+                except Exception as e:
+                    status, kind, body, cache_state = 500, "text", f"{type(e).__name__}: {e}\n".encode("utf-8"), None
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                # Request bodies are never read, so the connection cannot be reused after one
+                if status in (400, 405):
+                    keep_alive = False
+
+                head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                        f"Content-Type: {CONTENT_TYPES[kind]}",
+                        f"Content-Length: {len(body)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                if cache_state is not None:
+                    head.append(f"X-Cache: {cache_state}")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+                if parts[0] != "HEAD":
+                    writer.write(body)
+                await writer.drain()
+
+                self.latency.record(route, time.perf_counter() - started)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, target):
+        """(route, status, content kind, body, cache state) for a GET request"""
+
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+
+        if url.path in ("/", "/checklists", "/checklists/"):
+            return "index", 200, "json", json.dumps(self.index(), indent=2).encode("utf-8"), None
+        if url.path == "/stats":
+            return "stats", 200, "json", json.dumps(self.stats(), indent=2).encode("utf-8"), None
+
+        prefix, _, name = url.path.rpartition("/")
+        stem, _, fmt = name.rpartition(".")
+        if prefix != "/checklists" or fmt not in ("html", "pdf"):
+            raise HttpError(404, f"No such page: {url.path}")
+
+        checklist = self.catalog().get(stem)
+        if checklist is None:
+            raise HttpError(404, f"No such checklist: {stem}")
+
+        region = None
+        slug = query.get("region", [""])[0]
+        if slug:
+            try:
+                region = load_regions(slugs=[slug])[0]
+            except ChecklistDataError as e:
+                raise HttpError(400, str(e)) from e
+
+        lead = lead_from_query(query)
+        body, hit = await self.document(checklist, region, lead, fmt)
+        return f"{fmt} {'hit' if hit else 'miss'}", 200, fmt, body, "HIT" if hit else "MISS"
+
+    def cache_key(self, checklist, region, lead, fmt):
+        layout = COLLECTION_LAYOUTS.get(checklist.get("collection"), COMPACT_LAYOUT)
+        # The hash covers the checklist data, the region and the template version
+        version = checklist_hash(checklist, layout.version, region)
+        lead_key = (lead.get("name"), lead.get("city")) if lead else None
+        return (checklist["filename"], region["slug"] if region else None, version, lead_key, fmt)
+
+    async def document(self, checklist, region, lead, fmt):
+        """(bytes, was_cached) for one rendered document"""
+
+        key = self.cache_key(checklist, region, lead, fmt)
+        body = self.cache.get(key)
+        if body is not None:
+            return body, True
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending), False
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            if fmt == "html":
+                body = await asyncio.to_thread(self.render_html, checklist, region, lead)
+            else:
+                html, _ = await self.document(checklist, region, lead, "html")
+                body = await self.render_pdf(html.decode("utf-8"))
+            self.cache.put(key, body)
+            future.set_result(body)
+            return body, False
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved when nobody else was waiting on it
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    def render_html(self, checklist, region, lead):
+        layout = COLLECTION_LAYOUTS.get(checklist.get("collection"), COMPACT_LAYOUT)
+        return apply_build_rewrites(layout.render(checklist, region, lead), checklist, region, self.rules)
+
+    async def render_pdf(self, html):
+        """Print HTML to PDF on the shared browser, starting it on first use"""
+
+        async with self._renderer_lock:
+            if self._renderer is None:
+                try:
+                    renderer = PdfRenderer(self.pdf_pool)
+                except RuntimeError as e:
+                    raise HttpError(503, str(e)) from e
+                try:
+                    self._renderer = await renderer.__aenter__()
+                except Exception as e:
+                    # Usually the browser binary is missing; the next PDF request retries
+                    await renderer.__aexit__(None, None, None)
+                    raise HttpError(503, f"Could not start the PDF browser: {e}") from e
+
+        # Relative asset paths in the rewritten HTML resolve against the live site
+        return await self._renderer.render_document(html, base_url=f"{SITE_URL}{CHECKLIST_PATH}")
+
+    async def close(self):
+        if self._renderer is not None:
+            await self._renderer.__aexit__(None, None, None)
+            self._renderer = None
+
+def print_service_stats(stats):
+    """Print the cache and latency summary"""
+
+    cache = stats["cache"]
+    print("\n📊 Render service")
+    print("=" * 60)
+    print(f"Cache: {cache['hits']} hit(s), {cache['misses']} miss(es), {cache['evictions']} eviction(s), "
+          f"{cache['entries']} entries / {cache['bytes'] / 1024:.1f} KB")
+    if stats["latency"]:
+        print(f"\n{'route':<16} {'count':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        for route, entry in stats["latency"].items():
+            print(f"{route:<16} {entry['count']:>7} {entry['p50_ms']:>9.2f} {entry['p90_ms']:>9.2f} "
+                  f"{entry['p99_ms']:>9.2f} {entry['max_ms']:>9.2f}")
+    print("=" * 60)
+
+async def serve(host, port, service):
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"🌐 Serving checklists on http://{host}:{port}/checklists (stats at /stats); Ctrl+C to stop")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+def main():
+    """Run the render service"""
+
+    parser = argparse.ArgumentParser(description="Serve checklists rendered on demand")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    parser.add_argument("--data", type=Path, default=DATA_PATH,
+                        help="checklist catalog file or directory (default: checklist_data.json)")
+    parser.add_argument("--cache-mb", type=float, default=CACHE_BYTES / (1024 * 1024),
+                        help="rendered-document cache size in MB (default: 64)")
+    parser.add_argument("--pdf-pool", type=int, default=2, help="browser pages for PDF rendering")
+    args = parser.parse_args()
+
+    # Fail at startup, not on the first request, if the catalog is broken
+    load_checklists(args.data)
+
+    service = ChecklistService(args.data, int(args.cache_mb * 1024 * 1024), args.pdf_pool)
+    try:
+        asyncio.run(serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        pass
+    print_service_stats(service.stats())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Shared checklist template engine for Prism Specialties DMV
+Templates are parsed once into literal/field segments and rendered
+through a single list join instead of repeated string concatenation
+"""
+
+import hashlib
+import html
+import textwrap
+from string import Formatter
+
+from qr_code import qr_svg
+
+# Header contact details used when no region is requested
+DEFAULT_REGION = {
+    "phone": "(888) 826-9429",
+    "service_area": "Washington DC • Maryland • Virginia",
+}
+
+# Where the generated checklists are published; footer QR codes point here
+SITE_URL = "https://www.prismspecialtiesdmv.com"
+CHECKLIST_PATH = "/checklists/assets/pdfs/"
+
+# Per-checklist colors become custom properties when the CSS is shared
+CSS_VARIABLES = {
+    "color": "var(--checklist-color)",
+    "color_dark": "var(--checklist-color-dark)",
+}
+
+STYLESHEET_LINK = """    <link rel="stylesheet" href="{href}">
+    <style>:root {{{{ --checklist-color: {{color}}; --checklist-color-dark: {{color_dark}}; }}}}</style>"""
+
+def variant_stem(data, region=None):
+    """File name stem of a checklist, suffixed with the region slug for variants"""
+
+    if region is None:
+        return data["filename"]
+
+    return f"{data['filename']}-{region['slug']}"
+
+def checklist_url(data, region=None):
+    """Live URL of a checklist (or one of its region variants)"""
+
+    return f"{SITE_URL}{CHECKLIST_PATH}{variant_stem(data, region)}.html"
+
+PREPARED_FOR = """
+                <p class="prepared-for">Prepared for {name}</p>"""
+
+def lead_label(lead=None):
+    """Unescaped "name • city" text for a lead, or None without a name"""
+
+    if not lead or not lead.get("name"):
+        return None
+
+    return lead["name"] if not lead.get("city") else f"{lead['name']} • {lead['city']}"
+
+def prepared_for(lead=None):
+    """Escaped "Prepared for" line naming a lead (and their city), or nothing"""
+
+    label = lead_label(lead)
+    return "" if label is None else PREPARED_FOR.format(name=html.escape(label))
+
+def variant_context(data, region=None, lead=None):
+    """Fields for the header and footer, which change per region and lead"""
+
+    return {**data, **(region or DEFAULT_REGION), "prepared_for": prepared_for(lead),
+            "qr_code": qr_svg(checklist_url(data, region))}
+
+class CompiledTemplate:
+    """A format-style template parsed once into literal and field segments"""
+
+    def __init__(self, source):
+        self.source = source
+        segments = []
+
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if spec or conversion:
+                raise ValueError(f"Unsupported format spec in template field: {field}")
+            segments.append((literal, field))
+
+        self.segments = tuple(segments)
+
+    def render_into(self, parts, context):
+        """Append the rendered segments to an existing parts list"""
+
+        for literal, field in self.segments:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                parts.append(str(context[field]))
+
+    def render(self, context):
+        """Render the template on its own"""
+
+        parts = []
+        self.render_into(parts, context)
+        return "".join(parts)
+
+class ChecklistLayout:
+    """Document, header, section, item and footer fragments for one checklist style"""
+
+    def __init__(self, head, header, intro, section_open, item, section_close, footer):
+        self.head = CompiledTemplate(head)
+        self.header = CompiledTemplate(header)
+        self.intro = CompiledTemplate(intro)
+        self.section_open = CompiledTemplate(section_open)
+        self.item = CompiledTemplate(item)
+        self.section_close = CompiledTemplate(section_close)
+        self.footer = CompiledTemplate(footer)
+
+        # Changes whenever any fragment (or the URL the QR codes point at) changes,
+        # so cached builds can be invalidated
+        sources = "\0".join((head, header, intro, section_open, item, section_close, footer,
+                             SITE_URL + CHECKLIST_PATH))
+        self.version = hashlib.sha256(sources.encode("utf-8")).hexdigest()[:12]
+
+        # (file name, CSS text) when this layout links a shared stylesheet
+        self.stylesheet = None
+        self._external = None
+
+    def with_external_stylesheet(self, prefix="checklist-base"):
+        """Variant of this layout that links one shared stylesheet instead of inlining its CSS"""
+
+        if self._external is None:
+            head = self.head.source
+            start = head.index("    <style>")
+            end = head.index("</style>", start) + len("</style>")
+            css_source = head[head.index("\n", start) + 1:head.rindex("\n", start, end) + 1]
+
+            css = textwrap.dedent(CompiledTemplate(css_source).render(CSS_VARIABLES))
+            name = f"{prefix}.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:8]}.css"
+            link = STYLESHEET_LINK.format(href=name)
+
+            external = ChecklistLayout(
+                head[:start] + link + head[end:], self.header.source, self.intro.source,
+                self.section_open.source, self.item.source, self.section_close.source, self.footer.source
+            )
+            external.stylesheet = (name, css)
+            self._external = external
+
+        return self._external
+
+    def render_body_into(self, parts, data):
+        """Append the title block and sections, which no region changes"""
+
+        self.intro.render_into(parts, data)
+
+        # Add sections
+        for section in data["sections"]:
+            self.section_open.render_into(parts, section)
+
+            for item in section["items"]:
+                self.item.render_into(parts, item)
+
+            self.section_close.render_into(parts, section)
+
+    def render(self, data, region=None, lead=None):
+        """Render a full checklist document in a single join"""
+
+        context = variant_context(data, region, lead)
+
+        parts = []
+        self.head.render_into(parts, data)
+        self.header.render_into(parts, context)
+        self.render_body_into(parts, data)
+        self.footer.render_into(parts, context)
+
+        return "".join(parts)
+
+    def render_variants(self, data, regions, leads=None):
+        """Render one document per region, sharing the head and body between them
+
+        leads, if given, pairs a lead (or None) with each entry of regions.
+        """
+
+        head = self.head.render(data)
+        body_parts = []
+        self.render_body_into(body_parts, data)
+        body = "".join(body_parts)
+
+        documents = []
+        for region, lead in zip(regions, leads or [None] * len(regions)):
+            context = variant_context(data, region, lead)
+            documents.append("".join((head, self.header.render(context), body, self.footer.render(context))))
+
+        return documents
+
+# Expanded layout written by generate_pdfs.py
+PDF_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} | Prism Specialties DMV</title>
+    <style>
+        @page {{
+            size: A4;
+            margin: 0.5in;
+        }}
+
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+
+        body {{
+            font-family: 'Arial', sans-serif;
+            font-size: 11px;
+            line-height: 1.4;
+            color: #333;
+            background: white;
+        }}
+
+        .pdf-container {{
+            max-width: 8.5in;
+            margin: 0 auto;
+            padding: 20px;
+            background: white;
+        }}
+
+        .header {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            border-bottom: 3px solid {color};
+            padding-bottom: 15px;
+            margin-bottom: 20px;
+        }}
+
+        .logo-section {{
+            display: flex;
+            align-items: center;
+        }}
+
+        .logo-placeholder {{
+            width: 60px;
+            height: 40px;
+            background: {color};
+            border-radius: 5px;
+            margin-right: 15px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-weight: bold;
+            font-size: 10px;
+        }}
+
+        .company-info h1 {{
+            color: {color};
+            font-size: 18px;
+            font-weight: bold;
+            margin-bottom: 3px;
+        }}
+
+        .company-info p {{
+            color: #666;
+            font-size: 10px;
+        }}
+
+        .emergency-contact {{
+            text-align: right;
+            background: #f8f9fa;
+            padding: 10px;
+            border-radius: 5px;
+            border-left: 4px solid #e74c3c;
+        }}
+
+        .emergency-contact h3 {{
+            color: #e74c3c;
+            font-size: 12px;
+            margin-bottom: 5px;
+        }}
+
+        .emergency-contact .phone {{
+            font-size: 16px;
+            font-weight: bold;
+            color: #333;
+        }}
+
+        .emergency-contact .prepared-for {{
+            font-size: 9px;
+            color: #666;
+            margin-top: 3px;
+        }}
+
+        .checklist-title {{
+            background: linear-gradient(135deg, {color} 0%, {color_dark} 100%);
+            color: white;
+            padding: 15px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+            text-align: center;
+        }}
+
+        .checklist-title h2 {{
+            font-size: 20px;
+            margin-bottom: 5px;
+        }}
+
+        .checklist-title p {{
+            font-size: 11px;
+            opacity: 0.9;
+        }}
+
+        .authority-badge {{
+            background: #2e7d32;
+            color: white;
+            padding: 8px 15px;
+            border-radius: 20px;
+            font-size: 10px;
+            font-weight: bold;
+            margin: 15px 0;
+            text-align: center;
+            display: inline-block;
+        }}
+
+        .checklist-section {{
+            margin-bottom: 20px;
+        }}
+
+        .section-title {{
+            background: #f8f9fa;
+            border-left: 4px solid {color};
+            padding: 8px 15px;
+            font-weight: bold;
+            color: #333;
+            margin-bottom: 10px;
+            border-radius: 0 5px 5px 0;
+        }}
+
+        .checklist-item {{
+            display: flex;
+            align-items: flex-start;
+            margin-bottom: 8px;
+            padding: 8px;
+            border-radius: 5px;
+        }}
+
+        .checkbox {{
+            width: 15px;
+            height: 15px;
+            border: 2px solid {color};
+            border-radius: 3px;
+            margin-right: 12px;
+            margin-top: 2px;
+            flex-shrink: 0;
+        }}
+
+        .item-content {{
+            flex: 1;
+        }}
+
+        .item-title {{
+            font-weight: bold;
+            color: #333;
+            margin-bottom: 3px;
+        }}
+
+        .item-description {{
+            color: #666;
+            font-size: 10px;
+            line-height: 1.3;
+        }}
+
+        .priority-high {{
+            border-left: 4px solid #e74c3c;
+        }}
+
+        .priority-medium {{
+            border-left: 4px solid #f39c12;
+        }}
+
+        .priority-low {{
+            border-left: 4px solid #27ae60;
+        }}
+
+        .footer {{
+            margin-top: 30px;
+            border-top: 2px solid {color};
+            padding-top: 15px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+
+        .qr-code {{
+            width: 60px;
+            height: 60px;
+            margin-bottom: 5px;
+        }}
+
+        .qr-code svg {{
+            display: block;
+            width: 100%;
+            height: 100%;
+        }}
+
+        .footer-info {{
+            flex: 1;
+            text-align: right;
+        }}
+
+        .footer-info p {{
+            font-size: 9px;
+            color: #666;
+            margin-bottom: 3px;
+        }}
+
+        .website {{
+            color: {color};
+            font-weight: bold;
+        }}
+    </style>
+</head>
+<body>
+    <div class="pdf-container">
+"""
+
+PDF_HEADER = """        <!-- Header -->
+        <div class="header">
+            <div class="logo-section">
+                <div class="logo-placeholder">PRISM</div>
+                <div class="company-info">
+                    <h1>Prism Specialties DMV</h1>
+                    <p>Professional Emergency Restoration Services</p>
+                </div>
+            </div>
+            <div class="emergency-contact">
+                <h3>🚨 24/7 Emergency</h3>
+                <div class="phone">{phone}</div>
+                <p>{service_area}</p>{prepared_for}
+            </div>
+        </div>
+
+"""
+
+PDF_INTRO = """        <!-- Title Section -->
+        <div class="checklist-title">
+            <h2>{icon} {title}</h2>
+            <p>{subtitle}</p>
+        </div>
+
+        <div class="authority-badge">✅ Used by Emergency Responders & Insurance Professionals</div>
+
+        <!-- Checklist Sections -->
+"""
+
+PDF_SECTION_OPEN = """
+        <div class="checklist-section">
+            <div class="section-title">{title}</div>
+"""
+
+PDF_ITEM = """
+            <div class="checklist-item {priority}">
+                <div class="checkbox"></div>
+                <div class="item-content">
+                    <div class="item-title">{title}</div>
+                    <div class="item-description">{description}</div>
+                </div>
+            </div>
+"""
+
+PDF_SECTION_CLOSE = """        </div>
+"""
+
+PDF_FOOTER = """
+        <!-- Footer -->
+        <div class="footer">
+            <div>
+                <div class="qr-code">{qr_code}</div>
+                <p style="font-size: 8px; text-align: center;">Scan for updates</p>
+            </div>
+            <div class="footer-info">
+                <p><strong>Professional Restoration Services</strong></p>
+                <p>Document • Electronics • Art • Textiles</p>
+                <p class="website">www.prismspecialtiesdmv.com</p>
+                <p>© 2025 Prism Specialties DMV • Licensed & Insured</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Compact layout written by create_all_checklists.py and create_remaining_checklists.py
+COMPACT_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} | Prism Specialties DMV</title>
+    <style>
+        @page {{ size: A4; margin: 0.5in; }}
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{ font-family: 'Arial', sans-serif; font-size: 11px; line-height: 1.4; color: #333; background: white; }}
+        .pdf-container {{ max-width: 8.5in; margin: 0 auto; padding: 20px; background: white; }}
+        .header {{ display: flex; justify-content: space-between; align-items: center; border-bottom: 3px solid {color}; padding-bottom: 15px; margin-bottom: 20px; }}
+        .logo-section {{ display: flex; align-items: center; }}
+        .logo-placeholder {{ width: 60px; height: 40px; background: {color}; border-radius: 5px; margin-right: 15px; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold; font-size: 10px; }}
+        .company-info h1 {{ color: {color}; font-size: 18px; font-weight: bold; margin-bottom: 3px; }}
+        .company-info p {{ color: #666; font-size: 10px; }}
+        .emergency-contact {{ text-align: right; background: #f8f9fa; padding: 10px; border-radius: 5px; border-left: 4px solid #e74c3c; }}
+        .emergency-contact h3 {{ color: #e74c3c; font-size: 12px; margin-bottom: 5px; }}
+        .emergency-contact .phone {{ font-size: 16px; font-weight: bold; color: #333; }}
+        .emergency-contact .prepared-for {{ font-size: 9px; color: #666; margin-top: 3px; }}
+        .checklist-title {{ background: linear-gradient(135deg, {color} 0%, {color_dark} 100%); color: white; padding: 15px; border-radius: 8px; margin-bottom: 20px; text-align: center; }}
+        .checklist-title h2 {{ font-size: 20px; margin-bottom: 5px; }}
+        .checklist-title p {{ font-size: 11px; opacity: 0.9; }}
+        .authority-badge {{ background: #2e7d32; color: white; padding: 8px 15px; border-radius: 20px; font-size: 10px; font-weight: bold; margin: 15px 0; text-align: center; display: inline-block; }}
+        .checklist-section {{ margin-bottom: 20px; }}
+        .section-title {{ background: #f8f9fa; border-left: 4px solid {color}; padding: 8px 15px; font-weight: bold; color: #333; margin-bottom: 10px; border-radius: 0 5px 5px 0; }}
+        .checklist-item {{ display: flex; align-items: flex-start; margin-bottom: 8px; padding: 8px; border-radius: 5px; }}
+        .checkbox {{ width: 15px; height: 15px; border: 2px solid {color}; border-radius: 3px; margin-right: 12px; margin-top: 2px; flex-shrink: 0; }}
+        .item-content {{ flex: 1; }}
+        .item-title {{ font-weight: bold; color: #333; margin-bottom: 3px; }}
+        .item-description {{ color: #666; font-size: 10px; line-height: 1.3; }}
+        .priority-high {{ border-left: 4px solid #e74c3c; }}
+        .priority-medium {{ border-left: 4px solid #f39c12; }}
+        .priority-low {{ border-left: 4px solid #27ae60; }}
+        .footer {{ margin-top: 30px; border-top: 2px solid {color}; padding-top: 15px; display: flex; justify-content: space-between; align-items: center; }}
+        .qr-code {{ width: 60px; height: 60px; margin-bottom: 5px; }}
+        .qr-code svg {{ display: block; width: 100%; height: 100%; }}
+        .footer-info {{ flex: 1; text-align: right; }}
+        .footer-info p {{ font-size: 9px; color: #666; margin-bottom: 3px; }}
+        .website {{ color: {color}; font-weight: bold; }}
+    </style>
+</head>
+<body>
+    <div class="pdf-container">
+'''
+
+COMPACT_HEADER = '''        <div class="header">
+            <div class="logo-section">
+                <div class="logo-placeholder">PRISM</div>
+                <div class="company-info">
+                    <h1>Prism Specialties DMV</h1>
+                    <p>Professional Emergency Restoration Services</p>
+                </div>
+            </div>
+            <div class="emergency-contact">
+                <h3>🚨 24/7 Emergency</h3>
+                <div class="phone">{phone}</div>
+                <p>{service_area}</p>{prepared_for}
+            </div>
+        </div>
+
+'''
+
+COMPACT_INTRO = '''        <div class="checklist-title">
+            <h2>{icon} {title}</h2>
+            <p>{subtitle}</p>
+        </div>
+
+        <div class="authority-badge">✅ Used by Emergency Responders & Insurance Professionals</div>
+'''
+
+COMPACT_SECTION_OPEN = '''
+        <div class="checklist-section">
+            <div class="section-title">{title}</div>'''
+
+COMPACT_ITEM = '''
+            <div class="checklist-item {priority}">
+                <div class="checkbox"></div>
+                <div class="item-content">
+                    <div class="item-title">{title}</div>
+                    <div class="item-description">{description}</div>
+                </div>
+            </div>'''
+
+COMPACT_SECTION_CLOSE = '''
+        </div>'''
+
+COMPACT_FOOTER = '''
+        <div class="footer">
+            <div>
+                <div class="qr-code">{qr_code}</div>
+                <p style="font-size: 8px; text-align: center;">Scan for updates</p>
+            </div>
+            <div class="footer-info">
+                <p><strong>Professional Restoration Services</strong></p>
+                <p>Document • Electronics • Art • Textiles</p>
+                <p class="website">www.prismspecialtiesdmv.com</p>
+                <p>© 2025 Prism Specialties DMV • Licensed & Insured</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>'''
+
+PDF_LAYOUT = ChecklistLayout(
+    PDF_HEAD, PDF_HEADER, PDF_INTRO, PDF_SECTION_OPEN, PDF_ITEM, PDF_SECTION_CLOSE, PDF_FOOTER
+)
+COMPACT_LAYOUT = ChecklistLayout(
+    COMPACT_HEAD, COMPACT_HEADER, COMPACT_INTRO, COMPACT_SECTION_OPEN, COMPACT_ITEM,
+    COMPACT_SECTION_CLOSE, COMPACT_FOOTER
+)
+
+def render_checklist(data, layout=COMPACT_LAYOUT, region=None, lead=None):
+    """Render a checklist dict with a pre-compiled layout"""
+
+    return layout.render(data, region, lead)
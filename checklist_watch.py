@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the checklist generators
+Keeps the compiled templates and build manifest in memory and rebuilds
+only the checklists whose data changed whenever a catalog or the region
+table is saved. Uses watchdog (inotify and friends) when installed and
+falls back to polling file stamps otherwise.
+
+Event-driven watching requires: pip install watchdog
+"""
+
+import threading
+import time
+from pathlib import Path
+
+from build_manifest import BuildManifest
+from checklist_build import build_checklists, finish_precompress, run_pdf_stage
+from checklist_loader import REGIONS_PATH, ChecklistDataError, load_regions
+from precompress import Precompressor
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+POLL_INTERVAL = 0.5
+# Editors often save in several steps (truncate, write, rename)
+DEBOUNCE = 0.05
+
+def watched_files(paths):
+    """Expand catalog directories into the .json/.jsonl files they hold"""
+
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix in (".json", ".jsonl")))
+        else:
+            files.append(path)
+    return files
+
+def snapshot(paths):
+    """(mtime, size) of every watched file; missing files map to None"""
+
+    stamps = {}
+    for path in watched_files(paths):
+        try:
+            stat = path.stat()
+            stamps[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamps[str(path)] = None
+    return stamps
+
+class _WakeHandler(FileSystemEventHandler):
+    """Sets an event on any filesystem change in a watched directory"""
+
+    def __init__(self, wake):
+        super().__init__()
+        self.wake = wake
+
+    def on_any_event(self, event):
+        self.wake.set()
+
+def watch(paths, on_change, interval=POLL_INTERVAL, polling=False):
+    """Call on_change(changed_paths) whenever a watched file changes, until interrupted"""
+
+    paths = [Path(path) for path in paths]
+    wake = threading.Event()
+    observer = None
+
+    if Observer is not None and not polling:
+        observer = Observer()
+        handler = _WakeHandler(wake)
+        for directory in sorted({path if path.is_dir() else path.parent for path in paths}):
+            observer.schedule(handler, str(directory), recursive=False)
+        observer.start()
+        mode = "filesystem events"
+    else:
+        mode = f"polling every {interval}s; pip install watchdog for instant rebuilds"
+
+    print(f"\n👀 Watching {', '.join(str(path) for path in paths)} ({mode}); Ctrl+C to stop")
+
+    previous = snapshot(paths)
+    try:
+        while True:
+            # The timeout keeps Ctrl+C responsive and doubles as the polling interval
+            if wake.wait(timeout=interval):
+                time.sleep(DEBOUNCE)
+                wake.clear()
+
+            current = snapshot(paths)
+            if current != previous:
+                changed = sorted(path for path in current.keys() | previous.keys()
+                                 if current.get(path) != previous.get(path))
+                previous = current
+                on_change(changed)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+def watch_checklists(load, data_path, output_dir, layout, region_slugs=None, minify=False, polling=False,
+                     precompress=False, pdf=False, jobs=1):
+    """Rebuild changed checklists on every save of the catalog or region table
+
+    With precompress the .gz/.br siblings, and with pdf the PDFs, of the
+    rebuilt files are refreshed after each rebuild so none are left stale.
+    """
+
+    # One manifest for the whole session: unchanged checklists are skipped without touching disk
+    manifest = BuildManifest()
+    sources = [data_path] if region_slugs is None else [data_path, REGIONS_PATH]
+
+    def rebuild(changed):
+        started = time.perf_counter()
+        print(f"\n🔄 Changed: {', '.join(Path(path).name for path in changed)}")
+
+        try:
+            checklists = load(data_path)
+            regions = None if region_slugs is None else load_regions(slugs=region_slugs)
+        except (ChecklistDataError, ValueError, OSError) as e:
+            # Usually a half-saved file; the next save triggers another rebuild
+            print(f"❌ Not rebuilding: {e}")
+            return
+
+        # A fresh pool per rebuild; finish_precompress closes it
+        precompressor = Precompressor() if precompress else None
+        results = build_checklists(checklists, output_dir, layout, regions=regions, manifest=manifest,
+                                   precompressor=precompressor, minify=minify, show_unchanged=False)
+        rebuilt = [result for result in results if not result["skipped"]]
+        if pdf and rebuilt:
+            run_pdf_stage(rebuilt, jobs=jobs, precompressor=precompressor)
+        finish_precompress(precompressor)
+        print(f"⚡ {len(rebuilt)} of {len(results)} file(s) rebuilt in "
+              f"{(time.perf_counter() - started) * 1000:.1f} ms")
+
+    watch(sources, rebuild, polling=polling)
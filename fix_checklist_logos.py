@@ -4,36 +4,32 @@ Fix PDF checklist logos to match the exact styling from page headers
 Use height: 85px and width: auto for proper logo display
 """
 
+import argparse
 import os
-import re
 from pathlib import Path
 
-def fix_logo_styling_in_file(file_path):
-    """Fix logo styling to match header implementation"""
+from rewrite_rules import (
+    add_rewrite_arguments, load_rules, print_rewrite_report, rewrite_file, rewrite_options, run_rewrites
+)
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+# Rules from rewrite_rules.json, compiled once
+RULES = load_rules(names=["logo-image-css"])
 
-    # Update CSS for logo-image to match header styling
-    old_css_pattern = r'\.logo-image\s*\{[^}]*\}'
-    new_css = '''        .logo-image {
-            height: 85px;
-            width: auto;
-            margin-right: 15px;
-            clip-path: inset(0 0 12% 0);
-        }'''
+def fix_logo_styling_in_file(file_path, dry_run=False):
+    """Fix logo styling to match header implementation
 
-    content = re.sub(old_css_pattern, new_css, content, flags=re.DOTALL)
+    Returns the rewrite result: "changed", per-rule "hits" and "bytes_delta".
+    """
 
-    # Write the updated content back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-    return True
+    return rewrite_file(file_path, RULES, dry_run=dry_run)
 
 def main():
     """Fix logo styling in all checklist files"""
 
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    add_rewrite_arguments(parser)
+    args = parser.parse_args()
+
     # Path to PDF checklists
     pdf_dir = Path("public/checklists/assets/pdfs")
 
@@ -41,25 +37,11 @@ def main():
         print(f"❌ Directory not found: {pdf_dir}")
         return
 
-    # Get all HTML files
-    html_files = list(pdf_dir.glob("*.html"))
-
-    print(f"🔧 Fixing logo styling in {len(html_files)} checklist files")
+    print(f"🔧 Fixing logo styling in {pdf_dir}")
     print("=" * 60)
 
-    updated_count = 0
+    print_rewrite_report(RULES, run_rewrites(RULES, **rewrite_options(args)), args.dry_run)
 
-    for file_path in html_files:
-        try:
-            fix_logo_styling_in_file(file_path)
-            print(f"✅ Fixed logo styling: {file_path.name}")
-            updated_count += 1
-
-        except Exception as e:
-            print(f"❌ Error fixing {file_path.name}: {e}")
-
-    print("=" * 60)
-    print(f"🎯 LOGO STYLING FIX COMPLETE: {updated_count}/{len(html_files)} files updated")
     print("📏 Updated to match header styling: height: 85px, width: auto")
     print("✂️ Clean clipping maintained: clip-path: inset(0 0 12% 0)")
 
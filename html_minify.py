@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Streaming HTML minifier for generated checklists
+Strips comments, collapses indentation between block-level tags and
+compacts inline <style> CSS. <pre>, <script> and <textarea> contents are
+passed through untouched. Input can be fed in chunks; only complete
+tokens are emitted, so output can be written while it is produced.
+"""
+
+import re
+
+BLOCK_TAGS = frozenset((
+    "!doctype", "html", "head", "body", "title", "meta", "link", "style", "script", "base",
+    "div", "p", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li", "dl", "dt", "dd",
+    "table", "thead", "tbody", "tfoot", "tr", "td", "th", "caption", "colgroup", "col",
+    "header", "footer", "section", "article", "aside", "nav", "main", "figure", "figcaption",
+    "form", "fieldset", "legend", "blockquote", "hr", "br", "pre", "textarea", "noscript",
+))
+
+RAW_TAGS = ("pre", "script", "textarea", "style")
+
+_RAW_OPEN = re.compile(r"<(pre|script|textarea|style)\b", re.IGNORECASE)
+_RAW_ELEMENT = {
+    name: re.compile(rf"<{name}\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*>(.*?)</{name}\s*>", re.IGNORECASE | re.DOTALL)
+    for name in RAW_TAGS
+}
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+# A '<' only opens a tag when a name, '/', '!' or '?' follows; otherwise it is text, as in "1 < 2"
+_TAG = re.compile(r"<(?=[a-zA-Z/!?])(?:[^>\"']|\"[^\"]*\"|'[^']*')*>")
+_TAG_NAME = re.compile(r"</?\s*(!?[a-zA-Z0-9-]+)")
+_TAG_SPACE = re.compile(r"(\"[^\"]*\"|'[^']*')|\s+")
+_TEXT = re.compile(r"[^<]+")
+_WHITESPACE = re.compile(r"\s+")
+
+_CSS_TOKEN = re.compile(
+    r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')"  # strings are kept verbatim
+    r"|/\*.*?\*/"                                 # comments are dropped
+    r"|\s*;\s*(?=\})"                             # last semicolon in a block
+    r"|\s*([{};,>])\s*"                           # no space needed around punctuation
+    r"|(:)\s+"                                    # property: value
+    r"|(\s+)",                                    # any other run of whitespace
+    re.DOTALL,
+)
+
+def _css_token(match):
+    string, punctuation, colon, space = match.groups()
+    if string is not None:
+        return string
+    if punctuation is not None:
+        return punctuation
+    if colon is not None:
+        return colon
+    if space is not None:
+        return " "
+    return ""
+
+def minify_css(css):
+    """Drop comments and needless whitespace from a stylesheet"""
+
+    return _CSS_TOKEN.sub(_css_token, css).strip()
+
+def _tag_space(match):
+    return match.group(1) if match.group(1) is not None else " "
+
+def _is_block(tag):
+    match = _TAG_NAME.match(tag)
+    return match is not None and match.group(1).lower() in BLOCK_TAGS
+
+class HtmlMinifier:
+    """Incremental HTML minifier: feed() chunks, then close()"""
+
+    def __init__(self):
+        self._buffer = ""
+        # Whether the last emitted token was a block-level tag (or the document start)
+        self._after_block = True
+        self._pending_space = False
+
+    def feed(self, chunk):
+        """Consume a chunk of HTML and return the minified output that is ready"""
+
+        self._buffer += chunk
+        return self._drain(final=False)
+
+    def close(self):
+        """Flush whatever is left in the buffer"""
+
+        return self._drain(final=True)
+
+    def _emit_tag(self, out, tag, block):
+        # Whitespace before a block-level tag never renders
+        if self._pending_space and not (block or self._after_block):
+            out.append(" ")
+        self._pending_space = False
+        out.append(tag)
+        self._after_block = block
+
+    def _drain(self, final):
+        buffer = self._buffer
+        pos = 0
+        out = []
+
+        while pos < len(buffer):
+            if buffer[pos] != "<":
+                match = _TEXT.match(buffer, pos)
+                if match.end() == len(buffer) and not final:
+                    break
+                text = match.group()
+                core = text.strip()
+                if core:
+                    if (self._pending_space or text[0].isspace()) and not self._after_block:
+                        out.append(" ")
+                    out.append(_WHITESPACE.sub(" ", core))
+                    self._after_block = False
+                    self._pending_space = text[-1].isspace()
+                else:
+                    self._pending_space = True
+                pos = match.end()
+                continue
+
+            if buffer.startswith("<!--", pos):
+                match = _COMMENT.match(buffer, pos)
+                if match is None:
+                    if not final:
+                        break
+                    # Unterminated comment: drop the rest, as a browser would
+                    pos = len(buffer)
+                    continue
+                comment = match.group()
+                if comment.startswith("<!--[if") or comment.startswith("<!--!"):
+                    self._emit_tag(out, comment, self._after_block)
+                pos = match.end()
+                continue
+
+            raw = _RAW_OPEN.match(buffer, pos)
+            if raw is not None:
+                name = raw.group(1).lower()
+                match = _RAW_ELEMENT[name].match(buffer, pos)
+                if match is None:
+                    if not final:
+                        break
+                    # Unterminated raw element: pass the rest through untouched
+                    self._emit_tag(out, buffer[pos:], True)
+                    pos = len(buffer)
+                    continue
+                element = match.group()
+                if name == "style":
+                    start, end = match.span(1)
+                    open_tag = _TAG_SPACE.sub(_tag_space, buffer[pos:start])
+                    element = open_tag + minify_css(match.group(1)) + buffer[end:match.end()]
+                self._emit_tag(out, element, True)
+                pos = match.end()
+                continue
+
+            match = _TAG.match(buffer, pos)
+            if match is None:
+                if not final and ">" not in buffer[pos:]:
+                    break
+                # A stray '<' in text
+                if self._pending_space and not self._after_block:
+                    out.append(" ")
+                out.append("<")
+                self._after_block = False
+                self._pending_space = False
+                pos += 1
+                continue
+
+            tag = _TAG_SPACE.sub(_tag_space, match.group())
+            if tag.endswith(" />"):
+                tag = tag[:-3] + "/>"
+            elif tag.endswith(" >"):
+                tag = tag[:-2] + ">"
+            self._emit_tag(out, tag, _is_block(tag))
+            pos = match.end()
+
+        self._buffer = buffer[pos:]
+        return "".join(out)
+
+def minify_html(html):
+    """Minify a complete HTML document"""
+
+    minifier = HtmlMinifier()
+    return minifier.feed(html) + minifier.close()
+
+def iter_minified(chunks):
+    """Yield minified output for an iterable of HTML chunks"""
+
+    minifier = HtmlMinifier()
+    for chunk in chunks:
+        output = minifier.feed(chunk)
+        if output:
+            yield output
+    output = minifier.close()
+    if output:
+        yield output
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Parallel, cached image optimizer for the site's images
+Resizes every JPEG, PNG and WebP under public/images and temp-all-images
+to at most --max-width pixels wide and re-encodes it as WebP, AVIF and an
+optimized JPEG (PNG for images with transparency) across a process pool.
+Output mirrors each scanned directory under build/images and keeps the
+source's extension in its name (fire.jpg -> fire.jpg.webp), so x.jpg and
+x.png never collide and no source is overwritten. Encoded files are cached
+in .build-cache/images by a hash of the source bytes and the encode
+settings, so a rerun only hashes sources and copies cached bytes; the
+report shows bytes saved per directory by each image's smallest output.
+
+Requires: pip install Pillow (AVIF needs Pillow 11.3+ built with libavif)
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from atomic_write import atomic_write
+from checklist_build import resolve_jobs
+
+try:
+    from PIL import Image, ImageOps, UnidentifiedImageError, features
+except ImportError:
+    Image = None
+
+SOURCE_DIRS = (Path("public/images"), Path("temp-all-images"))
+OUTPUT_DIR = Path("build/images")
+CACHE_DIR = Path(".build-cache/images")
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+MAX_WIDTH = 1600
+# Pillow save options per output format; "jpeg" falls back to "png" for images with transparency
+FORMATS = {
+    "webp": {"quality": 80, "method": 6},
+    "avif": {"quality": 55, "speed": 6},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+DEFAULT_FORMATS = ("webp", "avif", "jpeg")
+EXTENSIONS = {"webp": ".webp", "avif": ".avif", "jpeg": ".jpg", "png": ".png"}
+
+def mirror_root(source_dir):
+    """The relative path a scanned directory is mirrored at under the output directory"""
+
+    path = Path(source_dir)
+    if path.is_absolute():
+        try:
+            path = path.resolve().relative_to(Path.cwd().resolve())
+        except ValueError:
+            raise ValueError(f"{source_dir}: image directories must be inside the working directory") from None
+    if ".." in path.parts:
+        raise ValueError(f"{source_dir}: image directories may not contain '..'")
+    return path
+
+def find_images(source_dirs):
+    """(source, path to mirror it at) for every image file under the source directories, sorted"""
+
+    images = []
+    for source_dir in source_dirs:
+        if not Path(source_dir).is_dir():
+            continue
+        root = mirror_root(source_dir)
+        images.extend((path, root / path.relative_to(source_dir)) for path in Path(source_dir).rglob("*")
+                      if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES)
+    return sorted(images)
+
+def supported_formats(formats):
+    """The requested formats this Pillow can write, warning about the rest"""
+
+    if Image is None:
+        raise RuntimeError("Pillow is not installed. Run: pip install Pillow")
+
+    supported = []
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+        if fmt in ("webp", "avif") and not features.check(fmt):
+            print(f"⚠️  Skipping {fmt.upper()}: this Pillow build cannot write it")
+            continue
+        supported.append(fmt)
+    return supported
+
+def encode_settings(formats, max_width):
+    """Everything besides the source bytes that decides the outputs"""
+
+    return json.dumps({"formats": {fmt: FORMATS[fmt] for fmt in formats}, "max_width": max_width,
+                       "fallback": FORMATS["png"]}, sort_keys=True)
+
+def cache_key(data, settings):
+    """Cache key for one source under one set of encode settings"""
+
+    digest = hashlib.sha256(data)
+    digest.update(b"\0")
+    digest.update(settings.encode("utf-8"))
+    return digest.hexdigest()
+
+def output_path(relative, output_dir, fmt):
+    """build/images/<relative path>.<ext>, e.g. public/images/fire.jpg -> build/images/public/images/fire.jpg.webp"""
+
+    relative = Path(relative)
+    return Path(output_dir) / relative.parent / f"{relative.name}{EXTENSIONS[fmt]}"
+
+def has_alpha(image):
+    """True for images with an alpha channel or a transparent palette entry"""
+
+    return "A" in image.getbands() or "transparency" in image.info
+
+def encode_image(data, formats, max_width):
+    """Resize and encode one image, returning (outputs by format, (width, height))"""
+
+    with Image.open(BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if has_alpha(image) else "RGB")
+        if image.width > max_width:
+            image = image.resize((max_width, round(image.height * max_width / image.width)), Image.LANCZOS)
+
+        outputs = {}
+        for fmt in formats:
+            if fmt == "jpeg" and image.mode == "RGBA":
+                fmt = "png"
+            buffer = BytesIO()
+            image.save(buffer, fmt.upper(), **FORMATS[fmt])
+            outputs[fmt] = buffer.getvalue()
+        return outputs, image.size
+
+def optimize_image(job):
+    """Optimize one source (in a worker process), writing its outputs and returning a result record"""
+
+    source, relative, output_dir, formats, max_width, force = job
+    result = {"path": str(source), "bytes": 0, "outputs": {}, "size": None, "cached": False,
+              "seconds": 0.0, "skipped": None, "error": None}
+    started = time.perf_counter()
+    try:
+        data = Path(source).read_bytes()
+        result["bytes"] = len(data)
+        key = cache_key(data, encode_settings(formats, max_width))
+        entry_path = CACHE_DIR / key[:2] / f"{key}.json"
+
+        outputs = None
+        if not force and entry_path.exists():
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+            cached = {fmt: CACHE_DIR / key[:2] / f"{key}{EXTENSIONS[fmt]}" for fmt in entry["formats"]}
+            if all(path.exists() for path in cached.values()):
+                outputs = {fmt: path.read_bytes() for fmt, path in cached.items()}
+                result["size"] = entry["size"]
+                result["cached"] = True
+
+        if outputs is None:
+            outputs, size = encode_image(data, formats, max_width)
+            result["size"] = list(size)
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            for fmt, content in outputs.items():
+                atomic_write(CACHE_DIR / key[:2] / f"{key}{EXTENSIONS[fmt]}", content)
+            # Written last: an entry only exists once all of its outputs do
+            atomic_write(entry_path, json.dumps({"source": str(source), "formats": list(outputs),
+                                                 "size": result["size"]}))
+
+        for fmt, content in outputs.items():
+            path = output_path(relative, output_dir, fmt)
+            if path.resolve() == Path(source).resolve():
+                raise ValueError(f"output {path} would overwrite its source")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, content)
+            result["outputs"][fmt] = len(content)
+    except UnidentifiedImageError:
+        # Empty files and HTML saved with an image extension exist among the sources
+        result["skipped"] = "not a readable image"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+def optimize_images(sources, output_dir=OUTPUT_DIR, formats=DEFAULT_FORMATS, max_width=MAX_WIDTH, jobs=0,
+                    force=False):
+    """Optimize (source, relative output path) pairs across a process pool, returning one result per source"""
+
+    work = [(source, relative, output_dir, list(formats), max_width, force) for source, relative in sources]
+    workers = min(resolve_jobs(jobs), max(1, len(work)))
+
+    if workers == 1:
+        return [optimize_image(job) for job in work]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(optimize_image, work))
+
+def print_image_report(results, formats):
+    """Print failures and per-directory byte savings; returns True if every image succeeded"""
+
+    totals = defaultdict(lambda: {"files": 0, "bytes": 0, "best": 0, **{fmt: 0 for fmt in formats}})
+    for result in results:
+        if result["error"]:
+            print(f"❌ {result['path']}: {result['error']}")
+            continue
+        if result["skipped"]:
+            print(f"⚠️  Skipped {result['path']}: {result['skipped']}")
+            continue
+        directory = totals[str(Path(result["path"]).parent)]
+        directory["files"] += 1
+        directory["bytes"] += result["bytes"]
+        directory["best"] += min(result["outputs"].values())
+        for fmt in formats:
+            # Transparent images carry a PNG where the JPEG would be
+            directory[fmt] += result["outputs"].get(fmt, result["outputs"].get("png", 0))
+
+    def kb(size):
+        return f"{size / 1024:,.0f}"
+
+    print(f"{'Directory':<36} {'Files':>5} {'Source KB':>10} "
+          + " ".join(f"{fmt.upper() + ' KB':>9}" for fmt in formats) + f" {'Saved KB':>9} {'Saved':>6}")
+    for name, directory in sorted(totals.items()):
+        saved = directory["bytes"] - directory["best"]
+        share = saved / directory["bytes"] if directory["bytes"] else 0.0
+        print(f"{name:<36} {directory['files']:>5} {kb(directory['bytes']):>10} "
+              + " ".join(f"{kb(directory[fmt]):>9}" for fmt in formats) + f" {kb(saved):>9} {share:>6.0%}")
+
+    ok = [result for result in results if not result["error"] and not result["skipped"]]
+    failed = sum(1 for result in results if result["error"])
+    source_bytes = sum(result["bytes"] for result in ok)
+    saved = source_bytes - sum(min(result["outputs"].values()) for result in ok)
+    cached = sum(1 for result in ok if result["cached"])
+    print("=" * 60)
+    print(f"📊 {len(ok)} image(s) optimized ({cached} from cache), "
+          f"{len(results) - len(ok) - failed} skipped, {failed} failed")
+    print(f"💾 {source_bytes / (1024 * 1024):.1f} MB of sources, {saved / (1024 * 1024):.1f} MB saved "
+          f"by the smallest format ({saved / source_bytes if source_bytes else 0.0:.0%})")
+    return not failed
+
+def main():
+    """Optimize the site's image directories"""
+
+    parser = argparse.ArgumentParser(description="Resize and re-encode site images to WebP/AVIF/JPEG with caching")
+    parser.add_argument("dirs", nargs="*", type=Path,
+                        help=f"image directories (default: {', '.join(str(d) for d in SOURCE_DIRS)})")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help=f"output directory (default: {OUTPUT_DIR})")
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS),
+                        help=f"comma-separated output formats (default: {','.join(DEFAULT_FORMATS)})")
+    parser.add_argument("--max-width", type=int, default=MAX_WIDTH,
+                        help=f"downscale wider images to this width (default: {MAX_WIDTH})")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="worker processes (0 = one per CPU, the default)")
+    parser.add_argument("--force", action="store_true", help="re-encode even when the cache has the outputs")
+    args = parser.parse_args()
+
+    try:
+        formats = supported_formats([fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()])
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    if not formats:
+        print("❌ No supported output formats")
+        raise SystemExit(1)
+
+    try:
+        source_dirs = args.dirs or SOURCE_DIRS
+        for source_dir in source_dirs:
+            # Outputs written inside a scanned directory would be picked up as sources next run
+            if args.output.resolve().is_relative_to(Path(source_dir).resolve()):
+                raise ValueError(f"--output {args.output} is inside the scanned directory {source_dir}")
+        sources = find_images(source_dirs)
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    if not sources:
+        print("❌ No images found")
+        return
+
+    print(f"🖼️  Optimizing {len(sources)} image(s) into {args.output} ({', '.join(formats)})")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    results = optimize_images(sources, args.output, formats, args.max_width, args.jobs, args.force)
+    ok = print_image_report(results, formats)
+    print(f"⏱️  {time.perf_counter() - started:.2f}s")
+
+    if not ok:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
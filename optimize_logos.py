@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Right-size the checklist header logo
+The checklists display images/logos/prism-logo-1000.png at 85px high, so
+every page and PDF pulls in the full 1344x768 source. This derives PNG and
+WebP variants at 1x and 2x the displayed height next to the source, then
+rewrites each checklist's <img class="logo-image"> into a <picture> with
+srcset and explicit width/height. Variants are cached by the source's
+content hash (and the sizing settings) in .build-cache/logo-variants.json,
+so reruns only rewrite tags and never touch Pillow.
+
+Requires (to derive new variants): pip install Pillow
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from io import BytesIO
+from pathlib import Path
+
+from atomic_write import atomic_write
+from rewrite_rules import (
+    RewriteRule, add_rewrite_arguments, print_rewrite_report, rewrite_options, run_rewrites
+)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+LOGO_SOURCE = Path("public/images/logos/prism-logo-1000.png")
+DISPLAY_HEIGHT = 85
+SCALES = (1, 2)
+# Pillow save options per output format
+FORMATS = {
+    "webp": {"quality": 90, "method": 6},
+    "png": {"optimize": True},
+}
+CACHE_PATH = Path(".build-cache/logo-variants.json")
+CHECKLIST_DIR = Path("public/checklists/assets/pdfs")
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+def variant_settings(height=DISPLAY_HEIGHT, scales=SCALES):
+    """Everything besides the source that decides the variants' bytes"""
+
+    return json.dumps({"height": height, "scales": list(scales), "formats": FORMATS}, sort_keys=True)
+
+def variant_path(source, height, scale, fmt):
+    """prism-logo-1000.png -> prism-logo-1000-85h@2x.webp, next to the source"""
+
+    suffix = "" if scale == 1 else f"@{scale}x"
+    return Path(source).with_name(f"{Path(source).stem}-{height}h{suffix}.{fmt}")
+
+def load_cache(path=CACHE_PATH):
+    """Source path -> cached variant record, or an empty dict"""
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable logo cache {path}: {e}")
+        return {}
+
+def cached_variants(source=LOGO_SOURCE, height=DISPLAY_HEIGHT, scales=SCALES, cache_path=CACHE_PATH):
+    """The cached record for source if it is still valid, else None"""
+
+    entry = load_cache(cache_path).get(str(source))
+    if (entry is None or entry["settings"] != variant_settings(height, scales)
+            or not Path(source).exists() or entry["sha256"] != file_hash(source)):
+        return None
+    if not all(Path(variant["path"]).exists() for variant in entry["variants"]):
+        return None
+    return entry
+
+def derive_variants(source=LOGO_SOURCE, height=DISPLAY_HEIGHT, scales=SCALES, cache_path=CACHE_PATH,
+                    force=False):
+    """Create (or reuse) the logo variants, returning (record, was_cached)"""
+
+    if not force and (entry := cached_variants(source, height, scales, cache_path)) is not None:
+        return entry, True
+
+    if Image is None:
+        raise RuntimeError("Pillow is not installed. Run: pip install Pillow")
+
+    variants = []
+    with Image.open(source) as image:
+        image.load()
+        # Keep transparency if the source has any; drop palettes and CMYK
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+        for scale in scales:
+            size = (round(image.width * height * scale / image.height), height * scale)
+            resized = image.resize(size, Image.LANCZOS)
+            for fmt, options in FORMATS.items():
+                path = variant_path(source, height, scale, fmt)
+                buffer = BytesIO()
+                resized.save(buffer, fmt.upper(), **options)
+                atomic_write(path, buffer.getvalue())
+                variants.append({"path": str(path), "format": fmt, "scale": scale, "width": size[0],
+                                 "height": size[1], "bytes": path.stat().st_size})
+
+    entry = {"sha256": file_hash(source), "settings": variant_settings(height, scales),
+             "source_bytes": Path(source).stat().st_size, "variants": variants}
+
+    cache = load_cache(cache_path)
+    cache[str(source)] = entry
+    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(cache_path, json.dumps(cache, indent=2, sort_keys=True))
+    return entry, False
+
+def picture_tag(entry, html_dir=CHECKLIST_DIR):
+    """<picture> markup for the variants, with URLs relative to html_dir
+
+    Like the logo-image-path rule, the <img> carries no alt text, so a
+    logo that fails to load never prints its fallback text in a PDF.
+    """
+
+    def url(variant):
+        return Path(os.path.relpath(variant["path"], html_dir)).as_posix()
+
+    def srcset(fmt):
+        return ", ".join(f"{url(variant)} {variant['scale']}x" for variant in entry["variants"]
+                         if variant["format"] == fmt)
+
+    fallback = min((variant for variant in entry["variants"] if variant["format"] == "png"),
+                   key=lambda variant: variant["scale"])
+    return (f'<picture class="logo-picture">'
+            f'<source type="image/webp" srcset="{srcset("webp")}">'
+            f'<img src="{url(fallback)}" srcset="{srcset("png")}" width="{fallback["width"]}" '
+            f'height="{fallback["height"]}" class="logo-image">'
+            f'</picture>')
+
+def logo_rule(entry, html_dir=CHECKLIST_DIR):
+    """Rewrite rule replacing a bare logo <img> (or an earlier <picture>) with the current variants"""
+
+    return RewriteRule(
+        "logo-srcset",
+        r'<picture class="logo-picture">.*?</picture>|<img\b[^>]*\bclass="logo-image"[^>]*>',
+        # Literal replacement: escape anything re.sub would treat as a group reference
+        picture_tag(entry, html_dir).replace("\\", "\\\\"),
+        [f"{Path(html_dir).as_posix()}/*.html"],
+        flags=["DOTALL"],
+        description="Serve the right-sized logo variants with srcset and explicit dimensions",
+        prefilter=["logo-image"],
+    )
+
+def cached_logo_rule(source=LOGO_SOURCE, html_dir=CHECKLIST_DIR):
+    """The logo rule if the variants have already been derived, else None (never needs Pillow)"""
+
+    entry = cached_variants(source)
+    return None if entry is None else logo_rule(entry, html_dir)
+
+def print_variant_report(entry, cached):
+    """Print each variant's size against the source's"""
+
+    print(f"🖼️  Logo variants{' (cached)' if cached else ''}, source {entry['source_bytes'] / 1024:.1f} KB")
+    for variant in entry["variants"]:
+        print(f"   {variant['path']}: {variant['width']}x{variant['height']}, {variant['bytes'] / 1024:.1f} KB")
+
+def main():
+    """Derive the logo variants and point every checklist at them"""
+
+    parser = argparse.ArgumentParser(description="Derive right-sized logo variants and rewrite checklist logos")
+    add_rewrite_arguments(parser)
+    parser.add_argument("--source", type=Path, default=LOGO_SOURCE, help=f"logo image (default: {LOGO_SOURCE})")
+    parser.add_argument("--height", type=int, default=DISPLAY_HEIGHT,
+                        help=f"displayed logo height in CSS pixels (default: {DISPLAY_HEIGHT})")
+    parser.add_argument("--force", action="store_true", help="re-derive variants even if the cache is current")
+    args = parser.parse_args()
+
+    if not CHECKLIST_DIR.exists():
+        print(f"❌ Directory not found: {CHECKLIST_DIR}")
+        return
+
+    try:
+        entry, cached = derive_variants(args.source, args.height, force=args.force)
+    except Exception as e:
+        print(f"❌ Could not derive logo variants: {e}")
+        raise SystemExit(1)
+
+    print_variant_report(entry, cached)
+    print(f"🔍 Rewriting logos in {CHECKLIST_DIR}")
+    print("=" * 60)
+
+    rules = [logo_rule(entry)]
+    if not print_rewrite_report(rules, run_rewrites(rules, **rewrite_options(args)), args.dry_run):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
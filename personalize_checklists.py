@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Batch renderer for personalised checklists
+Reads leads (as produced by the GHL webhook: email, phone, zip,
+checklist_type and optionally name, city or region) from a JSONL file or
+stdin, renders each lead's checklist with their name and regional phone
+number through create_pdf_template, and writes it into a sharded output
+tree. Leads are read lazily and only a bounded number of batches is in
+flight across the worker pool, so memory stays flat however long the
+queue is; reading pauses whenever the workers fall behind.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+
+from atomic_write import atomic_write
+from checklist_build import resolve_jobs
+from checklist_loader import DATA_PATH, load_checklists, load_regions
+from checklist_rewrites import apply_build_rewrites, load_build_rules
+from checklist_template import lead_label, variant_stem
+from generate_pdfs import create_pdf_template
+
+OUTPUT_DIR = Path("build/personalized")
+BATCH_SIZE = 64
+
+# checklist_type values sent by the lead forms, as in api/ghl-webhook.js
+CHECKLIST_TYPES = {
+    "fire_damage": "fire-damage-first-48-hours",
+    "water_damage": "water-emergency-save-what-matters",
+    "document_recovery": "document-recovery-critical-papers",
+    "lightning_strike": "lightning-strike-power-surge-protection",
+}
+
+# First three ZIP digits -> region slug; anything else gets the default header
+ZIP_REGIONS = {
+    **dict.fromkeys(("200", "202", "203", "204", "205"), "washington-dc"),
+    **dict.fromkeys(("201", "220", "221", "222", "223"), "northern-virginia"),
+    **dict.fromkeys(("215", "217"), "western-maryland"),
+    **dict.fromkeys(("206", "207", "208", "209", "210", "211", "212", "214", "216", "218", "219"), "maryland"),
+}
+
+# Rendered in place of a lead's name so one rewritten document serves every lead of a variant
+LEAD_MARKER = "\0lead\0"
+
+# Per-process state, loaded once by _init_worker
+_worker = {}
+
+def read_leads(source):
+    """Yield (line number, lead dict or error message) from a JSONL file, or stdin for '-'"""
+
+    f = sys.stdin if str(source) == "-" else open(source, 'r', encoding='utf-8')
+    try:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                lead = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, f"invalid JSON: {e}"
+                continue
+            yield line_number, lead if isinstance(lead, dict) else "expected a JSON object"
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+def batched(iterable, size):
+    """Lists of up to size items, read from iterable only as each batch is requested"""
+
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def lead_name(lead):
+    """The lead's name, falling back to the webhook's first-name-from-email rule"""
+
+    for field in ("name", "firstName", "first_name"):
+        if isinstance(lead.get(field), str) and lead[field].strip():
+            return lead[field].strip()
+
+    email = lead.get("email")
+    if isinstance(email, str) and "@" in email:
+        first = email.split("@")[0].split(".")[0]
+        return first[:1].upper() + first[1:]
+
+    return None
+
+def lead_region_slug(lead):
+    """Explicit region slug, else one looked up from the ZIP code, else None"""
+
+    if lead.get("region"):
+        return lead["region"]
+
+    return ZIP_REGIONS.get(str(lead.get("zip", "")).strip()[:3])
+
+def lead_checklist(lead):
+    """The checklist file name a lead asked for"""
+
+    return lead.get("checklist") or CHECKLIST_TYPES.get(lead.get("checklist_type"))
+
+def output_path(output_dir, lead, checklist, region):
+    """Sharded output path; the same lead and checklist always map to the same file"""
+
+    identity = json.dumps([lead.get("id") or lead.get("email") or lead, checklist["filename"],
+                           region["slug"] if region else None], sort_keys=True)
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    return Path(output_dir) / digest[:2] / f"{variant_stem(checklist, region)}-{digest[2:14]}.html"
+
+def _init_worker(data_path):
+    _worker["checklists"] = {checklist["filename"]: checklist for checklist in load_checklists(data_path)}
+    _worker["regions"] = {region["slug"]: region for region in load_regions()}
+    _worker["rules"] = load_build_rules()
+    _worker["variants"] = {}
+
+def variant_document(checklist, region, personal=True):
+    """Rewritten document bytes for a checklist variant, cached per worker
+
+    Personal variants come back as (before, after) halves split where the
+    lead's label goes; the rest come back as the whole document.
+    """
+
+    key = (checklist["filename"], region["slug"] if region else None, personal)
+    document = _worker["variants"].get(key)
+    if document is None:
+        lead = {"name": LEAD_MARKER} if personal else None
+        body = apply_build_rewrites(create_pdf_template(checklist, region, lead), checklist, region,
+                                    _worker["rules"])
+        document = tuple(body.split(LEAD_MARKER.encode("utf-8"))) if personal else body
+        if personal and len(document) != 2:
+            raise RuntimeError(f"{checklist['filename']}: the template has no single place for the lead's name")
+        _worker["variants"][key] = document
+    return document
+
+def render_batch(batch, output_dir):
+    """Render and write one batch of leads, returning one small result record per lead"""
+
+    checklists, regions = _worker["checklists"], _worker["regions"]
+    results = []
+
+    for line_number, lead in batch:
+        result = {"line": line_number, "path": None, "written": False, "bytes": 0, "error": None}
+        try:
+            if isinstance(lead, str):
+                raise ValueError(lead)
+
+            name = lead_checklist(lead)
+            checklist = checklists.get(name)
+            if checklist is None:
+                raise ValueError(f"unknown checklist {name or lead.get('checklist_type')!r}")
+
+            slug = lead_region_slug(lead)
+            region = regions.get(slug) if slug else None
+            if slug and region is None:
+                raise ValueError(f"unknown region {slug!r}")
+
+            # Same bytes as rendering and rewriting each lead's copy, without re-running the rules
+            label = lead_label({"name": lead_name(lead), "city": lead.get("city")})
+            if label is None:
+                body = variant_document(checklist, region, personal=False)
+            else:
+                before, after = variant_document(checklist, region)
+                body = before + html.escape(label).encode("utf-8") + after
+
+            path = output_path(output_dir, lead, checklist, region)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            result["written"] = atomic_write(path, body)
+            result.update(path=str(path), bytes=len(body), email=lead.get("email"),
+                          checklist=checklist["filename"], region=slug)
+        except Exception as e:
+            result["error"] = str(e) if isinstance(e, ValueError) else f"{type(e).__name__}: {e}"
+        results.append(result)
+
+    return results
+
+class BatchReport:
+    """Running totals, printed as the batch progresses and at the end"""
+
+    def __init__(self, results_file=None, progress_every=5000):
+        self.results_file = results_file
+        self.progress_every = progress_every
+        self.started = time.perf_counter()
+        self.rendered = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.bytes = 0
+        self.errors = []
+
+    @property
+    def documents(self):
+        return self.rendered + self.failed
+
+    def add(self, results):
+        before = self.documents
+        for result in results:
+            if result["error"]:
+                self.failed += 1
+                if len(self.errors) < 20:
+                    self.errors.append(result)
+            else:
+                self.rendered += 1
+                self.unchanged += not result["written"]
+                self.bytes += result["bytes"]
+            if self.results_file is not None:
+                self.results_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+        if self.documents // self.progress_every > before // self.progress_every:
+            elapsed = time.perf_counter() - self.started
+            print(f"   … {self.documents:,} lead(s), {self.documents / elapsed:,.0f} docs/s")
+
+    def finish(self):
+        elapsed = time.perf_counter() - self.started
+        print("=" * 60)
+        for result in self.errors:
+            print(f"❌ Line {result['line']}: {result['error']}")
+        if self.failed > len(self.errors):
+            print(f"   … and {self.failed - len(self.errors)} more failure(s)")
+        print(f"📊 {self.rendered:,} rendered ({self.unchanged:,} already identical on disk), "
+              f"{self.failed:,} failed, {self.bytes / (1024 * 1024):.1f} MB")
+        rate = self.documents / elapsed if elapsed else 0.0
+        print(f"⚡ {self.documents:,} lead(s) in {elapsed:.2f}s: {rate:,.0f} documents/second")
+        return not self.failed
+
+def run_batch(leads, output_dir=OUTPUT_DIR, jobs=1, batch_size=BATCH_SIZE, max_pending=None,
+              data_path=DATA_PATH, report=None):
+    """Render every lead, keeping at most max_pending batches in flight; returns the report"""
+
+    report = report or BatchReport()
+    workers = resolve_jobs(jobs)
+    batches = batched(leads, batch_size)
+
+    if workers == 1:
+        _init_worker(data_path)
+        for batch in batches:
+            report.add(render_batch(batch, output_dir))
+        return report
+
+    # Enough queued work to keep every worker busy, but no more
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data_path,)) as executor:
+        pending = set()
+        for batch in batches:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.add(future.result())
+            pending.add(executor.submit(render_batch, batch, output_dir))
+
+        for future in wait(pending).done:
+            report.add(future.result())
+
+    return report
+
+def main():
+    """Render personalised checklists for a lead file"""
+
+    parser = argparse.ArgumentParser(description="Render a personalised checklist for every lead in a JSONL file")
+    parser.add_argument("leads", help="JSONL lead file, or - to read leads from stdin")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help=f"output directory (default: {OUTPUT_DIR})")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="worker processes (0 = one per CPU, the default)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help=f"leads per worker task (default: {BATCH_SIZE})")
+    parser.add_argument("--max-pending", type=int, help="batches in flight before reading pauses (default: 2 per worker)")
+    parser.add_argument("--data", type=Path, default=DATA_PATH, help="checklist catalog file or directory")
+    parser.add_argument("--results", type=Path, help="write one JSON result line per lead (path, email, error)")
+    args = parser.parse_args()
+
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    print(f"📬 Rendering personalised checklists into {args.output}")
+    print("=" * 60)
+
+    results_file = open(args.results, 'w', encoding='utf-8') if args.results else None
+    try:
+        report = run_batch(read_leads(args.leads), args.output, args.jobs, args.batch_size, args.max_pending,
+                           args.data, BatchReport(results_file))
+    finally:
+        if results_file is not None:
+            results_file.close()
+
+    if not report.finish():
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Mapping-table phone number replacement for Prism Specialties DMV pages
+All old numbers are matched in one linear scan of the content, in any
+formatting ((301) 215-3191, 301-215-3191, 301.215.3191, tel:+13012153191),
+and replaced with the mapped number using the same formatting.
+Replacements are counted in the same pass. Content may be str or any
+bytes-like object (bytes, mmap); the pattern is ASCII-only.
+"""
+
+import re
+
+def normalize_number(number):
+    """Reduce a phone number in any formatting to its 10 digits"""
+
+    digits = re.sub(r"\D", "", number)
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    if len(digits) != 10:
+        raise ValueError(f"Not a 10-digit NANP phone number: {number!r}")
+    return digits
+
+class PhoneMapper:
+    """Replace many old phone numbers with their new numbers in a single scan"""
+
+    def __init__(self, mapping):
+        self.mapping = {normalize_number(old): normalize_number(new) for old, new in mapping.items()}
+
+        # Area codes form the only alternation, so unrelated digit runs fail fast;
+        # the leading lookahead rejects every position that cannot start a number
+        area_codes = "|".join(sorted({old[:3] for old in self.mapping}))
+        self.pattern = re.compile(
+            r"(?=[(+\d])(?<![\d])"
+            r"(?P<country>\+?1[ .-]?)?"
+            r"(?P<open>\()?(?P<area>" + area_codes + r")(?(open)\))"
+            r"(?P<sep1>[ .-]?)(?P<exchange>\d{3})(?P<sep2>[ .-]?)(?P<line>\d{4})"
+            r"(?![\d])",
+            re.ASCII,
+        )
+        self.byte_pattern = re.compile(self.pattern.pattern.encode("ascii"))
+
+    def replace(self, content):
+        """Return (new_content, replacement_count) for one piece of content"""
+
+        count = 0
+        binary = not isinstance(content, str)
+
+        def substitute(match):
+            nonlocal count
+            groups = match.groupdict(b"" if binary else "")
+            if binary:
+                groups = {name: value.decode("ascii") for name, value in groups.items()}
+
+            new = self.mapping.get(groups["area"] + groups["exchange"] + groups["line"])
+            if new is None:
+                return match.group(0)
+
+            count += 1
+            area = f"({new[:3]})" if groups["open"] else new[:3]
+            number = f"{groups['country']}{area}{groups['sep1']}{new[3:6]}{groups['sep2']}{new[6:]}"
+            return number.encode("ascii") if binary else number
+
+        pattern = self.byte_pattern if binary else self.pattern
+        return pattern.sub(substitute, content), count
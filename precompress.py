@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Pre-compressed .gz and .br siblings for generated checklist assets
+Files are compressed at maximum level on a background thread pool as the
+generators produce them, so the CDN never has to compress on the fly.
+Siblings newer than their source are left alone.
+
+Brotli output requires: pip install brotli
+"""
+
+import argparse
+import gzip
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from atomic_write import atomic_write
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".svg", ".pdf", ".json")
+
+def _gzip(data):
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def _brotli(data):
+    return brotli.compress(data, quality=11)
+
+ENCODERS = {"gz": _gzip, "br": _brotli}
+
+def available_formats(formats=("gz", "br")):
+    """Drop brotli with a warning when the module is not installed"""
+
+    if "br" in formats and brotli is None:
+        print("⚠️  brotli is not installed (pip install brotli); writing .gz siblings only")
+        return tuple(fmt for fmt in formats if fmt != "br")
+
+    return tuple(formats)
+
+def is_sibling_current(source, sibling):
+    """True when the compressed sibling exists and is newer than its source"""
+
+    return sibling.exists() and sibling.stat().st_mtime >= source.stat().st_mtime
+
+def compress_file(path, formats=("gz", "br"), force=False):
+    """Write compressed siblings for one file, returning a result record"""
+
+    path = Path(path)
+    result = {"path": str(path), "bytes": 0, "compressed": {}, "skipped": [], "error": None}
+    started = time.perf_counter()
+
+    try:
+        data = None
+        result["bytes"] = path.stat().st_size
+
+        for fmt in formats:
+            sibling = path.with_name(f"{path.name}.{fmt}")
+            if not force and is_sibling_current(path, sibling):
+                result["skipped"].append(fmt)
+                result["compressed"][fmt] = sibling.stat().st_size
+                continue
+
+            if data is None:
+                data = path.read_bytes()
+
+            encoded = ENCODERS[fmt](data)
+            if not atomic_write(sibling, encoded):
+                # Source was rewritten with identical bytes; the sibling already matches
+                result["skipped"].append(fmt)
+            result["compressed"][fmt] = len(encoded)
+
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+class Precompressor:
+    """Thread pool that compresses files in the background as they are submitted"""
+
+    def __init__(self, formats=("gz", "br"), workers=None, force=False):
+        self.formats = available_formats(formats)
+        self.force = force
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="precompress")
+        self._futures = []
+
+    def submit(self, path):
+        """Queue a produced file for compression"""
+
+        self._futures.append(self._executor.submit(compress_file, path, self.formats, self.force))
+
+    def close(self):
+        """Wait for all queued files and return their results in submission order"""
+
+        self._executor.shutdown(wait=True)
+        return [future.result() for future in self._futures]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._executor.shutdown(wait=True)
+
+def print_precompress_report(results):
+    """Print compressed sizes per format and return True if all succeeded"""
+
+    totals = {}
+    written = 0
+    skipped = 0
+    source_bytes = 0
+    errors = [result for result in results if result["error"]]
+
+    for result in results:
+        if result["error"]:
+            continue
+        source_bytes += result["bytes"]
+        for fmt, size in result["compressed"].items():
+            totals[fmt] = totals.get(fmt, 0) + size
+        written += len(result["compressed"]) - len(result["skipped"])
+        skipped += len(result["skipped"])
+
+    print("\n🗜️  Pre-compressed assets")
+    print("=" * 60)
+    print(f"Files: {len(results)}, siblings written: {written}, unchanged: {skipped}, errors: {len(errors)}")
+    print(f"Original: {source_bytes:,} bytes")
+    for fmt, size in sorted(totals.items()):
+        ratio = size / source_bytes if source_bytes else 0
+        print(f".{fmt}: {size:,} bytes ({ratio:.0%} of original)")
+    for result in errors:
+        print(f"❌ {result['path']}: {result['error']}")
+
+    return not errors
+
+def main():
+    """Pre-compress existing generated assets"""
+
+    parser = argparse.ArgumentParser(description="Write .gz/.br siblings for generated checklist assets")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="files or directories (default: public/checklists/assets/pdfs)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="compression threads")
+    parser.add_argument("--force", action="store_true", help="recompress even if siblings are current")
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths or [Path("public/checklists/assets/pdfs")]:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix in COMPRESSIBLE_SUFFIXES))
+        else:
+            files.append(path)
+
+    with Precompressor(workers=args.jobs, force=args.force) as precompressor:
+        for file_path in files:
+            precompressor.submit(file_path)
+        results = precompressor.close()
+
+    if not print_precompress_report(results):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Pure-Python QR code encoder for checklist footers
+Encodes text in byte mode at the smallest version that fits, picks the
+mask with the lowest penalty and renders the symbol as a compact inline
+SVG. Rendered SVGs are cached on disk by URL hash, so rebuilding
+thousands of regional variants never re-encodes an identical code.
+"""
+
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+from atomic_write import atomic_write
+
+CACHE_DIR = Path(".build-cache/qr")
+
+ERROR_CORRECTION = "M"
+QUIET_ZONE = 4
+
+# Format-information bits for each error correction level
+_LEVEL_BITS = {"L": 1, "M": 0, "Q": 3, "H": 2}
+
+# Error correction codewords per block and number of blocks, indexed by version (ISO/IEC 18004 table 9)
+_ECC_PER_BLOCK = {
+    "L": (-1, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28,
+          28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    "M": (-1, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26,
+          26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    "Q": (-1, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30,
+          28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    "H": (-1, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28,
+          30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+}
+_BLOCKS = {
+    "L": (-1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8,
+          8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    "M": (-1, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16,
+          17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    "Q": (-1, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+          23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    "H": (-1, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+          25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+}
+
+_MASKS = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+# Finder-like pattern searched for by penalty rule 3, with its light margin on either side
+_FINDER_RUNS = ("10111010000", "00001011101")
+
+# In-process memo in front of the disk cache
+_svgs = {}
+
+def _gf_multiply(x, y):
+    """Multiply in GF(2^8) modulo x^8 + x^4 + x^3 + x^2 + 1"""
+
+    product = 0
+    for i in range(7, -1, -1):
+        product = (product << 1) ^ ((product >> 7) * 0x11D)
+        product ^= ((y >> i) & 1) * x
+    return product
+
+def _rs_divisor(degree):
+    """Reed-Solomon generator polynomial coefficients, highest power first (leading 1 omitted)"""
+
+    divisor = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            divisor[j] = _gf_multiply(divisor[j], root)
+            if j + 1 < degree:
+                divisor[j] ^= divisor[j + 1]
+        root = _gf_multiply(root, 0x02)
+    return divisor
+
+def _rs_remainder(data, divisor):
+    remainder = [0] * len(divisor)
+    for byte in data:
+        factor = byte ^ remainder.pop(0)
+        remainder.append(0)
+        for i, coefficient in enumerate(divisor):
+            remainder[i] ^= _gf_multiply(coefficient, factor)
+    return remainder
+
+def _raw_modules(version):
+    """Modules available for data and error correction codewords in a version"""
+
+    modules = (16 * version + 128) * version + 64
+    if version >= 2:
+        alignments = version // 7 + 2
+        modules -= (25 * alignments - 10) * alignments - 55
+        if version >= 7:
+            modules -= 36
+    return modules
+
+def _data_capacity(version, level):
+    """Data codewords that fit in a version at an error correction level"""
+
+    return _raw_modules(version) // 8 - _ECC_PER_BLOCK[level][version] * _BLOCKS[level][version]
+
+def _alignment_positions(version):
+    if version == 1:
+        return []
+    count = version // 7 + 2
+    step = 26 if version == 32 else (version * 4 + count * 2 + 1) // (count * 2 - 2) * 2
+    size = version * 4 + 17
+    return [6] + [size - 7 - i * step for i in range(count - 2, -1, -1)]
+
+def _encode_data(data, version, level):
+    """Byte-mode bit stream padded to the version's data capacity"""
+
+    bits = []
+
+    def append(value, length):
+        bits.extend((value >> i) & 1 for i in range(length - 1, -1, -1))
+
+    append(0b0100, 4)
+    append(len(data), 8 if version <= 9 else 16)
+    for byte in data:
+        append(byte, 8)
+
+    capacity = _data_capacity(version, level) * 8
+    bits.extend([0] * min(4, capacity - len(bits)))
+    bits.extend([0] * (-len(bits) % 8))
+
+    codewords = [int("".join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits), 8)]
+    pad = 0xEC
+    while len(codewords) < capacity // 8:
+        codewords.append(pad)
+        pad ^= 0xEC ^ 0x11
+    return codewords
+
+def _add_error_correction(codewords, version, level):
+    """Split data into blocks, append each block's ECC and interleave them"""
+
+    block_count = _BLOCKS[level][version]
+    ecc_length = _ECC_PER_BLOCK[level][version]
+    raw_codewords = _raw_modules(version) // 8
+    short_blocks = block_count - raw_codewords % block_count
+    short_length = raw_codewords // block_count
+    divisor = _rs_divisor(ecc_length)
+
+    blocks = []
+    start = 0
+    for i in range(block_count):
+        data = codewords[start:start + short_length - ecc_length + (0 if i < short_blocks else 1)]
+        start += len(data)
+        ecc = _rs_remainder(data, divisor)
+        if i < short_blocks:
+            # Placeholder so every block has the same length for interleaving
+            data = data + [0]
+        blocks.append(data + ecc)
+
+    result = []
+    for i in range(len(blocks[0])):
+        for j, block in enumerate(blocks):
+            if i != short_length - ecc_length or j >= short_blocks:
+                result.append(block[i])
+    return result
+
+def _row_bits(row):
+    """A row of booleans as an int, leftmost module in the highest bit"""
+
+    bits = 0
+    for dark in row:
+        bits = bits << 1 | dark
+    return bits
+
+_mask_cache = {}
+
+def _mask_rows(size, mask):
+    """Row bitmasks of the modules a mask pattern flips, before excluding function modules"""
+
+    key = (size, mask)
+    if key not in _mask_cache:
+        condition = _MASKS[mask]
+        _mask_cache[key] = [_row_bits([condition(x, y) for x in range(size)]) for y in range(size)]
+    return _mask_cache[key]
+
+_RUN = re.compile(r"0{5,}|1{5,}")
+
+def _penalty(rows, size):
+    """Mask penalty score (ISO/IEC 18004 section 7.8.3) of a symbol given as row bitmasks; lower is better"""
+
+    lines = [format(row, f"0{size}b") for row in rows]
+    lines += ["".join(column) for column in zip(*lines)]
+    penalty = 0
+
+    for line in lines:
+        for run in _RUN.findall(line):
+            penalty += len(run) - 2
+        for pattern in _FINDER_RUNS:
+            start = line.find(pattern)
+            while start != -1:
+                penalty += 40
+                start = line.find(pattern, start + 1)
+
+    full = (1 << size) - 1
+    for upper, lower in zip(rows, rows[1:]):
+        # Bit i set where modules i and i+1 of both rows are all dark (or all light)
+        dark = upper & lower
+        light = ~(upper | lower) & full
+        penalty += 3 * (bin(dark & dark >> 1).count("1") + bin(light & light >> 1).count("1"))
+
+    total = size * size
+    dark = sum(bin(row).count("1") for row in rows)
+    penalty += (abs(dark * 20 - total * 10) // total) * 10
+
+    return penalty
+
+class QrCode:
+    """A QR code symbol: a square grid of modules, True for dark"""
+
+    def __init__(self, text, level=ERROR_CORRECTION, mask=None):
+        data = text.encode("utf-8") if isinstance(text, str) else bytes(text)
+
+        for version in range(1, 41):
+            count_bits = 8 if version <= 9 else 16
+            if 4 + count_bits + len(data) * 8 <= _data_capacity(version, level) * 8:
+                break
+        else:
+            raise ValueError(f"Data too long for a QR code: {len(data)} bytes")
+
+        self.version = version
+        self.level = level
+        self.size = version * 4 + 17
+        self.modules = [[False] * self.size for _ in range(self.size)]
+        self._function = [[False] * self.size for _ in range(self.size)]
+
+        self._draw_function_patterns()
+        codewords = _add_error_correction(_encode_data(data, version, level), version, level)
+        self._draw_codewords(codewords)
+
+        if mask is None:
+            # Score every mask on row bitmasks instead of flipping the module grid eight times
+            function = [_row_bits(row) for row in self._function]
+            penalties = []
+            for candidate in range(8):
+                self._draw_format_bits(candidate)
+                patterns = _mask_rows(self.size, candidate)
+                rows = [_row_bits(row) ^ (pattern & ~reserved)
+                        for row, pattern, reserved in zip(self.modules, patterns, function)]
+                penalties.append(_penalty(rows, self.size))
+            mask = min(range(8), key=penalties.__getitem__)
+
+        self.mask = mask
+        self._apply_mask(mask)
+        self._draw_format_bits(mask)
+        del self._function
+
+    def _set_function(self, x, y, dark):
+        self.modules[y][x] = dark
+        self._function[y][x] = True
+
+    def _draw_function_patterns(self):
+        size = self.size
+
+        for i in range(size):
+            self._set_function(6, i, i % 2 == 0)
+            self._set_function(i, 6, i % 2 == 0)
+
+        # Finder patterns with their separators
+        for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+            for dy in range(-4, 5):
+                for dx in range(-4, 5):
+                    x, y = cx + dx, cy + dy
+                    if 0 <= x < size and 0 <= y < size:
+                        distance = max(abs(dx), abs(dy))
+                        self._set_function(x, y, distance not in (2, 4))
+
+        positions = _alignment_positions(self.version)
+        last = len(positions) - 1
+        for i, cx in enumerate(positions):
+            for j, cy in enumerate(positions):
+                # Skip the three corners taken by finder patterns
+                if (i, j) in ((0, 0), (0, last), (last, 0)):
+                    continue
+                for dy in range(-2, 3):
+                    for dx in range(-2, 3):
+                        self._set_function(cx + dx, cy + dy, max(abs(dx), abs(dy)) != 1)
+
+        # Reserve the format areas; real bits are drawn once the mask is known
+        self._draw_format_bits(0)
+        self._draw_version_bits()
+
+    def _draw_format_bits(self, mask):
+        data = _LEVEL_BITS[self.level] << 3 | mask
+        remainder = data
+        for _ in range(10):
+            remainder = (remainder << 1) ^ ((remainder >> 9) * 0x537)
+        bits = (data << 10 | remainder) ^ 0x5412
+
+        def bit(i):
+            return (bits >> i) & 1 == 1
+
+        size = self.size
+        for i in range(6):
+            self._set_function(8, i, bit(i))
+        self._set_function(8, 7, bit(6))
+        self._set_function(8, 8, bit(7))
+        self._set_function(7, 8, bit(8))
+        for i in range(9, 15):
+            self._set_function(14 - i, 8, bit(i))
+
+        for i in range(8):
+            self._set_function(size - 1 - i, 8, bit(i))
+        for i in range(8, 15):
+            self._set_function(8, size - 15 + i, bit(i))
+        # The dark module
+        self._set_function(8, size - 8, True)
+
+    def _draw_version_bits(self):
+        if self.version < 7:
+            return
+
+        remainder = self.version
+        for _ in range(12):
+            remainder = (remainder << 1) ^ ((remainder >> 11) * 0x1F25)
+        bits = self.version << 12 | remainder
+
+        for i in range(18):
+            dark = (bits >> i) & 1 == 1
+            a, b = self.size - 11 + i % 3, i // 3
+            self._set_function(a, b, dark)
+            self._set_function(b, a, dark)
+
+    def _draw_codewords(self, codewords):
+        """Place codeword bits in the two-column zigzag, skipping function modules"""
+
+        size = self.size
+        bit_count = len(codewords) * 8
+        i = 0
+        right = size - 1
+        while right >= 1:
+            if right == 6:
+                right = 5
+            upward = ((right + 1) & 2) == 0
+            for vertical in range(size):
+                y = size - 1 - vertical if upward else vertical
+                for x in (right, right - 1):
+                    if not self._function[y][x] and i < bit_count:
+                        self.modules[y][x] = (codewords[i >> 3] >> (7 - (i & 7))) & 1 == 1
+                        i += 1
+            right -= 2
+
+    def _apply_mask(self, mask):
+        condition = _MASKS[mask]
+        for y, row in enumerate(self.modules):
+            function = self._function[y]
+            for x in range(self.size):
+                if not function[x] and condition(x, y):
+                    row[x] = not row[x]
+
+    def svg(self, label=None):
+        """The symbol as a standalone SVG element, one path of horizontal runs"""
+
+        size = self.size + 2 * QUIET_ZONE
+        commands = []
+        for y, row in enumerate(self.modules):
+            x = 0
+            while x < self.size:
+                if not row[x]:
+                    x += 1
+                    continue
+                start = x
+                while x < self.size and row[x]:
+                    x += 1
+                commands.append(f"M{start + QUIET_ZONE} {y + QUIET_ZONE}h{x - start}v1h-{x - start}z")
+
+        aria = f' role="img" aria-label="{_escape(label)}"' if label else ""
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}"'
+                f' shape-rendering="crispEdges"{aria}>'
+                f'<rect width="{size}" height="{size}" fill="#fff"/>'
+                f'<path fill="#000" d="{"".join(commands)}"/></svg>')
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+
+def cache_path(url, level=ERROR_CORRECTION, cache_dir=None):
+    """Where the rendered SVG for a URL is cached (in CACHE_DIR unless cache_dir is given)"""
+
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+    return Path(cache_dir or CACHE_DIR) / f"{digest}-{level.lower()}.svg"
+
+def qr_svg(url, level=ERROR_CORRECTION, cache_dir=None):
+    """Inline SVG QR code pointing at url, from the in-process memo or disk cache when possible
+
+    The disk cache is CACHE_DIR, read at call time so callers such as the
+    benchmarks can point it elsewhere.
+    """
+
+    key = (url, level)
+    svg = _svgs.get(key)
+    if svg is not None:
+        return svg
+
+    path = cache_path(url, level, cache_dir)
+    try:
+        svg = path.read_text(encoding="utf-8")
+    except OSError:
+        svg = QrCode(url, level).svg(label=f"QR code for {url}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, svg)
+        except OSError:
+            # A read-only checkout still builds; it just re-encodes next time
+            pass
+
+    _svgs[key] = svg
+    return svg
+
+def main():
+    """Print the SVG QR code for a URL"""
+
+    if len(sys.argv) != 2:
+        print("Usage: python qr_code.py URL")
+        raise SystemExit(2)
+
+    print(qr_svg(sys.argv[1]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Bring the shipped checklist PDFs in line with the corrected HTML sources
+Applies the rewrite rules (phone numbers, logo fixes) to the HTML sources,
+then re-renders every PDF whose source changed in one batch through the
+pooled headless-Chromium renderer, reporting time and size per file.
+
+The PDFs the site links to were printed from checklists that have since
+been renamed, so SHIPPED_PDFS maps each served PDF to the checklist it is
+regenerated from. Only those PDFs are written; shipped PDFs without a
+source and PDFs the map does not know are listed and left as they are.
+
+Chrome-printed PDFs keep their text in compressed, subset-font streams,
+so they are regenerated from HTML rather than patched in place.
+
+Requires: pip install playwright && python -m playwright install chromium
+"""
+
+import argparse
+from pathlib import Path
+
+from checklist_pdf import is_pdf_current, print_pdf_report, render_pdfs
+from rewrite_rules import RULES_PATH, collect_files, load_rules, print_rewrite_report, rewrite_file
+
+PDF_DIR = Path("public/checklists/assets/pdfs")
+
+# Each PDF the site links to -> the checklist HTML (in the same directory) it is
+# regenerated from; None where no checklist covers the PDF's content
+SHIPPED_PDFS = {
+    "antique-furniture-emergency-care.pdf": None,
+    "art-antiques-emergency-protocol.pdf": "art-antiques-emergency-preservation.html",
+    "basement-flooding-response-plan.pdf": "basement-flood-emergency-pump-dry.html",
+    "business-continuity-after-disaster.pdf": None,
+    "complete-emergency-contact-list.pdf": None,
+    # Written by generate_pdfs.py
+    "document-recovery-priority-guide.pdf": "document-recovery-critical-papers.html",
+    "electronics-water-damage-response.pdf": "electronics-restoration-data-recovery.html",
+    "fire-damage-first-48-hours.pdf": "fire-damage-first-48-hours.html",
+    "home-emergency-preparedness.pdf": None,
+    "insurance-documentation-checklist.pdf": "insurance-claims-emergency-documentation.html",
+    "kitchen-fire-damage-protocol.pdf": "kitchen-emergency-appliance-damage.html",
+    "mold-prevention-quick-actions.pdf": "mold-prevention-immediate-response.html",
+    "photograph-memory-preservation.pdf": None,
+    "smoke-damage-assessment-guide.pdf": "smoke-damage-air-quality.html",
+    "storm-damage-immediate-actions.pdf": "storm-damage-structure-assessment.html",
+    "textile-fabric-damage-control.pdf": "textile-restoration-fabric-care.html",
+    "water-emergency-save-what-matters.pdf": "water-emergency-save-what-matters.html",
+}
+
+def shipped_pdfs(pdf_dir, mapping=SHIPPED_PDFS):
+    """Split the served PDFs into (pdf, source) pairs to regenerate, PDFs without a source,
+    and (pdf, source) pairs whose source file is missing"""
+
+    pdf_dir = Path(pdf_dir)
+    pairs, unsourced, missing = [], [], []
+    for pdf_name, source_name in sorted(mapping.items()):
+        pdf_file = pdf_dir / pdf_name
+        if source_name is None:
+            unsourced.append(pdf_file)
+        elif (pdf_dir / source_name).exists():
+            pairs.append((pdf_file, pdf_dir / source_name))
+        else:
+            missing.append((pdf_file, pdf_dir / source_name))
+    return pairs, unsourced, missing
+
+def unlisted_pdfs(pdf_dir, mapping=SHIPPED_PDFS):
+    """PDFs in pdf_dir that the site does not serve; never regenerated"""
+
+    return sorted(pdf for pdf in Path(pdf_dir).glob("*.pdf") if pdf.name not in mapping)
+
+def correct_sources(html_files, rules, dry_run=False):
+    """Apply every rule whose file globs cover each HTML source, returning rewrite results"""
+
+    sources = {html_file.resolve() for html_file in html_files}
+    results = []
+    for file_path, applicable in collect_files(rules).items():
+        if file_path.resolve() not in sources:
+            continue
+        try:
+            results.append(rewrite_file(file_path, applicable, dry_run))
+        except Exception as e:
+            results.append({"path": str(file_path), "changed": False, "hits": {}, "applied": {}, "seconds": {},
+                            "error": f"{type(e).__name__}: {e}"})
+    return results
+
+def print_size_changes(results, previous_sizes):
+    """Print how each regenerated PDF's size moved against the file it replaced"""
+
+    rendered = [result for result in results if result["ok"] and not result["skipped"]]
+    if not rendered:
+        return
+
+    print(f"\n{'regenerated PDF':<48} {'ms':>7} {'before':>10} {'after':>10}")
+    for result in rendered:
+        before = previous_sizes.get(result["path"])
+        before_text = f"{before:,}" if before is not None else "new"
+        print(f"{result['filename'][:48]:<48} {result['seconds'] * 1000:>7.0f} {before_text:>10} {result['bytes']:>10,}")
+
+    before_total = sum(previous_sizes.get(result["path"], 0) for result in rendered)
+    after_total = sum(result["bytes"] for result in rendered)
+    print(f"{'total':<48} {sum(r['seconds'] for r in rendered) * 1000:>7.0f} {before_total:>10,} {after_total:>10,}")
+
+def print_untouched(unsourced, missing, unlisted):
+    """List the PDFs this run left as they are, and why"""
+
+    if unsourced:
+        print(f"\n⚠️  {len(unsourced)} served PDF(s) have no source checklist and were left as they are:")
+        for pdf in unsourced:
+            print(f"   {pdf}")
+    if missing:
+        print(f"\n⚠️  {len(missing)} served PDF(s) have a source that does not exist yet (run generate_pdfs.py):")
+        for pdf, source in missing:
+            print(f"   {pdf} <- {source}")
+    if unlisted:
+        print(f"\nℹ️  {len(unlisted)} PDF(s) are not served by the site and were not regenerated:")
+        for pdf in unlisted:
+            print(f"   {pdf}")
+
+def main():
+    """Correct the HTML sources and regenerate their PDFs"""
+
+    parser = argparse.ArgumentParser(description="Apply rewrite rules to checklist sources and regenerate their PDFs")
+    parser.add_argument("--dir", type=Path, default=PDF_DIR, help=f"checklist directory (default: {PDF_DIR})")
+    parser.add_argument("--rules", type=Path, default=RULES_PATH, help="rules file (default: rewrite_rules.json)")
+    parser.add_argument("--pool", type=int, default=2, help="browser pages to render with in parallel")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every PDF, not just those older than their source")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args()
+
+    pairs, unsourced, missing = shipped_pdfs(args.dir)
+    if not pairs:
+        print(f"❌ No served PDFs with an HTML source in {args.dir}")
+        raise SystemExit(1)
+
+    pdf_files = [pdf_file for pdf_file, _ in pairs]
+    html_files = [html_file for _, html_file in pairs]
+    untouched = (unsourced, missing, unlisted_pdfs(args.dir))
+
+    rules = load_rules(args.rules)
+    sources = sorted(set(html_files))
+    print(f"🔧 Correcting {len(sources)} HTML source(s) with {len(rules)} rewrite rule(s)")
+    print("=" * 60)
+    corrections = correct_sources(sources, rules, args.dry_run)
+    ok = print_rewrite_report(rules, corrections, args.dry_run)
+
+    if args.dry_run:
+        corrected = {result["path"] for result in corrections if result["changed"]}
+        stale = [(pdf_file, html_file) for pdf_file, html_file in pairs
+                 if args.force or str(html_file) in corrected or not is_pdf_current(html_file, pdf_file)]
+        print(f"\n🖨️  Would regenerate {len(stale)} of {len(pairs)} served PDF(s)")
+        for pdf_file, html_file in stale:
+            print(f"   {pdf_file} <- {html_file.name}")
+        print_untouched(*untouched)
+        return
+
+    previous_sizes = {str(pdf_file): pdf_file.stat().st_size for pdf_file in pdf_files if pdf_file.exists()}
+
+    try:
+        results = render_pdfs(html_files, args.pool, args.force, pdf_files=pdf_files)
+    except Exception as e:
+        print(f"❌ PDF rendering failed: {e}")
+        raise SystemExit(1)
+
+    ok = print_pdf_report(results) and ok
+    print_size_changes(results, previous_sizes)
+    print_untouched(*untouched)
+
+    if not ok:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
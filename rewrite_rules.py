@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Rule-driven rewrite engine for generated checklist files
+Loads (pattern, replacement, file glob) rules from rewrite_rules.json,
+compiles them once and applies every matching rule to a file in a single
+read/write pass, reporting per-rule hit counts. Rules with
+"type": "phone-map" replace a whole table of phone numbers in one scan.
+--dry-run reports what would change without touching disk and --diff
+prints unified diffs of the changes. --site walks the configured site
+roots once and matches every file against each rule's "site_files" (or
+"files") globs, instead of globbing rule by rule. Files are scanned and rewritten as bytes through a read-only memory
+map: a rule runs only if one of its literal "prefilter" substrings and
+then its bytes regex match, so non-matching files are rejected without
+decoding or copying them. Patterns use ASCII semantics so the bytes and
+str forms of a rule agree.
+"""
+
+import argparse
+import difflib
+import fnmatch
+import json
+import mmap
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from atomic_write import atomic_write
+from phone_map import PhoneMapper
+
+RULES_PATH = Path(__file__).resolve().with_name("rewrite_rules.json")
+
+DEFAULT_SITE = {"roots": ["public", "geographic"], "include": ["*.html", "*.css"], "exclude_dirs": ["node_modules"]}
+
+def glob_regex(pattern):
+    """Compile a path glob where ** spans directories and * stays within one"""
+
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(parts) + r"\Z")
+
+def byte_pattern(pattern):
+    """A bytes regex equivalent to an ASCII str regex, or None if the pattern is not ASCII"""
+
+    if not pattern.pattern.isascii():
+        return None
+
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~(re.ASCII | re.UNICODE))
+
+class RewriteRule:
+    """One compiled regex rewrite and the files it applies to"""
+
+    def __init__(self, name, pattern, replacement, files, flags=(), description="", prefilter=(),
+                 site_files=None):
+        self.name = name
+        self.description = description
+        self.files = list(files)
+        self.site_files = [glob_regex(glob) for glob in (site_files or files)]
+        self.replacement = replacement
+        # Literal substrings one of which every match must contain; empty means always scan
+        self.needles = tuple(prefilter)
+
+        flag_value = re.ASCII
+        for flag in flags:
+            flag_value |= getattr(re, flag)
+        self.pattern = re.compile(pattern, flag_value)
+        self.byte_pattern = byte_pattern(self.pattern)
+        self.byte_replacement = replacement.encode("utf-8")
+        self.byte_needles = tuple(needle.encode("utf-8") for needle in self.needles)
+
+    def apply(self, content):
+        """Return (new_content, hit_count) for str, or bytes-like content such as an mmap"""
+
+        if isinstance(content, str):
+            return self.pattern.subn(self.replacement, content)
+
+        if self.byte_pattern is None:
+            text, count = self.pattern.subn(self.replacement, bytes(content).decode("utf-8"))
+            return text.encode("utf-8"), count
+
+        return self.byte_pattern.subn(self.byte_replacement, content)
+
+class PhoneMapRule:
+    """Mapping-table phone number replacement applied as one rule"""
+
+    def __init__(self, name, mapping, files, description="", site_files=None):
+        self.name = name
+        self.description = description
+        self.files = list(files)
+        self.site_files = [glob_regex(glob) for glob in (site_files or files)]
+        self.mapper = PhoneMapper(mapping)
+        # The last four digits appear contiguously in every supported formatting
+        self.needles = tuple(sorted({old[6:] for old in self.mapper.mapping}))
+        self.byte_pattern = self.mapper.byte_pattern
+        self.byte_needles = tuple(needle.encode("ascii") for needle in self.needles)
+
+    def apply(self, content):
+        """Return (new_content, hit_count) for str, or bytes-like content such as an mmap"""
+
+        return self.mapper.replace(content)
+
+def build_rule(rule):
+    """Create a compiled rule from its rewrite_rules.json entry"""
+
+    rule_type = rule.get("type", "regex")
+
+    if rule_type == "regex":
+        return RewriteRule(
+            rule["name"],
+            rule["pattern"],
+            rule["replacement"],
+            rule["files"],
+            flags=rule.get("flags", ()),
+            description=rule.get("description", ""),
+            prefilter=rule.get("prefilter", ()),
+            site_files=rule.get("site_files"),
+        )
+    if rule_type == "phone-map":
+        return PhoneMapRule(rule["name"], rule["map"], rule["files"], description=rule.get("description", ""),
+                            site_files=rule.get("site_files"))
+
+    raise ValueError(f"Rule {rule.get('name')}: unknown rule type '{rule_type}'")
+
+def load_rules(path=RULES_PATH, names=None):
+    """Load and compile rules, optionally keeping only the named ones"""
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    rules = [build_rule(rule) for rule in data["rules"]]
+
+    if names is not None:
+        unknown = set(names) - {rule.name for rule in rules}
+        if unknown:
+            raise ValueError(f"Unknown rewrite rule(s): {', '.join(sorted(unknown))}")
+        rules = [rule for rule in rules if rule.name in names]
+
+    return rules
+
+def load_site_config(path=RULES_PATH):
+    """The site-wide scan settings from the rules file"""
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return {**DEFAULT_SITE, **data.get("site", {})}
+
+def rules_for(rules, relative_path):
+    """The rules whose site globs match a root-relative POSIX path, in rule order"""
+
+    return [rule for rule in rules if any(glob.match(relative_path) for glob in rule.site_files)]
+
+def collect_site_files(rules, root=".", site=None):
+    """Walk the site roots once, mapping each file to the rules whose site globs match it"""
+
+    site = site or load_site_config()
+    excluded = set(site["exclude_dirs"])
+    root = Path(root)
+    files = {}
+
+    for site_root in site["roots"]:
+        for directory, subdirs, names in os.walk(root / site_root):
+            subdirs[:] = sorted(d for d in subdirs if d not in excluded and not d.startswith("."))
+            for name in sorted(names):
+                if not any(fnmatch.fnmatch(name, pattern) for pattern in site["include"]):
+                    continue
+                file_path = Path(directory) / name
+                applicable = rules_for(rules, file_path.relative_to(root).as_posix())
+                if applicable:
+                    files[file_path] = applicable
+
+    return files
+
+def collect_files(rules, root="."):
+    """Map each file matched by any rule to the rules that apply to it, in rule order"""
+
+    root = Path(root)
+    files = {}
+
+    for rule in rules:
+        for pattern in rule.files:
+            for file_path in sorted(root.glob(pattern)):
+                if file_path.is_file():
+                    applicable = files.setdefault(file_path, [])
+                    if rule not in applicable:
+                        applicable.append(rule)
+
+    return files
+
+def add_rewrite_arguments(parser):
+    """Add the shared rewrite options to a rewrite script's argument parser"""
+
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report which files would change without writing anything")
+    parser.add_argument("--diff", action="store_true", help="print a unified diff of every change")
+    parser.add_argument("--site", action="store_true",
+                        help="walk the site roots in rewrite_rules.json and apply each rule's site_files globs")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="threads to scan files with (default: all cores)")
+
+def rewrite_options(args):
+    """run_rewrites() keyword arguments from parsed add_rewrite_arguments() options"""
+
+    return {"dry_run": args.dry_run, "diff": args.diff, "site": args.site, "jobs": args.jobs}
+
+def may_match(rule, data):
+    """Cheap bytes-level check that a rule could match; never a false negative"""
+
+    if rule.byte_needles and not any(data.find(needle) != -1 for needle in rule.byte_needles):
+        return False
+
+    return rule.byte_pattern is None or rule.byte_pattern.search(data) is not None
+
+def apply_rules(data, rules, hits, seconds, applied=None):
+    """Run the rules over bytes-like data, returning the rewritten bytes or data itself if nothing fired
+
+    A rule whose matches are all already in their replaced form counts no
+    hits; its match count goes into applied instead, if given.
+    """
+
+    content = data
+    for rule in rules:
+        # Checked against the current content: an earlier rule may have introduced a match
+        if not may_match(rule, content):
+            continue
+        started = time.perf_counter()
+        new_content, count = rule.apply(content)
+        seconds[rule.name] = time.perf_counter() - started
+        if count and len(new_content) == len(content) and new_content == content[:]:
+            # Matched, but the replacement is what is already there
+            hits[rule.name] = 0
+            if applied is not None:
+                applied[rule.name] = count
+            continue
+        hits[rule.name] = count
+        if count:
+            content = new_content
+    return content
+
+def unified_diff(file_path, original, content):
+    """Unified diff between a file's current and rewritten content"""
+
+    return "".join(difflib.unified_diff(original.splitlines(keepends=True), content.splitlines(keepends=True),
+                                        fromfile=f"a/{file_path}", tofile=f"b/{file_path}"))
+
+def rewrite_file(file_path, rules, dry_run=False, diff=False):
+    """Apply all rules to one file with a single read and at most one write
+
+    Returns the file's result record: whether it changed, per-rule hit
+    counts, the size change and, with diff=True, a unified diff.
+    Nothing is written with dry_run=True.
+    """
+
+    result = {"path": str(file_path), "changed": False, "hits": {}, "applied": {}, "seconds": {},
+              "error": None, "bytes_delta": 0}
+
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be mapped, and nothing matches them anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            return result
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            content = apply_rules(data, rules, result["hits"], result["seconds"], result["applied"])
+            if content is data:
+                return result
+            # Only files that matched are ever copied out of the map
+            original = data[:]
+
+    changed = content != original
+    result["changed"] = changed
+
+    if changed:
+        result["bytes_delta"] = len(content) - len(original)
+        if diff:
+            result["diff"] = unified_diff(file_path, original.decode("utf-8"), content.decode("utf-8"))
+        if not dry_run:
+            atomic_write(file_path, content)
+
+    return result
+
+def run_rewrites(rules, root=".", dry_run=False, diff=False, site=False, jobs=1):
+    """Rewrite every file the rules match across a thread pool, returning per-file results in order"""
+
+    files = collect_site_files(rules, root) if site else collect_files(rules, root)
+
+    def process(item):
+        file_path, applicable = item
+        try:
+            return rewrite_file(file_path, applicable, dry_run, diff)
+        except Exception as e:
+            return {"path": str(file_path), "changed": False, "hits": {}, "applied": {}, "seconds": {},
+                    "error": f"{type(e).__name__}: {e}"}
+
+    if jobs <= 1 or len(files) <= 1:
+        return [process(item) for item in files.items()]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(process, files.items()))
+
+def print_rewrite_report(rules, results, dry_run=False):
+    """Print per-file status and per-rule hit counts"""
+
+    for result in results:
+        if result["error"]:
+            print(f"❌ Error processing {result['path']}: {result['error']}")
+        elif result["changed"]:
+            total = sum(result["hits"].values())
+            by_rule = ", ".join(f"{name}: {count}" for name, count in result["hits"].items() if count)
+            verb = "Would update" if dry_run else "Updated"
+            print(f"✅ {verb} {result['path']} ({total} replacement(s): {by_rule}; "
+                  f"{result['bytes_delta']:+,} bytes)")
+            if result.get("diff"):
+                print(result["diff"], end="" if result["diff"].endswith("\n") else "\n")
+        else:
+            print(f"ℹ️  No changes: {result['path']}")
+
+    print("=" * 60)
+    print("🎯 REWRITE SUMMARY")
+    for rule in rules:
+        hits = sum(result["hits"].get(rule.name, 0) for result in results)
+        files = sum(1 for result in results if result["hits"].get(rule.name))
+        applied = sum(1 for result in results if result.get("applied", {}).get(rule.name))
+        print(f"   {rule.name}: {hits} hit(s) in {files} file(s)"
+              + (f", already applied in {applied} file(s)" if applied else ""))
+
+    changed = sum(1 for result in results if result["changed"])
+    errors = sum(1 for result in results if result["error"])
+    if dry_run:
+        print(f"📄 Files scanned: {len(results)}, would update: {changed}, errors: {errors} (dry run, nothing written)")
+    else:
+        print(f"📄 Files scanned: {len(results)}, updated: {changed}, errors: {errors}")
+        print(f"💾 Writes avoided: {len(results) - changed - errors} unchanged file(s) left untouched")
+
+    return not errors
+
+def write_rule_profile(rules, results, path):
+    """Print per-rule scan time and write it, with the slowest files, as JSON"""
+
+    profile = {"rules": {}, "files": []}
+    print("\n⏱️  Rule timings")
+    for rule in rules:
+        seconds = sum(result["seconds"].get(rule.name, 0.0) for result in results)
+        files = sum(1 for result in results if rule.name in result["seconds"])
+        profile["rules"][rule.name] = {"seconds": round(seconds, 6), "files": files}
+        print(f"   {rule.name}: {seconds * 1000:.1f} ms over {files} file(s)")
+
+    for result in sorted(results, key=lambda r: sum(r["seconds"].values()), reverse=True):
+        profile["files"].append({"path": result["path"],
+                                 "seconds": {name: round(value, 6) for name, value in result["seconds"].items()}})
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, json.dumps(profile, indent=2))
+    print(f"💾 Rule profile: {path}")
+
+def main():
+    """Apply the configured rewrite rules"""
+
+    parser = argparse.ArgumentParser(description="Apply rule-driven rewrites to generated checklist files")
+    parser.add_argument("--rules", type=Path, default=RULES_PATH, help="rules file (default: rewrite_rules.json)")
+    parser.add_argument("--only", nargs="+", metavar="RULE", help="apply only the named rules")
+    parser.add_argument("--root", type=Path, default=Path("."), help="directory the rule globs are relative to")
+    parser.add_argument("--profile", nargs="?", type=Path, const=Path(".build-cache/rewrite-profile.json"),
+                        metavar="JSON", help="record per-rule and per-file scan times")
+    add_rewrite_arguments(parser)
+    args = parser.parse_args()
+
+    rules = load_rules(args.rules, args.only)
+
+    print(f"🔧 Applying {len(rules)} rewrite rule(s)")
+    print("=" * 60)
+
+    results = run_rewrites(rules, args.root, **rewrite_options(args))
+    ok = print_rewrite_report(rules, results, args.dry_run)
+
+    if args.profile:
+        write_rule_profile(rules, results, args.profile)
+
+    if not ok:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
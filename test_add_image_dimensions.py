@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for add_image_dimensions.py's width/height injection
+Run: python -m unittest test_add_image_dimensions
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+
+from add_image_dimensions import DimensionCache, add_dimensions, resolve_src
+
+def png_header(width, height):
+    """The signature and IHDR chunk of a PNG, all the size probe reads"""
+
+    ihdr = b"IHDR" + struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + ihdr + struct.pack(">I", zlib.crc32(ihdr))
+
+class AddDimensionsTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        (self.root / "logo.png").write_bytes(png_header(402, 160))
+        (self.root / "site.css").write_text(".nav .logo-img { height: 40px; width: auto; }\n"
+                                            ".hero img { height: 300px; }\n")
+        self.cache = DimensionCache(self.root / "cache.json")
+
+    def dimensions(self, body, head=""):
+        page = f"<html><head>{head}</head><body>{body}</body></html>".encode()
+        content, counts, _ = add_dimensions(page, self.root / "index.html", self.root, self.cache)
+        return content.decode(), counts
+
+    def test_sizes_plain_image(self):
+        content, counts = self.dimensions('<img src="logo.png" alt="">')
+        self.assertIn('<img src="logo.png" alt="" width="402" height="160">', content)
+        self.assertEqual(counts["sized"], 1)
+
+    def test_keeps_existing_size(self):
+        content, counts = self.dimensions('<img src="logo.png" width="201">')
+        self.assertIn('<img src="logo.png" width="201">', content)
+        self.assertEqual(counts["already_sized"], 1)
+
+    def test_skips_inline_height_only(self):
+        content, counts = self.dimensions('<img src="logo.png" style="height: 60px; margin-bottom: 20px;">')
+        self.assertNotIn("width=", content)
+        self.assertEqual(counts["one_way"], 1)
+
+    def test_sizes_inline_height_with_auto_width(self):
+        content, counts = self.dimensions('<img src="logo.png" style="height: 60px; width: auto">')
+        self.assertIn('width="402" height="160"', content)
+        self.assertEqual(counts["sized"], 1)
+
+    def test_skips_stylesheet_rule_with_one_dimension(self):
+        content, counts = self.dimensions('<div class="hero"><img src="logo.png"></div>',
+                                          '<link rel="stylesheet" href="site.css">')
+        self.assertNotIn("width=", content)
+        self.assertEqual(counts["one_way"], 1)
+
+    def test_skips_max_width_only(self):
+        content, counts = self.dimensions('<img src="logo.png" class="fluid">',
+                                          "<style>.fluid { max-width: 100%; }</style>")
+        self.assertNotIn("width=", content)
+        self.assertEqual(counts["one_way"], 1)
+
+    def test_sizes_image_with_both_dimensions_styled(self):
+        content, counts = self.dimensions('<img src="logo.png" class="fluid">',
+                                          "<style>.fluid { max-width: 100%; height: auto; }</style>")
+        self.assertIn('width="402" height="160"', content)
+        self.assertEqual(counts["sized"], 1)
+
+    def test_descendant_rule_does_not_vouch_for_width(self):
+        # .nav .logo-img may not apply, so its width: auto cannot rescue an inline height
+        content, counts = self.dimensions('<img src="logo.png" class="logo-img" style="height: 40px">',
+                                          '<link rel="stylesheet" href="site.css">')
+        self.assertNotIn("width=", content)
+        self.assertEqual(counts["one_way"], 1)
+
+class ResolveSrcTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory.name)
+        (Path("public") / "images").mkdir(parents=True)
+        (Path("public") / "images" / "logo.png").write_bytes(png_header(402, 160))
+
+    def test_root_relative_forms(self):
+        for src in (b"/images/logo.png", b"/public/images/logo.png"):
+            self.assertEqual(resolve_src(src, Path("public/about/index.html"), Path("public")),
+                             Path("public/images/logo.png"))
+
+    def test_missing_root_relative_image_is_reported_once_under_the_root(self):
+        page = b'<img src="/public/images/gone.png"><img src="/images/lost.png">'
+        _, counts, missing = add_dimensions(page, Path("public/index.html"), Path("public"),
+                                            DimensionCache("cache.json"))
+        self.assertEqual(missing, [str(Path("public/images/gone.png")), str(Path("public/images/lost.png"))])
+        self.assertEqual(counts["unresolved"], 2)
+
+    def test_remote_and_templated_sources_are_skipped(self):
+        for src in (b"https://example.com/a.png", b"//cdn/a.png", b"data:image/png;base64,AA", b"${logo}"):
+            self.assertIsNone(resolve_src(src, Path("public/index.html"), Path("public")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for checklist_service.py's request parsing
+Run: python -m unittest test_checklist_service
+"""
+
+import asyncio
+import unittest
+
+from checklist_service import (
+    MAX_HEADERS, ChecklistService, HttpError, lead_from_query, percentile, read_headers
+)
+
+def stream(data, limit=2 ** 16):
+    """A StreamReader holding data followed by EOF"""
+
+    reader = asyncio.StreamReader(limit=limit)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+class ReadHeadersTest(unittest.TestCase):
+    def read(self, data, **kwargs):
+        async def read():
+            return await read_headers(stream(data, **kwargs))
+        return asyncio.run(read())
+
+    def test_reads_up_to_blank_line(self):
+        headers = self.read(b"Host: example\r\nConnection:  close \r\n\r\nGET / HTTP/1.1\r\n")
+        self.assertEqual(headers, {"host": "example", "connection": "close"})
+
+    def test_too_many_headers(self):
+        data = b"".join(b"X-%d: a\r\n" % i for i in range(MAX_HEADERS + 1)) + b"\r\n"
+        with self.assertRaisesRegex(HttpError, "Too many headers"):
+            self.read(data)
+
+    def test_header_line_too_long(self):
+        with self.assertRaises(HttpError) as caught:
+            self.read(b"X-Long: " + b"a" * 200 + b"\r\n\r\n", limit=64)
+        self.assertEqual(caught.exception.status, 400)
+
+class ConnectionTest(unittest.TestCase):
+    def exchange(self, request):
+        """Everything the service sends back for request before closing the connection"""
+
+        async def exchange():
+            service = ChecklistService()
+            server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(request)
+                await writer.drain()
+                response = await asyncio.wait_for(reader.read(), 10)
+                writer.close()
+                return response
+        return asyncio.run(exchange())
+
+    def test_too_many_headers_answers_once_and_closes(self):
+        # The excess header lines must not be read as a pipelined request
+        headers = b"".join(b"GET /stats HTTP/1.1\r\n" for _ in range(MAX_HEADERS + 5))
+        response = self.exchange(b"GET /stats HTTP/1.1\r\n" + headers + b"\r\n")
+        self.assertTrue(response.startswith(b"HTTP/1.1 400 Bad Request\r\n"))
+        self.assertEqual(response.count(b"HTTP/1.1 "), 1)
+
+    def test_pipelined_requests(self):
+        response = self.exchange(b"GET /stats HTTP/1.1\r\n\r\nGET /nowhere HTTP/1.1\r\nConnection: close\r\n\r\n")
+        self.assertEqual(response.count(b"HTTP/1.1 200 OK"), 1)
+        self.assertEqual(response.count(b"HTTP/1.1 404 Not Found"), 1)
+
+    def test_unsupported_method(self):
+        response = self.exchange(b"POST /stats HTTP/1.1\r\n\r\n")
+        self.assertTrue(response.startswith(b"HTTP/1.1 405 "))
+
+class HelpersTest(unittest.TestCase):
+    def test_percentile_nearest_rank(self):
+        ordered = list(range(1, 11))
+        self.assertEqual(percentile(ordered, 0.5), 5)
+        self.assertEqual(percentile(ordered, 0.9), 9)
+        self.assertEqual(percentile(ordered, 0.99), 10)
+        self.assertEqual(percentile([7], 0.5), 7)
+        # 0.5 * 5 = 2.5 rounds up to rank 3, not half-to-even down to 2
+        self.assertEqual(percentile([1, 2, 3, 4, 5], 0.5), 3)
+
+    def test_lead_from_query(self):
+        self.assertIsNone(lead_from_query({}))
+        self.assertEqual(lead_from_query({"name": [" Ann "], "city": ["Reston"]}), {"name": "Ann", "city": "Reston"})
+        with self.assertRaises(HttpError):
+            lead_from_query({"city": ["Reston"]})
+        with self.assertRaises(HttpError):
+            lead_from_query({"name": ["x" * 101]})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for html_minify.py
+Run: python -m unittest test_html_minify
+"""
+
+import unittest
+
+from html_minify import iter_minified, minify_css, minify_html
+
+DOCUMENT = """<!DOCTYPE html>
+<html>
+<head>
+    <!-- build comment -->
+    <style>
+        body { margin: 0 ; color: red; }
+        a > b , i { content: "a  ;  b"; }
+    </style>
+</head>
+<body>
+    <div class="x"  id='y' >
+        <p>Call   <strong>now</strong> ,  please</p>
+        <pre>  keep
+   this  </pre>
+        <p>1 < 2 and 3 > 2</p>
+    </div>
+</body>
+</html>
+"""
+
+class MinifyHtmlTest(unittest.TestCase):
+    def test_document(self):
+        self.assertEqual(
+            minify_html(DOCUMENT),
+            '<!DOCTYPE html><html><head><style>body{margin:0;color:red}a>b,i{content:"a  ;  b"}</style></head>'
+            '<body><div class="x" id=\'y\'><p>Call <strong>now</strong> , please</p><pre>  keep\n   this  </pre>'
+            '<p>1 < 2 and 3 > 2</p></div></body></html>'
+        )
+
+    def test_less_than_in_text_is_not_a_tag(self):
+        self.assertEqual(minify_html("<p>1 < 2 and 3 > 2</p>"), "<p>1 < 2 and 3 > 2</p>")
+        self.assertEqual(minify_html("<td>a <  b</td>"), "<td>a < b</td>")
+
+    def test_conditional_comments_are_kept(self):
+        self.assertEqual(minify_html("<p>a</p><!--[if IE]>x<![endif]--><!-- gone -->"),
+                         "<p>a</p><!--[if IE]>x<![endif]-->")
+
+    def test_chunked_output_matches_whole(self):
+        for size in (1, 2, 7, 64):
+            chunks = [DOCUMENT[start:start + size] for start in range(0, len(DOCUMENT), size)]
+            self.assertEqual("".join(iter_minified(chunks)), minify_html(DOCUMENT), f"chunk size {size}")
+
+class MinifyCssTest(unittest.TestCase):
+    def test_minify_css(self):
+        self.assertEqual(minify_css("/* c */ a , b { color: red ; }\n\n.x  .y { margin: 0 auto; }"),
+                         "a,b{color:red}.x .y{margin:0 auto}")
+
+if __name__ == "__main__":
+    unittest.main()
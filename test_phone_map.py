@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for phone_map.py
+Run: python -m unittest test_phone_map
+"""
+
+import unittest
+
+from phone_map import PhoneMapper, normalize_number
+
+MAPPING = {"(301) 215-3191": "240-555-0100", "703.555.0199": "571-555-0123"}
+
+class NormalizeNumberTest(unittest.TestCase):
+    def test_formats(self):
+        for number in ("(301) 215-3191", "301-215-3191", "301.215.3191", "+1 301 215 3191", "tel:+13012153191"):
+            self.assertEqual(normalize_number(number), "3012153191")
+
+    def test_rejects_other_lengths(self):
+        for number in ("215-3191", "2-301-215-3191", "301215319100"):
+            with self.assertRaises(ValueError):
+                normalize_number(number)
+
+class PhoneMapperTest(unittest.TestCase):
+    def setUp(self):
+        self.mapper = PhoneMapper(MAPPING)
+
+    def test_keeps_each_numbers_formatting(self):
+        text = ("Call (301) 215-3191, 301-215-3191, 301.215.3191, 3012153191 or "
+                '<a href="tel:+13012153191">+1 301 215 3191</a>; VA 703.555.0199')
+        new, count = self.mapper.replace(text)
+        self.assertEqual(new, "Call (240) 555-0100, 240-555-0100, 240.555.0100, 2405550100 or "
+                              '<a href="tel:+12405550100">+1 240 555 0100</a>; VA 571.555.0123')
+        self.assertEqual(count, 7)
+
+    def test_leaves_unmapped_and_embedded_numbers(self):
+        text = "301-215-3190 and 13012153191999 and order #93012153191"
+        self.assertEqual(self.mapper.replace(text), (text, 0))
+
+    def test_unbalanced_parenthesis_is_left_in_place(self):
+        self.assertEqual(self.mapper.replace("(301 215-3191"), ("(240 555-0100", 1))
+
+    def test_bytes_and_str_agree(self):
+        text = "Call (301) 215-3191 or 703.555.0199 — today"
+        new, count = self.mapper.replace(text)
+        new_bytes, count_bytes = self.mapper.replace(bytearray(text.encode("utf-8")))
+        self.assertEqual((bytes(new_bytes).decode("utf-8"), count_bytes), (new, count))
+
+if __name__ == "__main__":
+    unittest.main()
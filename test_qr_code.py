@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for qr_code.py against known ISO/IEC 18004 vectors
+Run: python -m unittest test_qr_code
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import qr_code
+from qr_code import QrCode
+
+# Format information strings (level, mask) -> 15 bits, most significant first
+FORMAT_BITS = {
+    ("L", 0): "111011111000100",
+    ("L", 4): "110011000101111",
+    ("M", 0): "101010000010010",
+    ("M", 5): "100000011001110",
+    ("Q", 0): "011010101011111",
+    ("H", 0): "001011010001001",
+}
+
+# Version information strings -> 18 bits, most significant first
+VERSION_BITS = {7: "000111110010010100", 8: "001000010110111100"}
+
+# Alignment pattern centre coordinates
+ALIGNMENT_POSITIONS = {
+    1: [], 2: [6, 18], 7: [6, 22, 38], 14: [6, 26, 46, 66], 32: [6, 34, 60, 86, 112, 138],
+    40: [6, 30, 58, 86, 114, 142, 170],
+}
+
+# Largest byte-mode payload per (level, version)
+BYTE_CAPACITY = {("M", 1): 14, ("M", 2): 26, ("M", 4): 62, ("M", 10): 213, ("L", 40): 2953, ("H", 40): 1273}
+
+def read_format_bits(code):
+    """The format information around the top-left finder, most significant bit first"""
+
+    positions = ([(8, i) for i in range(6)] + [(8, 7), (8, 8), (7, 8)]
+                 + [(14 - i, 8) for i in range(9, 15)])
+    return format(sum(code.modules[y][x] << i for i, (x, y) in enumerate(positions)), "015b")
+
+def decode(code):
+    """Unmask a symbol, read its codewords back, check every block's ECC and return the payload"""
+
+    # Rebuild the function pattern map the encoder skipped
+    probe = QrCode.__new__(QrCode)
+    probe.version, probe.level, probe.size = code.version, code.level, code.size
+    probe.modules = [[False] * code.size for _ in range(code.size)]
+    probe._function = [[False] * code.size for _ in range(code.size)]
+    probe._draw_function_patterns()
+    function = probe._function
+
+    bits = []
+    right = code.size - 1
+    while right >= 1:
+        if right == 6:
+            right = 5
+        upward = ((right + 1) & 2) == 0
+        for vertical in range(code.size):
+            y = code.size - 1 - vertical if upward else vertical
+            for x in (right, right - 1):
+                if not function[y][x]:
+                    bits.append(code.modules[y][x] ^ qr_code._MASKS[code.mask](x, y))
+        right -= 2
+    raw = [int("".join(str(int(bit)) for bit in bits[i:i + 8]), 2) for i in range(0, len(bits) // 8 * 8, 8)]
+
+    block_count = qr_code._BLOCKS[code.level][code.version]
+    ecc_length = qr_code._ECC_PER_BLOCK[code.level][code.version]
+    total = qr_code._raw_modules(code.version) // 8
+    short_blocks = block_count - total % block_count
+    data_lengths = [total // block_count - ecc_length + (0 if i < short_blocks else 1) for i in range(block_count)]
+
+    # Data codewords are interleaved column by column, the long blocks' extra one last
+    data_blocks = [[] for _ in range(block_count)]
+    position = 0
+    for column in range(max(data_lengths)):
+        for block, length in zip(data_blocks, data_lengths):
+            if column < length:
+                block.append(raw[position])
+                position += 1
+    ecc_blocks = [[] for _ in range(block_count)]
+    for _ in range(ecc_length):
+        for block in ecc_blocks:
+            block.append(raw[position])
+            position += 1
+
+    divisor = qr_code._rs_divisor(ecc_length)
+    for data, ecc in zip(data_blocks, ecc_blocks):
+        if qr_code._rs_remainder(data, divisor) != ecc:
+            raise AssertionError("error correction codewords do not match the data")
+
+    stream = "".join(format(byte, "08b") for block in data_blocks for byte in block)
+    if stream[:4] != "0100":
+        raise AssertionError(f"not byte mode: {stream[:4]}")
+    count_bits = 8 if code.version <= 9 else 16
+    length = int(stream[4:4 + count_bits], 2)
+    start = 4 + count_bits
+    return bytes(int(stream[start + 8 * i:start + 8 * i + 8], 2) for i in range(length))
+
+class ReedSolomonTest(unittest.TestCase):
+    def test_known_remainder(self):
+        # The widely published "HELLO WORLD" 1-M example: its 16 data codewords and 10 ECC codewords
+        data = [32, 91, 11, 120, 209, 114, 220, 77, 67, 64, 236, 17, 236, 17, 236, 17]
+        self.assertEqual(qr_code._rs_remainder(data, qr_code._rs_divisor(10)),
+                         [196, 35, 39, 119, 235, 215, 231, 226, 93, 23])
+
+class SymbolTest(unittest.TestCase):
+    def test_format_bits(self):
+        for (level, mask), expected in FORMAT_BITS.items():
+            code = QrCode("https://example.com", level, mask=mask)
+            self.assertEqual(read_format_bits(code), expected, f"{level} mask {mask}")
+
+    def test_version_bits(self):
+        for version, expected in VERSION_BITS.items():
+            # The largest payload that still fits the version at level M
+            code = QrCode("x" * (qr_code._data_capacity(version, "M") - 3), "M")
+            self.assertEqual(code.version, version)
+            bits = sum(code.modules[i // 3][code.size - 11 + i % 3] << i for i in range(18))
+            self.assertEqual(format(bits, "018b"), expected)
+
+    def test_alignment_positions(self):
+        for version, expected in ALIGNMENT_POSITIONS.items():
+            self.assertEqual(qr_code._alignment_positions(version), expected, f"version {version}")
+
+    def test_smallest_version_that_fits(self):
+        for (level, version), capacity in BYTE_CAPACITY.items():
+            self.assertEqual(QrCode(b"a" * capacity, level).version, version)
+            if version < 40:
+                self.assertEqual(QrCode(b"a" * (capacity + 1), level).version, version + 1)
+        with self.assertRaises(ValueError):
+            QrCode(b"a" * 2954, "L")
+
+    def test_finder_and_timing_patterns(self):
+        code = QrCode("https://example.com/checklists/fire.html")
+        finder = ["1111111", "1000001", "1011101", "1011101", "1011101", "1000001", "1111111"]
+        for x0, y0 in ((0, 0), (code.size - 7, 0), (0, code.size - 7)):
+            rows = ["".join(str(int(code.modules[y0 + y][x0 + x])) for x in range(7)) for y in range(7)]
+            self.assertEqual(rows, finder)
+        timing = [code.modules[6][x] for x in range(8, code.size - 8)]
+        self.assertEqual(timing, [x % 2 == 0 for x in range(8, code.size - 8)])
+        # The dark module
+        self.assertTrue(code.modules[code.size - 8][8])
+
+    def test_round_trip(self):
+        payloads = ["https://prismspecialtiesdmv.com/checklists/fire-damage-first-48-hours.html?region=maryland",
+                    "é ünïcode ✓", "x" * 300, ""]
+        for payload in payloads:
+            for level in "LMQH":
+                code = QrCode(payload, level)
+                self.assertEqual(decode(code), payload.encode("utf-8"), f"{level}: {payload[:20]}")
+
+    def test_every_mask_round_trips(self):
+        for mask in range(8):
+            self.assertEqual(decode(QrCode("mask test", "Q", mask=mask)), b"mask test")
+
+class SvgCacheTest(unittest.TestCase):
+    def test_svg_is_cached_on_disk(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            url = "https://example.com/cache-test"
+            qr_code._svgs.pop((url, "M"), None)
+            self.addCleanup(qr_code._svgs.pop, (url, "M"), None)
+            svg = qr_code.qr_svg(url, cache_dir=cache_dir)
+            self.assertTrue(svg.startswith('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 '))
+            self.assertIn('aria-label="QR code for https://example.com/cache-test"', svg)
+            self.assertEqual(qr_code.cache_path(url, cache_dir=cache_dir).read_text(encoding="utf-8"), svg)
+            self.assertEqual(Path(cache_dir), qr_code.cache_path(url, cache_dir=cache_dir).parent)
+
+if __name__ == "__main__":
+    unittest.main()
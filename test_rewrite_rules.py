@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for rewrite_rules.py
+Run: python -m unittest test_rewrite_rules
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from rewrite_rules import (
+    PhoneMapRule, RewriteRule, apply_rules, build_rule, glob_regex, load_rules, rewrite_file, rules_for,
+    run_rewrites
+)
+
+def logo_rule():
+    return RewriteRule("logo", r'<div class="logo-placeholder">[^<]*</div>', '<img class="logo-image">',
+                       ["pages/*.html"], prefilter=["logo-placeholder"])
+
+def phone_rule():
+    return PhoneMapRule("phone", {"301-215-3191": "240-555-0100"}, ["pages/**/*.html"])
+
+class GlobRegexTest(unittest.TestCase):
+    def test_globs(self):
+        self.assertTrue(glob_regex("public/*.html").match("public/index.html"))
+        self.assertFalse(glob_regex("public/*.html").match("public/blog/index.html"))
+        self.assertTrue(glob_regex("public/**/*.html").match("public/index.html"))
+        self.assertTrue(glob_regex("public/**/*.html").match("public/blog/a/b.html"))
+        self.assertFalse(glob_regex("public/*.html").match("public/index.html.bak"))
+        self.assertTrue(glob_regex("img?.png").match("img1.png"))
+
+    def test_rules_for(self):
+        rules = [logo_rule(), phone_rule()]
+        self.assertEqual([rule.name for rule in rules_for(rules, "pages/a.html")], ["logo", "phone"])
+        self.assertEqual([rule.name for rule in rules_for(rules, "pages/x/a.html")], ["phone"])
+        self.assertEqual(rules_for(rules, "other/a.html"), [])
+
+class ApplyRulesTest(unittest.TestCase):
+    def test_str_and_bytes_agree(self):
+        rule = logo_rule()
+        text = '<div class="logo-placeholder">PRISM</div> é'
+        self.assertEqual(rule.apply(text), ('<img class="logo-image"> é', 1))
+        new, count = rule.apply(text.encode("utf-8"))
+        self.assertEqual((bytes(new).decode("utf-8"), count), rule.apply(text))
+
+    def test_hits_and_untouched_data(self):
+        rules = [logo_rule(), phone_rule()]
+        data = b'<div class="logo-placeholder">P</div> call 301-215-3191'
+        hits, seconds = {}, {}
+        self.assertEqual(apply_rules(data, rules, hits, seconds),
+                         b'<img class="logo-image"> call 240-555-0100')
+        self.assertEqual(hits, {"logo": 1, "phone": 1})
+
+        hits = {}
+        untouched = b"nothing to see"
+        self.assertIs(apply_rules(untouched, rules, hits, {}), untouched)
+        self.assertEqual(hits, {})
+
+    def test_replacement_already_in_place_is_not_a_hit(self):
+        rule = RewriteRule("alt", r'<img class="logo-image"[^>]*>', '<img class="logo-image">', ["*.html"])
+        data = b'<img class="logo-image"> and <img class="logo-image">'
+        hits, applied = {}, {}
+        self.assertIs(apply_rules(data, [rule], hits, {}, applied), data)
+        self.assertEqual((hits, applied), ({"alt": 0}, {"alt": 2}))
+
+    def test_build_rule_rejects_unknown_types(self):
+        with self.assertRaises(ValueError):
+            build_rule({"name": "x", "type": "xslt", "files": []})
+
+    def test_shipped_rules_compile(self):
+        rules = load_rules()
+        self.assertTrue(rules)
+        with self.assertRaises(ValueError):
+            load_rules(names=["no-such-rule"])
+
+class RewriteFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        (self.root / "pages").mkdir()
+        self.page = self.root / "pages" / "a.html"
+        self.page.write_text('<div class="logo-placeholder">P</div>\nCall 301-215-3191\n', encoding="utf-8")
+        (self.root / "pages" / "empty.html").write_bytes(b"")
+
+    def test_dry_run_and_diff_leave_the_file(self):
+        before = self.page.read_bytes()
+        result = rewrite_file(self.page, [logo_rule(), phone_rule()], dry_run=True, diff=True)
+        self.assertTrue(result["changed"])
+        self.assertIn("+Call 240-555-0100", result["diff"])
+        self.assertEqual(self.page.read_bytes(), before)
+
+    def test_rewrite_then_rerun_is_a_no_op(self):
+        rules = [logo_rule(), phone_rule()]
+        results = run_rewrites(rules, root=self.root)
+        self.assertEqual([(Path(r["path"]).name, r["changed"]) for r in results], [("a.html", True),
+                                                                                  ("empty.html", False)])
+        self.assertEqual(self.page.read_text(encoding="utf-8"), '<img class="logo-image">\nCall 240-555-0100\n')
+        self.assertFalse(any(result["changed"] for result in run_rewrites(rules, root=self.root)))
+
+if __name__ == "__main__":
+    unittest.main()